@@ -1,72 +1,122 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context, g
 from flask_cors import CORS
 import pickle
-import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from PIL import Image
 import io
+import hmac
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.utils import secure_filename
+from config import get_config
+from micro_batcher import MicroBatcher
+from linear_scorer import LinearScorer
+import model_artifacts
+from compact_vocabulary import compact_vectorizer
+import feature_hashing
+from prediction_cache import PredictionCache, artifact_version, cache_key
+from verdict_store import SQLiteVerdictStore
+from near_duplicate import NearDuplicateIndex
+from ocr_jobs import OCRJobQueue, QueueFullError
+from ocr_engine import create_ocr_engine, engine_available, TesseractNotFoundError, PYTESSERACT_AVAILABLE
+import image_preprocess
+import ocr_tiling
+import text_detect
+from image_ingest import ImageIngest, ImageTooLargeError
+from phash_cache import PerceptualHashCache
+from perf_stats import RollingStats
+from readiness import Readiness
+from model_registry import ModelBundle, ModelRegistry
+from shadow_scoring import ShadowScorer
+import metrics
 
-# Try to import OCR libraries (optional)
-try:
+app = Flask(__name__)
+CORS(app)  # Enable CORS for frontend-backend communication
+
+# Deployment settings (see config.py)
+settings = get_config()
+metrics.enabled = settings.METRICS_ENABLED
+
+# Load and warm-up status of every component (see startup() at the end of this module)
+readiness = Readiness()
+
+def configure_tesseract_path():
+    """Point pytesseract at a Tesseract install in a common Windows location"""
+    import platform
+    if platform.system() != 'Windows' or not PYTESSERACT_AVAILABLE:
+        return
     import pytesseract
-    OCR_AVAILABLE = True
     
-    # Configure Tesseract path for Windows
-    import platform
-    if platform.system() == 'Windows':
-        # Common Tesseract installation paths on Windows
-        possible_paths = [
-            r'C:\Users\Dell\tesseract.exe',
-            r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-            r'C:\Users\Dell\Tesseract-OCR\tesseract.exe'.format(os.getenv('USERNAME', '')),
-        ]
-        
-        # Try to find Tesseract executable
-        tesseract_found = False
-        for path in possible_paths:
-            if os.path.exists(path):
-                pytesseract.pytesseract.tesseract_cmd = path
+    # Common Tesseract installation paths on Windows
+    possible_paths = [
+        r'C:\Users\Dell\tesseract.exe',
+        r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
+        r'C:\Users\Dell\Tesseract-OCR\tesseract.exe'.format(os.getenv('USERNAME', '')),
+    ]
+    
+    # Try to find Tesseract executable
+    tesseract_found = False
+    for path in possible_paths:
+        if os.path.exists(path):
+            pytesseract.pytesseract.tesseract_cmd = path
+            tesseract_found = True
+            print(f"✓ Tesseract found at: {path}")
+            break
+    
+    # If not found in common paths, try to use it from PATH
+    if not tesseract_found:
+        try:
+            # Test if tesseract is in PATH
+            import subprocess
+            result = subprocess.run(['tesseract', '--version'], 
+                                  capture_output=True, 
+                                  timeout=2)
+            if result.returncode == 0:
+                print("✓ Tesseract found in system PATH")
                 tesseract_found = True
-                print(f"✓ Tesseract found at: {path}")
-                break
-        
-        # If not found in common paths, try to use it from PATH
-        if not tesseract_found:
-            try:
-                # Test if tesseract is in PATH
-                import subprocess
-                result = subprocess.run(['tesseract', '--version'], 
-                                      capture_output=True, 
-                                      timeout=2)
-                if result.returncode == 0:
-                    print("✓ Tesseract found in system PATH")
-                    tesseract_found = True
-            except:
-                pass
-        
-        # If still not found, print warning
-        if not tesseract_found:
-            print("⚠️ Warning: Tesseract executable not found automatically.")
-            print("   Please set the path manually by adding this to app.py:")
-            print("   pytesseract.pytesseract.tesseract_cmd = r'C:\\Path\\To\\Tesseract-OCR\\tesseract.exe'")
-            print("   Or add Tesseract to your system PATH environment variable.")
-    
-except ImportError:
-    OCR_AVAILABLE = False
+        except:
+            pass
+    
+    # If still not found, print warning
+    if not tesseract_found:
+        print("⚠️ Warning: Tesseract executable not found automatically.")
+        print("   Please set the path manually by adding this to app.py:")
+        print("   pytesseract.pytesseract.tesseract_cmd = r'C:\\Path\\To\\Tesseract-OCR\\tesseract.exe'")
+        print("   Or add Tesseract to your system PATH environment variable.")
+
+# OCR engine (pooled in-process Tesseract when tesserocr is installed, else pytesseract).
+# With LAZY_STARTUP it is created by the first request that needs it.
+ocr_engine = None
+ocr_engine_lock = threading.Lock()
+OCR_AVAILABLE = engine_available(settings.OCR_ENGINE)
+if not OCR_AVAILABLE:
     print("Warning: pytesseract not available. Image analysis will be limited.")
 
-try:
-    import cv2
-    import numpy as np
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
-    print("Warning: opencv-python not available. Some image processing features may be limited.")
+def get_ocr_engine():
+    """The OCR engine, created on first use; None if OCR is unavailable"""
+    global ocr_engine, OCR_AVAILABLE
+    if ocr_engine is None and OCR_AVAILABLE:
+        with ocr_engine_lock:
+            if ocr_engine is None and OCR_AVAILABLE:
+                configure_tesseract_path()
+                engine = create_ocr_engine(settings.OCR_ENGINE, pool_size=settings.OCR_POOL_SIZE, lang=settings.OCR_LANG)
+                OCR_AVAILABLE = engine is not None
+                if engine is not None:
+                    print(f"✓ OCR engine: {engine.name}")
+                ocr_engine = engine
+    return ocr_engine
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend-backend communication
+def load_ocr_engine():
+    """Create the OCR engine ahead of the first image (startup step); returns why it was skipped"""
+    if not OCR_AVAILABLE:
+        return "no OCR engine installed"
+    return get_ocr_engine() is not None
+
+# Threads that OCR the strips of very tall images in parallel. The overlaps are read twice, so
+# tiling is slower than one pass unless strips really run side by side (more than one core)
+TILE_WORKERS = max(1, min(settings.OCR_POOL_SIZE, os.cpu_count() or 1))
+tile_executor = ThreadPoolExecutor(max_workers=TILE_WORKERS, thread_name_prefix="ocr-tile")
 
 # Image upload configuration
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'webp'}
@@ -76,23 +126,36 @@ def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def extract_text_from_image(image_file):
-    """Extract text from image using OCR"""
-    if not OCR_AVAILABLE:
+def extract_text_from_image(ingest, preprocess_stages=(), timings=None, crop=None):
+    """Extract text from image using OCR (limited to the crop box, if given)"""
+    ocr_engine = get_ocr_engine()
+    if ocr_engine is None:
         raise Exception("OCR not available. Please install pytesseract and Tesseract OCR.")
     
     try:
-        # Read image from file
-        image = Image.open(io.BytesIO(image_file.read()))
+        # Decoded RGB image, shared with every other consumer of this upload
+        image = ingest.rgb_image()
+        if crop is not None:
+            image = image.crop(crop)
         
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        # Optional OpenCV preprocessing (grayscale, downscale, threshold, deskew)
+        if preprocess_stages:
+            image, stage_timings = image_preprocess.preprocess_image(
+                image, preprocess_stages, target_width=settings.OCR_PREPROCESS_TARGET_WIDTH)
+            if timings is not None:
+                timings["preprocess"] = stage_timings
         
-        # Use pytesseract to extract text
-        extracted_text = pytesseract.image_to_string(image)
+        # Use the OCR engine to extract text (tall screenshots strip by strip, in parallel)
+        if settings.OCR_TILING_ENABLED and TILE_WORKERS > 1 and image.height > settings.OCR_TILE_MIN_HEIGHT:
+            extracted_text, tiling = ocr_tiling.ocr_tiled(
+                image, ocr_engine.image_to_string, tile_executor,
+                strip_height=settings.OCR_TILE_HEIGHT, overlap=settings.OCR_TILE_OVERLAP)
+            if timings is not None:
+                timings["tiling"] = tiling
+        else:
+            extracted_text = ocr_engine.image_to_string(image)
         return extracted_text.strip()
-    except pytesseract.TesseractNotFoundError:
+    except TesseractNotFoundError:
         error_msg = (
             "Tesseract OCR not found. Please:\n"
             "1. Install Tesseract OCR from https://github.com/UB-Mannheim/tesseract/wiki\n"
@@ -106,66 +169,305 @@ def extract_text_from_image(image_file):
         print(f"OCR Error: {error_msg}")
         raise Exception(error_msg)
 
-def analyze_image_metadata(image_file):
-    """Analyze basic image metadata"""
+def analyze_image_metadata(ingest):
+    """Analyze basic image metadata (header only, no pixel decode)"""
     try:
-        image_file.seek(0)  # Reset file pointer
-        image = Image.open(io.BytesIO(image_file.read()))
-        
-        metadata = {
-            "format": image.format,
-            "size": image.size,  # (width, height)
-            "mode": image.mode,
-            "has_exif": hasattr(image, '_getexif') and image._getexif() is not None
-        }
-        
-        # Get file size
-        image_file.seek(0, os.SEEK_END)
-        file_size = image_file.tell()
-        image_file.seek(0)
-        metadata["file_size_kb"] = round(file_size / 1024, 2)
-        
-        return metadata
+        return ingest.metadata()
     except Exception as e:
         print(f"Image analysis error: {e}")
         return None
 
-# Load the trained model
-try:
-    with open('finalized_model.pkl', 'rb') as f:
-        model = pickle.load(f)
-    print("Model loaded successfully!")
-except Exception as e:
-    print(f"Error loading model: {e}")
-    model = None
+# The serving model, vectorizer and scorer, swapped as one versioned bundle on reload
+registry = ModelRegistry()
 
-# Load the fitted vectorizer
-vectorizer = None
+def load_model():
+    """Load the trained model; None on failure"""
+    try:
+        with open(settings.MODEL_PATH, 'rb') as f:
+            model = pickle.load(f)
+        print("Model loaded successfully!")
+        return model
+    except Exception as e:
+        print(f"Error loading model: {e}")
+        return None
+
+def load_mapped_artifacts():
+    """Load model and vectorizer from memory-mapped artifacts shared by all workers on the host"""
+    try:
+        model, vectorizer = model_artifacts.load_artifacts(
+            settings.MODEL_ARTIFACTS_DIR, hot_size=settings.COMPACT_VOCABULARY_HOT_TERMS)
+        print(f"Model and vectorizer mapped from {settings.MODEL_ARTIFACTS_DIR}!")
+        return model, vectorizer
+    except Exception as e:
+        print(f"Error loading memory-mapped artifacts: {e}")
+        return None, None
 
 def load_vectorizer():
-    """Load the pre-fitted TF-IDF vectorizer"""
-    global vectorizer
+    """Load the pre-fitted TF-IDF vectorizer; None on failure"""
     try:
-        with open('tfidf_vectorizer.pkl', 'rb') as f:
+        with open(settings.VECTORIZER_PATH, 'rb') as f:
             vectorizer = pickle.load(f)
         print("Vectorizer loaded successfully!")
     except FileNotFoundError:
-        print("Warning: tfidf_vectorizer.pkl not found. Attempting to initialize from data...")
+        if settings.FEATURE_PIPELINE != 'tfidf':
+            print(f"Error loading vectorizer: {settings.VECTORIZER_PATH} not found")
+            return None
+        if settings.LAZY_STARTUP:
+            # Never train while the server starts; the vectorizer has to come from regenerate_model.py
+            print(f"Error loading vectorizer: {settings.VECTORIZER_PATH} not found. "
+                  "Run 'Machine learning/regenerate_model.py' and copy it here "
+                  "(or set LAZY_STARTUP=false to refit it from the training data at startup).")
+            return None
+        print(f"Warning: {settings.VECTORIZER_PATH} not found. Attempting to initialize from data...")
         # Fallback: initialize from training data if pickle file not found
         try:
-            df = pd.read_csv("news.csv")
+            import pandas as pd
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            df = pd.read_csv(settings.TRAINING_DATA_PATH)
             vectorizer = TfidfVectorizer(stop_words='english', max_df=0.7)
             vectorizer.fit(df["text"])
             print("Vectorizer initialized from training data!")
         except Exception as e:
             print(f"Error initializing vectorizer from data: {e}")
-            vectorizer = None
+            return None
     except Exception as e:
         print(f"Error loading vectorizer: {e}")
-        vectorizer = None
+        return None
+    
+    # Swap the vocabulary dict for the compact read-only structure (hashing has no vocabulary)
+    if settings.COMPACT_VOCABULARY and hasattr(vectorizer, 'vocabulary_'):
+        try:
+            compact_vectorizer(vectorizer, hot_size=settings.COMPACT_VOCABULARY_HOT_TERMS)
+        except Exception as e:
+            print(f"Warning: keeping the vocabulary dict: {e}")
+    return vectorizer
+
+# Model and vectorizer are loaded by startup() (see MODEL_FORMAT in config.py; mapped artifacts are TF-IDF only)
+mapped_artifacts = settings.MODEL_FORMAT == 'mmap' and settings.FEATURE_PIPELINE == 'tfidf'
+
+def load_scorer(model, vectorizer):
+    """Native linear scorer for a model and vectorizer (see INFERENCE_ENGINE in config.py), or None"""
+    if settings.INFERENCE_ENGINE != 'native':
+        return None
+    if settings.FEATURE_PIPELINE != 'tfidf':
+        print("Warning: native scoring supports the TF-IDF pipeline only, using sklearn")
+        return None
+    try:
+        scorer = LinearScorer.from_artifacts(model, vectorizer)
+        print("Native linear scorer loaded successfully!")
+        return scorer
+    except Exception as e:
+        print(f"Warning: native scorer unavailable, using sklearn: {e}")
+        return None
+
+def artifact_paths():
+    """Files the serving model is loaded from (the manifest identifies a mapped artifact set)"""
+    if mapped_artifacts:
+        return [model_artifacts.manifest_path(settings.MODEL_ARTIFACTS_DIR)]
+    return [settings.MODEL_PATH, settings.VECTORIZER_PATH]
+
+def load_model_version():
+    """Hash the model and vectorizer files so cached verdicts follow the artifacts"""
+    try:
+        return artifact_version(artifact_paths())
+    except OSError:
+        return "unversioned"
+
+def check_pair(model, vectorizer):
+    """Raise unless the vectorizer produces the features the model was trained on"""
+    n_features = vectorizer.transform([""]).shape[1]
+    if n_features != model.coef_.shape[1]:
+        raise Exception(f"Vectorizer produces {n_features} features but the model expects "
+                        f"{model.coef_.shape[1]}: model and vectorizer are from different trainings")
+
+def load_bundle():
+    """Load model, vectorizer and scorer from the artifact files; raises if they are missing or mismatched"""
+    started = time.perf_counter()
+    version = load_model_version()
+    if mapped_artifacts:
+        model, vectorizer = load_mapped_artifacts()
+    else:
+        model = load_model()
+        vectorizer = load_vectorizer()
+    if model is None or vectorizer is None:
+        raise Exception("Model or vectorizer could not be loaded (see the server log)")
+    
+    # A pair copied into place file by file can be caught half-way
+    if load_model_version() != version:
+        raise Exception("Model files changed while loading")
+    check_pair(model, vectorizer)
+    
+    scorer = load_scorer(model, vectorizer)
+    return ModelBundle(model, vectorizer, version, scorer=scorer,
+                       load_ms=round((time.perf_counter() - started) * 1000.0, 1),
+                       observe=metrics.observe_stage)
+
+def load_candidate_bundle():
+    """Load the shadow candidate (SHADOW_MODEL_PATH + SHADOW_VECTORIZER_PATH pickles) as a bundle"""
+    started = time.perf_counter()
+    paths = [settings.SHADOW_MODEL_PATH, settings.SHADOW_VECTORIZER_PATH]
+    version = artifact_version(paths)
+    with open(settings.SHADOW_MODEL_PATH, 'rb') as f:
+        model = pickle.load(f)
+    with open(settings.SHADOW_VECTORIZER_PATH, 'rb') as f:
+        vectorizer = pickle.load(f)
+    check_pair(model, vectorizer)
+    return ModelBundle(model, vectorizer, version, scorer=load_scorer(model, vectorizer),
+                       load_ms=round((time.perf_counter() - started) * 1000.0, 1))
+
+def install_bundle(bundle):
+    """Swap a loaded bundle in for new requests and point the caches at its version"""
+    previous = registry.swap(bundle)
+    if prediction_cache is not None:
+        prediction_cache.ensure_version(bundle.version)
+    if near_duplicate_index is not None:
+        near_duplicate_index.ensure_version(bundle.version)
+    return previous
+
+# Content-addressed cache of verdicts for reposted articles
+prediction_cache = None
+if settings.PREDICTION_CACHE_ENABLED:
+    if settings.VERDICT_STORE == 'sqlite':
+        prediction_cache = SQLiteVerdictStore(
+            path=settings.VERDICT_STORE_PATH,
+            max_size=settings.PREDICTION_CACHE_SIZE,
+            ttl_seconds=settings.PREDICTION_CACHE_TTL
+        )
+        print(f"✓ Shared verdict store: {settings.VERDICT_STORE_PATH}")
+    else:
+        prediction_cache = PredictionCache(
+            max_size=settings.PREDICTION_CACHE_SIZE,
+            ttl_seconds=settings.PREDICTION_CACHE_TTL
+        )
+
+# Near-duplicate index in front of the model (optional)
+near_duplicate_index = None
+if settings.NEAR_DUPLICATE_ENABLED:
+    near_duplicate_index = NearDuplicateIndex(
+        capacity=settings.NEAR_DUPLICATE_CAPACITY,
+        threshold=settings.NEAR_DUPLICATE_THRESHOLD
+    )
+    print(f"✓ Near-duplicate detection enabled (threshold {settings.NEAR_DUPLICATE_THRESHOLD})")
 
-# Load vectorizer on startup
-load_vectorizer()
+# Per-article model time on cache misses, to compare against cache lookup time
+recompute_time = RollingStats()
+
+def cached_predict(texts, bundle, predict_fn=None, on_computed=None):
+    """Predict a list of texts with a model bundle, serving repeated and near-duplicate articles without the model"""
+    # on_computed(texts, predictions, seconds) gets the texts the model scored and its time on them
+    predict_fn = predict_fn or bundle.predict
+    predictions = [None] * len(texts)
+    keys = None
+    
+    # Exact repeats
+    if prediction_cache is not None:
+        keys = [cache_key(text, bundle.version) for text in texts]
+        predictions = [prediction_cache.get(key) for key in keys]
+    missing = [idx for idx, prediction in enumerate(predictions) if prediction is None]
+    
+    # Lightly edited reposts (the index only holds verdicts of the current version)
+    signatures = {}
+    near_duplicates = near_duplicate_index
+    if near_duplicates is not None and near_duplicates.model_version != bundle.version:
+        near_duplicates = None
+    if missing and near_duplicates is not None:
+        still_missing = []
+        for idx in missing:
+            signatures[idx] = near_duplicates.fingerprint(texts[idx])
+            prediction = near_duplicates.lookup(signatures[idx])
+            if prediction is None:
+                still_missing.append(idx)
+                continue
+            predictions[idx] = prediction
+            if keys is not None:
+                prediction_cache.put(keys[idx], prediction, bundle.version)
+        missing = still_missing
+    
+    if missing:
+        started = time.perf_counter()
+        computed = predict_fn([texts[idx] for idx in missing])
+        elapsed = time.perf_counter() - started
+        recompute_time.add(elapsed / len(missing))
+        for idx, prediction in zip(missing, computed):
+            predictions[idx] = str(prediction)
+            if keys is not None:
+                prediction_cache.put(keys[idx], predictions[idx], bundle.version)
+            if idx in signatures:
+                near_duplicates.add(signatures[idx], predictions[idx])
+        if on_computed is not None:
+            on_computed([texts[idx] for idx in missing], [predictions[idx] for idx in missing], elapsed)
+    
+    return predictions
+
+def combine_article_text(article):
+    """Validate a batch article and return its combined title + text"""
+    if not isinstance(article, dict):
+        raise ValueError("Article must be a JSON object")
+    
+    text = article.get('text')
+    title = article.get('title', '')
+    
+    if text is None:
+        raise ValueError("Missing 'text' field")
+    if not isinstance(text, str):
+        raise ValueError("'text' must be a string")
+    if title is None:
+        title = ''
+    if not isinstance(title, str):
+        raise ValueError("'title' must be a string")
+    
+    return f"{title} {text}"
+
+def predict_bundled(items):
+    """Score (bundle, text) pairs from the micro-batcher with one model call per bundle"""
+    metrics.observe_batch("micro_batch", len(items))
+    predictions = [None] * len(items)
+    groups = {}
+    for idx, (bundle, _) in enumerate(items):
+        groups.setdefault(id(bundle), (bundle, []))[1].append(idx)
+    for bundle, indices in groups.values():
+        for idx, prediction in zip(indices, bundle.predict([items[idx][1] for idx in indices])):
+            predictions[idx] = prediction
+    return predictions
+
+# Optional micro-batching scheduler for concurrent single-article requests
+# (items carry the bundle their request acquired, so a reload never mixes versions)
+micro_batcher = None
+if settings.MICRO_BATCH_ENABLED:
+    micro_batcher = MicroBatcher(
+        predict_bundled,
+        window_ms=settings.MICRO_BATCH_WINDOW_MS,
+        max_batch_size=settings.MICRO_BATCH_MAX_SIZE
+    )
+    print(f"✓ Micro-batching enabled ({settings.MICRO_BATCH_WINDOW_MS}ms window, "
+          f"max {settings.MICRO_BATCH_MAX_SIZE} items)")
+
+def model_unavailable_response():
+    """Error response while the model is still loading (503) or if it failed to load (500), else None"""
+    if not readiness.loaded.is_set():
+        return jsonify({
+            "error": "Model is still loading. Please retry shortly.",
+            "readiness": "/api/health/ready"
+        }), 503, {"Retry-After": "1"}
+    if registry.current is None:
+        return jsonify({
+            "error": "Model or vectorizer not loaded properly"
+        }), 500
+    return None
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    """Count every response and its duration (streaming bodies: until the response starts)"""
+    started = g.get('request_started')
+    if started is not None:
+        # The route pattern, not the path, so /api/jobs/<job_id> stays one series
+        endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        metrics.record_request(endpoint, request.method, response.status_code, time.perf_counter() - started)
+    return response
 
 @app.route('/')
 def home():
@@ -173,29 +475,54 @@ def home():
     return jsonify({
         "status": "running",
         "message": "Fake News Detection API is active",
-        "model_loaded": model is not None,
-        "vectorizer_loaded": vectorizer is not None,
+        "model_loaded": registry.current is not None,
+        "vectorizer_loaded": registry.current is not None,
+        "model_version": registry.current.version if registry.current is not None else None,
+        "ready": readiness.is_ready(),
         "image_support": OCR_AVAILABLE,
         "endpoints": {
             "text_analysis": "/api/predict",
             "batch_analysis": "/api/batch-predict",
+            "stream_batch_analysis": "/api/batch-predict-stream",
             "image_analysis": "/api/predict-image",
-            "model_info": "/api/model-info"
+            "batch_image_analysis": "/api/batch-predict-image",
+            "image_job_status": "/api/jobs/<job_id>",
+            "model_info": "/api/model-info",
+            "stats": "/api/stats",
+            "liveness": "/api/health/live",
+            "readiness": "/api/health/ready",
+            "model_reload": "/api/admin/reload-model",
+            "metrics": "/metrics"
         }
     })
 
+@app.route('/api/health/live', methods=['GET'])
+def liveness():
+    """Liveness probe: the process is up and serving HTTP (models may still be loading)"""
+    return jsonify({
+        "status": "alive",
+        "uptime_s": round(time.time() - readiness.started, 1)
+    }), 200
+
+@app.route('/api/health/ready', methods=['GET'])
+def readiness_check():
+    """Readiness probe: 200 once the model is loaded and warmed up, 503 before (or if loading failed)"""
+    status = readiness.snapshot()
+    return jsonify(status), 200 if status["ready"] else 503
+
 @app.route('/api/predict', methods=['POST'])
 def predict():
     """Predict if news is fake or real"""
     try:
         # Check if model and vectorizer are loaded
-        if model is None or vectorizer is None:
-            return jsonify({
-                "error": "Model or vectorizer not loaded properly"
-            }), 500
+        unavailable = model_unavailable_response()
+        if unavailable is not None:
+            return unavailable
         
         # Get data from request
+        started = time.perf_counter()
         data = request.get_json()
+        metrics.observe_stage("json_parse", time.perf_counter() - started)
         
         if not data or 'text' not in data:
             return jsonify({
@@ -208,16 +535,20 @@ def predict():
         # Combine title and text for better prediction
         combined_text = f"{title} {news_text}"
         
-        # Transform text using vectorizer
-        text_vectorized = vectorizer.transform([combined_text])
-        
-        # Make prediction
-        prediction = model.predict(text_vectorized)[0]
+        # Transform text and make prediction (coalesced with concurrent requests if enabled)
+        with registry.use() as bundle:
+            if micro_batcher is not None:
+                prediction = cached_predict(
+                    [combined_text], bundle, lambda texts: [micro_batcher.predict((bundle, texts[0]))],
+                    on_computed=shadow_offer())[0]
+            else:
+                prediction = cached_predict([combined_text], bundle, on_computed=shadow_offer())[0]
         
         # Prepare response
         response = {
             "prediction": prediction,
             "is_fake": prediction == "FAKE",
+            "model_version": bundle.version,
             "message": "Prediction completed successfully"
         }
         
@@ -232,12 +563,13 @@ def predict():
 def batch_predict():
     """Predict multiple news articles at once"""
     try:
-        if model is None or vectorizer is None:
-            return jsonify({
-                "error": "Model or vectorizer not loaded properly"
-            }), 500
+        unavailable = model_unavailable_response()
+        if unavailable is not None:
+            return unavailable
         
+        started = time.perf_counter()
         data = request.get_json()
+        metrics.observe_stage("json_parse", time.perf_counter() - started)
         
         if not data or 'articles' not in data:
             return jsonify({
@@ -250,32 +582,37 @@ def batch_predict():
             return jsonify({
                 "error": "Articles must be a non-empty array"
             }), 400
+        metrics.observe_batch("batch_predict", len(articles))
         
-        results = []
+        results = [None] * len(articles)
+        valid_indices = []
+        valid_texts = []
         
+        # Validate every article first so malformed items get their own error entry
         for idx, article in enumerate(articles):
             try:
-                text = article.get('text', '')
-                title = article.get('title', '')
-                combined_text = f"{title} {text}"
-                
-                # Transform and predict
-                text_vectorized = vectorizer.transform([combined_text])
-                prediction = model.predict(text_vectorized)[0]
-                results.append({
-                    "index": idx,
-                    "prediction": prediction,
-                    "is_fake": prediction == "FAKE"
-                })
-            except Exception as e:
-                results.append({
+                valid_texts.append(combine_article_text(article))
+                valid_indices.append(idx)
+            except ValueError as e:
+                results[idx] = {
                     "index": idx,
                     "error": str(e)
-                })
+                }
         
+        # Score all valid articles as one sparse matrix in a single predict call
+        with registry.use() as bundle:
+            if valid_texts:
+                predictions = cached_predict(valid_texts, bundle, on_computed=shadow_offer())
+                for idx, prediction in zip(valid_indices, predictions):
+                    results[idx] = {
+                        "index": idx,
+                        "prediction": prediction,
+                        "is_fake": prediction == "FAKE"
+                    }
         return jsonify({
             "results": results,
             "total": len(articles),
+            "model_version": bundle.version,
             "message": "Batch prediction completed"
         }), 200
         
@@ -284,15 +621,194 @@ def batch_predict():
             "error": f"Batch prediction failed: {str(e)}"
         }), 500
 
+def stream_predictions(lines, chunk_size, bundle):
+    """Score newline-delimited JSON articles chunk by chunk and yield NDJSON results"""
+    chunk = []
+    total = 0
+    
+    def flush():
+        texts = [item for item in chunk if isinstance(item, str)]
+        metrics.observe_batch("stream_chunk", len(chunk))
+        predictions = iter(cached_predict(texts, bundle)) if texts else iter(())
+        output = []
+        for idx, item in enumerate(chunk, start=total - len(chunk)):
+            if isinstance(item, str):
+                prediction = next(predictions)
+                result = {"index": idx, "prediction": prediction, "is_fake": prediction == "FAKE"}
+            else:
+                result = {"index": idx, "error": str(item)}
+            output.append(json.dumps(result) + "\n")
+        chunk.clear()
+        return "".join(output)
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            article = json.loads(line)
+        except ValueError as e:
+            chunk.append(ValueError(f"Invalid JSON: {e}"))
+        else:
+            try:
+                chunk.append(combine_article_text(article))
+            except ValueError as e:
+                chunk.append(e)
+        total += 1
+        
+        if len(chunk) >= chunk_size:
+            yield flush()
+    
+    if chunk:
+        yield flush()
+    
+    yield json.dumps({"total": total, "model_version": bundle.version, "message": "Batch prediction completed"}) + "\n"
+
+@app.route('/api/batch-predict-stream', methods=['POST'])
+def batch_predict_stream():
+    """Predict a stream of newline-delimited JSON articles with constant memory"""
+    unavailable = model_unavailable_response()
+    if unavailable is not None:
+        return unavailable
+    
+    # Read the request body incrementally while the response is being streamed; the whole
+    # stream is scored by the bundle acquired here, released when the response is closed
+    bundle = registry.acquire()
+    lines = stream_with_context(stream_predictions(request.stream, settings.STREAM_CHUNK_SIZE, bundle))
+    response = Response(lines, mimetype='application/x-ndjson', headers={"X-Model-Version": bundle.version})
+    response.call_on_close(lambda: registry.release(bundle))
+    return response
+
+# Perceptual-hash cache of extracted text for re-shared (re-encoded, resized) screenshots
+ocr_cache = None
+if settings.OCR_CACHE_ENABLED:
+    ocr_cache = PerceptualHashCache(
+        capacity=settings.OCR_CACHE_SIZE,
+        max_distance=settings.OCR_CACHE_MAX_DISTANCE,
+        method=settings.OCR_CACHE_HASH,
+        verify_threshold=settings.OCR_CACHE_VERIFY_THRESHOLD
+    )
+
+def ocr_image(ingest, timings, preprocess_stages=()):
+    """Text of an uploaded image, reused from the OCR cache when seen before; returns (text, cached)"""
+    # Screenshots seen before (in any encoding) reuse their extracted text
+    fingerprint = None
+    if ocr_cache is not None:
+        started = time.perf_counter()
+        fingerprint = ocr_cache.fingerprint(ingest.rgb_image())
+        extracted_text = ocr_cache.lookup(fingerprint, variant=preprocess_stages)
+        timings["ocr_cache"] = round((time.perf_counter() - started) * 1000.0, 2)
+        if extracted_text is not None:
+            return extracted_text, True
+    
+    # Photos without text are rejected before OCR; text is OCR'd only where it was found
+    crop = None
+    if settings.OCR_TEXT_CHECK_ENABLED and text_detect.CV2_AVAILABLE:
+        image = ingest.rgb_image()
+        started = time.perf_counter()
+        has_text, crop, check = text_detect.check_text(
+            image, min_regions=settings.OCR_TEXT_CHECK_MIN_REGIONS, crop=settings.OCR_TEXT_CHECK_CROP)
+        metrics.observe_stage("text_check", time.perf_counter() - started)
+        timings["text_check"] = check
+        if not has_text:
+            check["rejected"] = True
+            return "", False
+        if crop is not None:
+            check["crop"] = list(crop)
+    
+    # Extract text from image using OCR
+    started = time.perf_counter()
+    extracted_text = extract_text_from_image(ingest, preprocess_stages, timings, crop)
+    timings["ocr"] = round((time.perf_counter() - started) * 1000.0, 2)
+    if "preprocess" in timings:
+        timings["ocr"] = round(timings["ocr"] - sum(timings["preprocess"].values()), 2)
+        metrics.observe_stage("preprocess", sum(timings["preprocess"].values()) / 1000.0)
+    metrics.observe_stage("ocr", timings["ocr"] / 1000.0)
+    if fingerprint is not None:
+        ocr_cache.add(fingerprint, extracted_text, variant=preprocess_stages)
+    return extracted_text, False
+
+def insufficient_text_error(extracted_text, timings=None):
+    """Error body for images without enough text to classify, or None"""
+    if not extracted_text or len(extracted_text.strip()) < 10:
+        error = {
+            "error": "Could not extract sufficient text from image. Please ensure the image contains readable text.",
+            "extracted_text_length": len(extracted_text) if extracted_text else 0
+        }
+        if timings and "text_check" in timings:
+            error["text_check"] = timings["text_check"]
+        return error
+    return None
+
+def image_prediction_response(ingest, extracted_text, ocr_cached, prediction, timings, preprocess_stages=(),
+                              model_version=None):
+    """Response body for an analysed image"""
+    # Analyze image metadata
+    started = time.perf_counter()
+    image_metadata = analyze_image_metadata(ingest)
+    metrics.observe_stage("metadata", time.perf_counter() - started)
+    timings["metadata"] = round((time.perf_counter() - started) * 1000.0, 2)
+    
+    response = {
+        "prediction": prediction,
+        "is_fake": prediction == "FAKE",
+        "extracted_text": extracted_text[:500] + "..." if len(extracted_text) > 500 else extracted_text,
+        "extracted_text_length": len(extracted_text),
+        "image_metadata": image_metadata,
+        "ocr_cached": ocr_cached,
+        "model_version": model_version,
+        "message": "Image analysis completed successfully"
+    }
+    if preprocess_stages:
+        response["preprocessing"] = {
+            "stages": list(preprocess_stages),
+            "timings_ms": timings.get("preprocess", {})
+        }
+    if "tiling" in timings:
+        response["ocr_tiling"] = timings["tiling"]
+    if "text_check" in timings:
+        response["text_check"] = timings["text_check"]
+    return response
+
+def run_image_analysis(ingest, timings, preprocess_stages=()):
+    """OCR an uploaded image and predict on its text; returns (response, status code)"""
+    extracted_text, ocr_cached = ocr_image(ingest, timings, preprocess_stages)
+    
+    error = insufficient_text_error(extracted_text, timings)
+    if error is not None:
+        return error, 400
+    
+    # Use the existing text model to predict
+    started = time.perf_counter()
+    with registry.use() as bundle:
+        prediction = cached_predict([extracted_text], bundle)[0]
+    timings["predict"] = round((time.perf_counter() - started) * 1000.0, 2)
+    
+    return image_prediction_response(
+        ingest, extracted_text, ocr_cached, prediction, timings, preprocess_stages, bundle.version), 200
+
+def analyze_image_job(payload, timings):
+    """Worker entry point for queued image analyses"""
+    ingest, preprocess_stages = payload
+    return run_image_analysis(ingest, timings, preprocess_stages)
+
+# Queue for asynchronous image analysis (/api/predict-image?async=true)
+ocr_jobs = OCRJobQueue(
+    analyze_image_job,
+    workers=settings.OCR_WORKERS,
+    max_depth=settings.OCR_QUEUE_MAX_DEPTH,
+    result_ttl=settings.OCR_JOB_TTL
+)
+
 @app.route('/api/predict-image', methods=['POST'])
 def predict_image():
     """Predict if news in image is fake or real"""
     try:
         # Check if model and vectorizer are loaded
-        if model is None or vectorizer is None:
-            return jsonify({
-                "error": "Model or vectorizer not loaded properly"
-            }), 500
+        unavailable = model_unavailable_response()
+        if unavailable is not None:
+            return unavailable
         
         # Check if image file is present
         if 'image' not in request.files:
@@ -312,55 +828,195 @@ def predict_image():
                 "error": f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
             }), 400
         
-        # Check file size
-        image_file.seek(0, os.SEEK_END)
-        file_size = image_file.tell()
-        image_file.seek(0)
+        # Read the upload exactly once (also enforces the size limit)
+        try:
+            ingest = ImageIngest.from_upload(image_file, MAX_IMAGE_SIZE)
+        except ImageTooLargeError as e:
+            return jsonify({
+                "error": str(e)
+            }), 400
         
-        if file_size > MAX_IMAGE_SIZE:
+        # Preprocessing stages: per request (?preprocess=all|none|grayscale,...) or from config
+        try:
+            preprocess_stages = image_preprocess.parse_stages(
+                request.args.get('preprocess', request.form.get('preprocess', settings.OCR_PREPROCESS)))
+        except ValueError as e:
             return jsonify({
-                "error": f"File too large. Maximum size: {MAX_IMAGE_SIZE / (1024*1024)}MB"
+                "error": str(e)
             }), 400
         
-        # Extract text from image using OCR
-        extracted_text = extract_text_from_image(image_file)
+        # Async mode: queue the image and return a job id immediately
+        if request.args.get('async', request.form.get('async', '')).lower() in ('1', 'true', 'yes'):
+            try:
+                job = ocr_jobs.submit((ingest, preprocess_stages))
+            except QueueFullError as e:
+                return jsonify({
+                    "error": f"{str(e)}. Please retry shortly."
+                }), 503, {"Retry-After": "1"}
+            
+            return jsonify({
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": f"/api/jobs/{job.id}",
+                "message": "Image queued for analysis"
+            }), 202
+        
+        response, status_code = run_image_analysis(ingest, {}, preprocess_stages)
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        return jsonify({
+            "error": f"Image prediction failed: {str(e)}"
+        }), 500
+
+# Shared OCR threads for multi-image batches; Tesseract runs outside the GIL
+# (tesserocr releases it, pytesseract waits on a subprocess), so images use separate cores
+ocr_executor = ThreadPoolExecutor(max_workers=settings.OCR_BATCH_WORKERS, thread_name_prefix="ocr-batch")
+
+def ingest_batch_upload(image_file):
+    """Validate one file of a multi-image upload the same way predict_image() does"""
+    if image_file.filename == '':
+        raise ValueError("No image file selected")
+    if not allowed_file(image_file.filename):
+        raise ValueError(f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}")
+    try:
+        return ImageIngest.from_upload(image_file, MAX_IMAGE_SIZE)
+    except ImageTooLargeError as e:
+        raise ValueError(str(e))
+
+def ocr_batch_image(ingest, preprocess_stages):
+    """OCR one image of a batch on an executor thread; returns (text, cached, timings)"""
+    timings = {}
+    extracted_text, ocr_cached = ocr_image(ingest, timings, preprocess_stages)
+    return extracted_text, ocr_cached, timings
+
+@app.route('/api/batch-predict-image', methods=['POST'])
+def batch_predict_image():
+    """Predict several images at once, with OCR in parallel and one model call"""
+    try:
+        unavailable = model_unavailable_response()
+        if unavailable is not None:
+            return unavailable
+        
+        image_files = request.files.getlist('images')
         
-        if not extracted_text or len(extracted_text.strip()) < 10:
+        if len(image_files) == 0:
             return jsonify({
-                "error": "Could not extract sufficient text from image. Please ensure the image contains readable text.",
-                "extracted_text_length": len(extracted_text) if extracted_text else 0
+                "error": "No image files provided. Please upload one or more files in the 'images' field."
             }), 400
         
-        # Analyze image metadata
-        image_metadata = analyze_image_metadata(image_file)
+        if len(image_files) > settings.OCR_BATCH_MAX_IMAGES:
+            return jsonify({
+                "error": f"Too many images. Maximum per batch: {settings.OCR_BATCH_MAX_IMAGES}"
+            }), 400
+        metrics.observe_batch("batch_image", len(image_files))
         
-        # Use the existing text model to predict
-        text_vectorized = vectorizer.transform([extracted_text])
-        prediction = model.predict(text_vectorized)[0]
+        try:
+            preprocess_stages = image_preprocess.parse_stages(
+                request.args.get('preprocess', request.form.get('preprocess', settings.OCR_PREPROCESS)))
+        except ValueError as e:
+            return jsonify({
+                "error": str(e)
+            }), 400
         
-        # Prepare response
-        response = {
-            "prediction": prediction,
-            "is_fake": prediction == "FAKE",
-            "extracted_text": extracted_text[:500] + "..." if len(extracted_text) > 500 else extracted_text,
-            "extracted_text_length": len(extracted_text),
-            "image_metadata": image_metadata,
-            "message": "Image analysis completed successfully"
+        results = [None] * len(image_files)
+        ingests = {}
+        
+        # Validate and read every file first so bad uploads get their own error entry
+        for idx, image_file in enumerate(image_files):
+            try:
+                ingests[idx] = ingest_batch_upload(image_file)
+            except ValueError as e:
+                results[idx] = {
+                    "index": idx,
+                    "filename": image_file.filename,
+                    "error": str(e)
+                }
+        
+        # OCR all accepted images in parallel
+        futures = {
+            idx: ocr_executor.submit(ocr_batch_image, ingest, preprocess_stages)
+            for idx, ingest in ingests.items()
         }
         
-        return jsonify(response), 200
+        valid_indices = []
+        valid_texts = []
+        extracted = {}
+        for idx, future in futures.items():
+            filename = ingests[idx].filename
+            try:
+                extracted[idx] = future.result()
+            except Exception as e:
+                results[idx] = {
+                    "index": idx,
+                    "filename": filename,
+                    "error": f"Image prediction failed: {str(e)}"
+                }
+                continue
+            
+            error = insufficient_text_error(extracted[idx][0], extracted[idx][2])
+            if error is not None:
+                results[idx] = dict(index=idx, filename=filename, **error)
+                continue
+            valid_indices.append(idx)
+            valid_texts.append(extracted[idx][0])
+        
+        # Score all extracted texts in a single predict call
+        with registry.use() as bundle:
+            if valid_texts:
+                predictions = cached_predict(valid_texts, bundle)
+                for idx, prediction in zip(valid_indices, predictions):
+                    extracted_text, ocr_cached, timings = extracted[idx]
+                    response = image_prediction_response(
+                        ingests[idx], extracted_text, ocr_cached, prediction, timings, preprocess_stages)
+                    response.pop("message")
+                    response.pop("model_version")
+                    results[idx] = dict(index=idx, filename=ingests[idx].filename, **response)
+        
+        return jsonify({
+            "results": results,
+            "total": len(image_files),
+            "model_version": bundle.version,
+            "message": "Batch image analysis completed"
+        }), 200
         
     except Exception as e:
         return jsonify({
-            "error": f"Image prediction failed: {str(e)}"
+            "error": f"Batch image prediction failed: {str(e)}"
+        }), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Get the status of a queued image analysis (use ?wait=<seconds> to long-poll)"""
+    try:
+        job = ocr_jobs.get(job_id)
+        if job is None:
+            return jsonify({
+                "error": "Job not found or expired"
+            }), 404
+        
+        try:
+            wait = min(float(request.args.get('wait', 0)), settings.OCR_JOB_MAX_WAIT)
+        except ValueError:
+            wait = 0
+        if wait > 0:
+            job.wait(wait)
+        
+        return jsonify(job.to_dict()), 200
+        
+    except Exception as e:
+        return jsonify({
+            "error": f"Failed to get job status: {str(e)}"
         }), 500
 
 @app.route('/api/check-ocr', methods=['GET'])
 def check_ocr():
     """Check if OCR/Tesseract is properly configured"""
     try:
+        ocr_engine = get_ocr_engine()
         status = {
-            "pytesseract_installed": OCR_AVAILABLE,
+            "pytesseract_installed": PYTESSERACT_AVAILABLE,
+            "ocr_engine": ocr_engine.name if ocr_engine is not None else None,
             "tesseract_configured": False,
             "tesseract_path": None,
             "tesseract_version": None,
@@ -371,16 +1027,17 @@ def check_ocr():
             try:
                 # Try to get Tesseract version
                 import platform
-                if platform.system() == 'Windows':
+                if platform.system() == 'Windows' and PYTESSERACT_AVAILABLE:
+                    import pytesseract
                     status["tesseract_path"] = getattr(pytesseract.pytesseract, 'tesseract_cmd', 'Not set (using PATH)')
                 else:
                     status["tesseract_path"] = "Using system PATH"
                 
-                version = pytesseract.get_tesseract_version()
+                version = ocr_engine.version()
                 status["tesseract_version"] = str(version)
                 status["tesseract_configured"] = True
                 status["message"] = "Tesseract OCR is properly configured!"
-            except pytesseract.TesseractNotFoundError as e:
+            except TesseractNotFoundError as e:
                 status["error"] = str(e)
                 status["message"] = "Tesseract executable not found. Please install Tesseract OCR."
             except Exception as e:
@@ -396,19 +1053,95 @@ def check_ocr():
             "error": f"Failed to check OCR status: {str(e)}"
         }), 500
 
+@app.route('/api/stats', methods=['GET'])
+def stats():
+    """Get runtime performance statistics"""
+    try:
+        return jsonify({
+            "micro_batching": micro_batcher.stats() if micro_batcher is not None else {"enabled": False},
+            "prediction_cache": prediction_cache.stats() if prediction_cache is not None else {"enabled": False},
+            "near_duplicate": near_duplicate_index.stats() if near_duplicate_index is not None else {"enabled": False},
+            "image_jobs": ocr_jobs.stats(),
+            "ocr_engine": ocr_engine.stats() if ocr_engine is not None else {"engine": None},
+            "image_preprocessing": image_preprocess.stats(),
+            "ocr_tiling": ocr_tiling.stats(),
+            "text_check": text_detect.stats(),
+            "ocr_cache": ocr_cache.stats() if ocr_cache is not None else {"enabled": False},
+            "recompute_ms": recompute_time.summary(scale=1000.0, digits=4),
+            "models": registry.stats(),
+            "shadow": shadow_scorer.stats() if shadow_scorer is not None else {"enabled": False}
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            "error": f"Failed to get stats: {str(e)}"
+        }), 500
+
+def collect_metrics():
+    """Gauges and counters read from the caches, queues and registry at scrape time"""
+    bundle = registry.current
+    models = registry.stats()
+    collected = [
+        ("fakenews_model_info", "gauge", "Model currently serving requests",
+         [({"version": bundle.version, "engine": bundle.engine}, 1)] if bundle is not None else []),
+        ("fakenews_ready", "gauge", "1 once the model is loaded and warmed up", [({}, int(readiness.is_ready()))]),
+        ("fakenews_model_swaps_total", "counter", "Model bundles swapped in", [({}, models["swaps"])]),
+        ("fakenews_model_reload_failures_total", "counter", "Model reloads rejected", [({}, models["failed_reloads"])])
+    ]
+
+    caches = [("prediction", prediction_cache), ("near_duplicate", near_duplicate_index), ("ocr", ocr_cache)]
+    cache_stats = [(name, cache.stats()) for name, cache in caches if cache is not None]
+    for metric, field, kind, help_text in (("fakenews_cache_hits_total", "hits", "counter", "Cache hits"),
+                                           ("fakenews_cache_misses_total", "misses", "counter", "Cache misses"),
+                                           ("fakenews_cache_evictions_total", "evictions", "counter", "Cache evictions"),
+                                           ("fakenews_cache_entries", "size", "gauge", "Entries in the cache")):
+        collected.append((metric, kind, help_text, [({"cache": name}, values.get(field)) for name, values in cache_stats]))
+
+    queues = [("ocr_jobs", ocr_jobs.stats().get("queue_depth"))]
+    if micro_batcher is not None:
+        queues.append(("micro_batch", micro_batcher.stats()["queue_depth"]))
+    collected.append(("fakenews_queue_depth", "gauge", "Items waiting in a work queue",
+                      [({"queue": name}, depth) for name, depth in queues]))
+
+    if shadow_scorer is not None:
+        shadow = shadow_scorer.stats()
+        collected.append(("fakenews_shadow_items_total", "counter", "Texts scored by the shadow candidate",
+                          [({"candidate": shadow["candidate_version"]}, shadow["items"])]))
+        collected.append(("fakenews_shadow_disagreements_total", "counter",
+                          "Shadow candidate verdicts that differ from the served verdict",
+                          [({"candidate": shadow["candidate_version"]}, shadow["disagreements"])]))
+    return collected
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Prometheus text exposition of request, error, stage-latency and batch-size metrics"""
+    if not settings.METRICS_ENABLED:
+        return jsonify({"error": "Metrics are disabled (METRICS_ENABLED=false)"}), 404
+    return Response(metrics.render(collect_metrics()), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 @app.route('/api/model-info', methods=['GET'])
 def model_info():
     """Get information about the model"""
     try:
+        bundle = registry.current
+        model = bundle.model if bundle is not None else None
+        vectorizer = bundle.vectorizer if bundle is not None else None
         info = {
             "model_type": "PassiveAggressiveClassifier",
-            "vectorizer": "TfidfVectorizer",
+            "vectorizer": feature_hashing.describe(vectorizer) if vectorizer is not None else None,
+            "feature_pipeline": settings.FEATURE_PIPELINE,
+            "inference_engine": bundle.engine if bundle is not None else None,
+            "model_version": bundle.version if bundle is not None else None,
+            "model_format": settings.MODEL_FORMAT,
             "accuracy": "94.79%",
             "training_samples": 6335,
             "max_iterations": 50,
             "features": {
                 "stop_words": "english",
                 "max_df": 0.7
+            } if settings.FEATURE_PIPELINE == 'tfidf' else {
+                "stop_words": "english",
+                "n_features": vectorizer.named_steps['hash'].n_features if vectorizer is not None else None
             },
             "image_support": OCR_AVAILABLE,
             "allowed_image_formats": list(ALLOWED_EXTENSIONS),
@@ -429,12 +1162,254 @@ def model_info():
             "error": f"Failed to get model info: {str(e)}"
         }), 500
 
+def admin_authorized():
+    """Admin endpoints need an X-Admin-Token header matching ADMIN_TOKEN; they are off while it is unset.
+    
+    The caller's address is not trusted: behind a reverse proxy on the same host every request
+    arrives from 127.0.0.1.
+    """
+    if not settings.ADMIN_TOKEN:
+        return False
+    return hmac.compare_digest(request.headers.get('X-Admin-Token', ''), settings.ADMIN_TOKEN)
+
+@app.route('/api/admin/reload-model', methods=['POST'])
+def reload_model_endpoint():
+    """Reload the model and vectorizer from disk and swap them in without a restart (?force=true to reload unchanged files)"""
+    if not settings.ADMIN_TOKEN:
+        return jsonify({
+            "error": "Admin endpoints are disabled; set ADMIN_TOKEN to enable them"
+        }), 403
+    if not admin_authorized():
+        return jsonify({
+            "error": "Not authorized"
+        }), 403
+    if reload_lock.locked():
+        return jsonify({
+            "error": "A model reload is already in progress"
+        }), 409
+    
+    previous = registry.current
+    previous_version = previous.version if previous is not None else None
+    force = request.args.get('force', '').lower() in ('1', 'true', 'yes')
+    try:
+        bundle = reload_model(force)
+    except Exception as e:
+        return jsonify({
+            "error": f"Model reload failed, still serving the previous model: {str(e)}",
+            "model_version": previous_version
+        }), 500
+    
+    if bundle is None:
+        return jsonify({
+            "reloaded": False,
+            "model_version": previous_version,
+            "message": "Model files unchanged"
+        }), 200
+    return jsonify({
+        "reloaded": True,
+        "model_version": bundle.version,
+        "previous_version": previous_version,
+        "load_ms": bundle.load_ms,
+        "message": "Model reloaded"
+    }), 200
+
+# Synthetic inputs for the warm-up pass
+WARMUP_ARTICLES = [
+    "Scientists Discover New Planet Astronomers have announced the discovery of a new planet in our solar system.",
+    "Breaking: Officials Confirm Report Government officials confirmed the report on Monday. "
+    "The proposal includes tax changes for small businesses and analysts expect the measure to pass "
+    "before the end of the year, while opposition leaders said they would review the details carefully."
+]
+WARMUP_IMAGE_LINES = [
+    "Government officials announced a new economic plan",
+    "The proposal includes tax changes for small businesses",
+    "Analysts expect the measure to pass before the end of the year"
+]
+
+# Warm-up and validation score with bundle.score() and never go through cached_predict(), so the
+# synthetic inputs stay out of the caches, the verdict store, the near-duplicate index and the metrics
+
+def validate_bundle(bundle):
+    """Score the synthetic articles, one at a time and as a batch; raises unless every label is a model class"""
+    for article in WARMUP_ARTICLES:
+        bundle.score([article])
+    predictions = [str(prediction) for prediction in bundle.score(WARMUP_ARTICLES)]
+    classes = {str(label) for label in bundle.model.classes_}
+    if not set(predictions) <= classes:
+        raise Exception(f"Model returned labels {predictions} outside its classes {sorted(classes)}")
+    return predictions
+
+def warm_up_text():
+    """Run synthetic articles through the text model"""
+    with registry.use() as bundle:
+        predictions = validate_bundle(bundle)
+    return {"articles": len(WARMUP_ARTICLES), "engine": bundle.engine, "predictions": predictions}
+
+def warm_up_image():
+    """Run a synthetic screenshot through each stage of the image path: decode, text check, OCR, predict"""
+    if get_ocr_engine() is None:
+        return "no OCR engine installed"
+    from PIL import Image, ImageDraw, ImageFont
+    try:
+        font = ImageFont.load_default(size=28)
+    except TypeError:
+        font = ImageFont.load_default()
+    image = Image.new('RGB', (900, 60 + 48 * len(WARMUP_IMAGE_LINES)), 'white')
+    draw = ImageDraw.Draw(image)
+    for row, line in enumerate(WARMUP_IMAGE_LINES):
+        draw.text((30, 30 + row * 48), line, fill='black', font=font)
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    
+    ingest = ImageIngest(buffer.getvalue(), 'warmup.png', observe=None)
+    preprocess_stages = image_preprocess.parse_stages(settings.OCR_PREPROCESS)
+    crop = None
+    if settings.OCR_TEXT_CHECK_ENABLED and text_detect.CV2_AVAILABLE:
+        has_text, crop, _ = text_detect.check_text(
+            ingest.rgb_image(), min_regions=settings.OCR_TEXT_CHECK_MIN_REGIONS, crop=settings.OCR_TEXT_CHECK_CROP)
+        if not has_text:
+            raise Exception("Text check found no text in the synthetic screenshot")
+    
+    started = time.perf_counter()
+    extracted_text = extract_text_from_image(ingest, preprocess_stages, {}, crop)
+    ocr_ms = round((time.perf_counter() - started) * 1000.0, 2)
+    error = insufficient_text_error(extracted_text)
+    if error is not None:
+        raise Exception(error["error"])
+    analyze_image_metadata(ingest)
+    
+    started = time.perf_counter()
+    with registry.use() as bundle:
+        prediction = str(bundle.score([extracted_text])[0])
+    return {"ocr_engine": ocr_engine.name, "prediction": prediction,
+            "ocr_ms": ocr_ms, "predict_ms": round((time.perf_counter() - started) * 1000.0, 2)}
+
+# Reloads run one at a time, in the watcher thread or the admin request that asked for them
+reload_lock = threading.Lock()
+
+def reload_model(force=False):
+    """Load the artifact files off the request path, validate and swap them in; None if unchanged"""
+    with reload_lock:
+        current = registry.current
+        if not force and current is not None and load_model_version() == current.version:
+            return None
+        try:
+            bundle = load_bundle()
+            validate_bundle(bundle)
+        except Exception as e:
+            registry.record_failure(e)
+            raise
+        install_bundle(bundle)
+        print(f"✓ Model {bundle.version} swapped in (was {current.version if current is not None else None})")
+        return bundle
+
+def artifact_signature():
+    """Modification time and size of every artifact file, to notice new files without reading them"""
+    signature = []
+    for path in artifact_paths():
+        try:
+            info = os.stat(path)
+            signature.append((info.st_mtime_ns, info.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+def watch_model_files(interval):
+    """Reload when the artifact files change, once they have stayed unchanged for one interval"""
+    seen = artifact_signature()
+    pending = None
+    while True:
+        time.sleep(interval)
+        signature = artifact_signature()
+        if signature == seen:
+            pending = None
+            continue
+        if signature != pending:
+            # Still being written or copied; look again next interval
+            pending = signature
+            continue
+        seen = signature
+        pending = None
+        if None in signature:
+            print("⚠️ Model files missing, keeping the loaded model")
+            continue
+        try:
+            reload_model()
+        except Exception as e:
+            print(f"⚠️ Model reload failed, keeping {registry.current.version if registry.current else None}: {e}")
+
+# Candidate model scored in the shadow of live traffic (see SHADOW_MODEL_PATH in config.py)
+shadow_scorer = None
+
+def shadow_offer():
+    """cached_predict() callback offering model-scored texts and the model time to the shadow candidate"""
+    scorer = shadow_scorer
+    if scorer is None:
+        return None
+    return lambda texts, predictions, seconds: scorer.offer(texts, predictions, seconds * 1000.0)
+
+def load_shadow_model():
+    """Load the candidate and start shadow scoring (startup step); returns why it was skipped"""
+    global shadow_scorer
+    if not settings.SHADOW_MODEL_PATH or not settings.SHADOW_VECTORIZER_PATH:
+        return "SHADOW_MODEL_PATH and SHADOW_VECTORIZER_PATH not set"
+    candidate = load_candidate_bundle()
+    predictions = validate_bundle(candidate)
+    shadow_scorer = ShadowScorer(
+        candidate,
+        sample_rate=settings.SHADOW_SAMPLE_RATE,
+        cpu_budget=settings.SHADOW_CPU_BUDGET,
+        max_queue=settings.SHADOW_QUEUE_SIZE,
+        max_items=settings.SHADOW_MAX_ITEMS,
+        idle=registry.idle,
+        max_delay_ms=settings.SHADOW_MAX_DELAY_MS
+    )
+    print(f"✓ Shadow scoring candidate {candidate.version} on {settings.SHADOW_SAMPLE_RATE:.0%} of requests "
+          f"(CPU budget {settings.SHADOW_CPU_BUDGET:.0%} of a core)")
+    return {"version": candidate.version, "engine": candidate.engine, "predictions": predictions}
+
+def load_initial_model():
+    """Load and install the first bundle (startup step)"""
+    bundle = load_bundle()
+    install_bundle(bundle)
+    return {"version": bundle.version, "engine": bundle.engine}
+
+def startup():
+    """Load the model bundle and OCR engine, then warm up the text and image paths"""
+    readiness.run("model", load_initial_model)
+    # Requests can be served from here on; the warm-up only decides readiness
+    readiness.loaded.set()
+    
+    readiness.run("shadow_model", load_shadow_model, required=False)
+    if settings.WARMUP_ENABLED or not settings.LAZY_STARTUP:
+        readiness.run("ocr_engine", load_ocr_engine, required=settings.READINESS_REQUIRE_OCR)
+    if settings.WARMUP_ENABLED and registry.current is not None:
+        readiness.run("warmup_text", warm_up_text)
+        readiness.run("warmup_image", warm_up_image, required=settings.READINESS_REQUIRE_OCR)
+    readiness.finish()
+    print(f"{'✓ Ready' if readiness.is_ready() else '⚠️ Not ready'} "
+          f"after {readiness.snapshot()['startup_ms']:.0f} ms")
+    
+    if settings.MODEL_WATCH_INTERVAL > 0:
+        threading.Thread(target=watch_model_files, args=(settings.MODEL_WATCH_INTERVAL,),
+                         name="model-watcher", daemon=True).start()
+        print(f"✓ Watching model files every {settings.MODEL_WATCH_INTERVAL:g}s")
+
+# Load in a background thread (the server answers liveness and readiness probes meanwhile) or now
+if settings.BACKGROUND_LOADING:
+    threading.Thread(target=startup, name="startup", daemon=True).start()
+else:
+    startup()
+
 if __name__ == '__main__':
     print("\n" + "="*50)
     print("🚀 Starting Fake News Detection API Server")
     print("="*50)
-    print(f"Model loaded: {model is not None}")
-    print(f"Vectorizer loaded: {vectorizer is not None}")
+    if settings.BACKGROUND_LOADING:
+        print("Model loading in the background (see /api/health/ready)")
+    else:
+        print(f"Model loaded: {registry.current is not None}")
+        print(f"Vectorizer loaded: {registry.current is not None}")
     print("="*50 + "\n")
     
     # Run the Flask app
@@ -0,0 +1,140 @@
+"""
+Compact read-only vocabulary for the TF-IDF vectorizer.
+
+A fitted TfidfVectorizer keeps vocabulary_ as a Python dict; with hundreds
+of thousands of terms that is one str object, one int object and one hash
+table entry per term, which dominates per-worker memory and unpickle time.
+CompactVocabulary holds the same term -> feature index mapping in three
+flat buffers:
+
+    terms    UTF-8 terms of all features, back to back, in feature order
+    offsets  int64 start of each term in terms (n_features + 1)
+    slots    int32 open-addressing hash table (crc32, linear probing, at most
+             50% full) holding feature indices, -1 for empty slots
+
+A lookup is one crc32 of the encoded term and, on average, about one slot
+probe and one bytes comparison. Word frequencies in news text are heavily
+skewed, so the most frequent terms (lowest IDF) can additionally be kept in a
+small dict that answers most lookups at dict speed. The buffers can live in
+memory or be memory-mapped from disk (see model_artifacts.py). It is a
+Mapping, so it can replace vectorizer.vocabulary_ and sklearn's transform
+uses it unchanged.
+"""
+
+import zlib
+from collections.abc import Mapping
+
+import numpy as np
+
+
+def build_buffers(vocabulary):
+    """Terms blob, offsets and hash slots for a term -> index mapping; returns (terms, offsets, slots)"""
+    terms = [None] * len(vocabulary)
+    for term, index in vocabulary.items():
+        terms[index] = term.encode('utf-8')
+    if any(term is None for term in terms):
+        raise ValueError("Vocabulary indices must be 0..n-1 without gaps")
+
+    offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(term) for term in terms])
+
+    size = 1
+    while size < 2 * len(terms):
+        size *= 2
+    slots = np.full(size, -1, dtype=np.int32)
+    mask = size - 1
+    for index, term in enumerate(terms):
+        position = zlib.crc32(term) & mask
+        while slots[position] >= 0:
+            position = (position + 1) & mask
+        slots[position] = index
+    return b''.join(terms), offsets, slots
+
+
+class CompactVocabulary(Mapping):
+    """Read-only term -> feature index mapping over three flat buffers"""
+
+    def __init__(self, terms, offsets, slots, hot=()):
+        self._buffers = (terms, offsets, slots)
+        self._terms = terms
+        self._offsets = memoryview(offsets).cast('B').cast('q')
+        self._slots = memoryview(slots).cast('B').cast('i')
+        self._mask = len(self._slots) - 1
+        self._hot_indices = np.asarray(hot, dtype=np.int32)
+        self._hot = {self._term(index).decode('utf-8'): index for index in self._hot_indices.tolist()}
+
+    @classmethod
+    def from_mapping(cls, vocabulary, idf=None, hot_size=0):
+        """Compact copy of a term -> index dict (e.g. a fitted vectorizer's vocabulary_)"""
+        terms, offsets, slots = build_buffers(vocabulary)
+        return cls(terms, offsets, slots, hot_indices(idf, hot_size))
+
+    def _term(self, index):
+        return self._terms[self._offsets[index]:self._offsets[index + 1]]
+
+    def __getitem__(self, term):
+        index = self._hot.get(term)
+        if index is not None:
+            return index
+
+        # Hot path of vectorizer.transform(), hence the local names
+        key = term.encode('utf-8')
+        slots = self._slots
+        offsets = self._offsets
+        mask = self._mask
+        position = zlib.crc32(key) & mask
+        while True:
+            index = slots[position]
+            if index < 0:
+                raise KeyError(term)
+            start = offsets[index]
+            end = offsets[index + 1]
+            if end - start == len(key) and self._terms[start:end] == key:
+                return index
+            position = (position + 1) & mask
+
+    def get(self, term, default=None):
+        try:
+            return self[term]
+        except KeyError:
+            return default
+
+    def __contains__(self, term):
+        return self.get(term) is not None
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._term(index).decode('utf-8')
+
+    def nbytes(self):
+        """Size of the buffers in bytes"""
+        return len(self._terms) + self._offsets.nbytes + self._slots.nbytes + self._hot_indices.nbytes
+
+    def __reduce__(self):
+        # Pickles as flat byte strings, whatever the buffers are backed by
+        terms, offsets, slots = self._buffers
+        return (_from_bytes, (bytes(terms), bytes(memoryview(offsets).cast('B')),
+                              bytes(memoryview(slots).cast('B')), self._hot_indices.tobytes()))
+
+
+def _from_bytes(terms, offsets, slots, hot):
+    return CompactVocabulary(terms, np.frombuffer(offsets, dtype=np.int64),
+                             np.frombuffer(slots, dtype=np.int32), np.frombuffer(hot, dtype=np.int32))
+
+
+def hot_indices(idf, hot_size):
+    """Feature indices of the hot_size most frequent terms (lowest IDF)"""
+    if idf is None or hot_size <= 0:
+        return ()
+    return np.argsort(np.asarray(idf), kind='stable')[:hot_size]
+
+
+def compact_vectorizer(vectorizer, hot_size=0):
+    """Replace a fitted vectorizer's vocabulary dict with a CompactVocabulary, in place"""
+    if not isinstance(vectorizer.vocabulary_, CompactVocabulary):
+        idf = vectorizer.idf_ if vectorizer.use_idf else None
+        vectorizer.vocabulary_ = CompactVocabulary.from_mapping(vectorizer.vocabulary_, idf, hot_size)
+    return vectorizer
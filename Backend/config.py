@@ -18,9 +18,40 @@ class Config:
     PORT = int(os.environ.get('PORT', 5000))
     
     # Model Settings
-    MODEL_PATH = os.environ.get('MODEL_PATH', 'finalized_model.pkl')
-    VECTORIZER_PATH = os.environ.get('VECTORIZER_PATH', 'tfidf_vectorizer.pkl')
+    # Feature pipeline: 'tfidf' (fitted vocabulary) or 'hashing' (stateless feature hashing,
+    # fixed memory, no vocabulary); regenerate_model.py trains both
+    FEATURE_PIPELINE = os.environ.get('FEATURE_PIPELINE', 'tfidf')
+    MODEL_PATH = os.environ.get('MODEL_PATH',
+                                'hashing_model.pkl' if FEATURE_PIPELINE == 'hashing' else 'finalized_model.pkl')
+    VECTORIZER_PATH = os.environ.get('VECTORIZER_PATH',
+                                     'hashing_vectorizer.pkl' if FEATURE_PIPELINE == 'hashing' else 'tfidf_vectorizer.pkl')
     TRAINING_DATA_PATH = os.environ.get('TRAINING_DATA_PATH', 'news.csv')
+    # Artifact format: 'pickle' (MODEL_PATH + VECTORIZER_PATH, one copy per worker) or
+    # 'mmap' (MODEL_ARTIFACTS_DIR exported by regenerate_model.py, memory-mapped read-only
+    # so all workers on a host share it)
+    MODEL_FORMAT = os.environ.get('MODEL_FORMAT', 'pickle')
+    MODEL_ARTIFACTS_DIR = os.environ.get('MODEL_ARTIFACTS_DIR', 'model_artifacts')
+    # Replace the pickled vectorizer's vocabulary dict with a compact read-only structure
+    # (opt-in for memory-bound hosts: smaller and faster to load, but transform() is slower)
+    COMPACT_VOCABULARY = os.environ.get('COMPACT_VOCABULARY', 'false').lower() == 'true'
+    # Most frequent terms (lowest IDF) also kept in a small dict for dict-speed lookups
+    COMPACT_VOCABULARY_HOT_TERMS = int(os.environ.get('COMPACT_VOCABULARY_HOT_TERMS', 20000))
+    
+    # Startup: import OpenCV and create the OCR engine on first use, and never refit the
+    # vectorizer from TRAINING_DATA_PATH when VECTORIZER_PATH is missing (false: eager startup)
+    LAZY_STARTUP = os.environ.get('LAZY_STARTUP', 'true').lower() == 'true'
+    # Load the model in a background thread so the server answers /api/health/live at once;
+    # /api/health/ready returns 200 only after loading and a warm-up pass through the text and
+    # image paths (warm-up defaults to on with background loading)
+    BACKGROUND_LOADING = os.environ.get('BACKGROUND_LOADING', 'false').lower() == 'true'
+    WARMUP_ENABLED = os.environ.get('WARMUP_ENABLED', 'true' if BACKGROUND_LOADING else 'false').lower() == 'true'
+    # Hold readiness until the image path (OCR engine) also warmed up successfully
+    READINESS_REQUIRE_OCR = os.environ.get('READINESS_REQUIRE_OCR', 'false').lower() == 'true'
+    # Hot reload: poll the model files every MODEL_WATCH_INTERVAL seconds (0 = only on
+    # POST /api/admin/reload-model) and swap a changed, validated model in without a restart
+    MODEL_WATCH_INTERVAL = float(os.environ.get('MODEL_WATCH_INTERVAL', 0))
+    # Token for the admin endpoints (X-Admin-Token header); unset disables them
+    ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
     
     # API Settings
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max request size
@@ -34,6 +65,88 @@ class Config:
     RATE_LIMIT_REQUESTS = 100
     RATE_LIMIT_PERIOD = 3600  # 1 hour in seconds
     
+    # Inference engine: 'sklearn' (vectorizer.transform + model.predict) or
+    # 'native' (LinearScorer, same labels without sklearn per-call overhead)
+    INFERENCE_ENGINE = os.environ.get('INFERENCE_ENGINE', 'sklearn')
+    
+    # Prediction cache (verdicts keyed on normalised title + text and model version)
+    PREDICTION_CACHE_ENABLED = os.environ.get('PREDICTION_CACHE_ENABLED', 'true').lower() == 'true'
+    PREDICTION_CACHE_SIZE = int(os.environ.get('PREDICTION_CACHE_SIZE', 10000))
+    PREDICTION_CACHE_TTL = int(os.environ.get('PREDICTION_CACHE_TTL', 3600))  # seconds
+    # Verdict store backend: 'memory' (per process) or 'sqlite' (shared by all workers on a host)
+    VERDICT_STORE = os.environ.get('VERDICT_STORE', 'memory')
+    VERDICT_STORE_PATH = os.environ.get('VERDICT_STORE_PATH', 'verdicts.sqlite3')
+    
+    # Near-duplicate detection (reuse verdicts for lightly edited reposts)
+    NEAR_DUPLICATE_ENABLED = os.environ.get('NEAR_DUPLICATE_ENABLED', 'false').lower() == 'true'
+    NEAR_DUPLICATE_THRESHOLD = float(os.environ.get('NEAR_DUPLICATE_THRESHOLD', 0.8))  # Jaccard similarity
+    NEAR_DUPLICATE_CAPACITY = int(os.environ.get('NEAR_DUPLICATE_CAPACITY', 200000))
+    
+    # Streaming NDJSON batch endpoint: articles scored per chunk
+    STREAM_CHUNK_SIZE = int(os.environ.get('STREAM_CHUNK_SIZE', 256))
+    
+    # OCR engine: 'auto' (pooled tesserocr if installed, else pytesseract), 'tesserocr' or 'pytesseract'
+    OCR_ENGINE = os.environ.get('OCR_ENGINE', 'auto')
+    OCR_POOL_SIZE = int(os.environ.get('OCR_POOL_SIZE', os.cpu_count() or 2))
+    OCR_LANG = os.environ.get('OCR_LANG', 'eng')
+    
+    # OpenCV preprocessing before OCR: 'none', 'all' or a comma-separated list of
+    # grayscale, downscale, threshold, deskew (requests can override with ?preprocess=...)
+    OCR_PREPROCESS = os.environ.get('OCR_PREPROCESS', 'none')
+    OCR_PREPROCESS_TARGET_WIDTH = int(os.environ.get('OCR_PREPROCESS_TARGET_WIDTH', 1600))  # pixels
+    
+    # Text-presence check before OCR (needs opencv-python): images without text-like regions are
+    # rejected in milliseconds, others optionally cropped to the regions found. Opt-in: it has only
+    # been checked against generated fixtures, not photographed or low-contrast text
+    OCR_TEXT_CHECK_ENABLED = os.environ.get('OCR_TEXT_CHECK_ENABLED', 'false').lower() == 'true'
+    OCR_TEXT_CHECK_CROP = os.environ.get('OCR_TEXT_CHECK_CROP', 'true').lower() == 'true'
+    OCR_TEXT_CHECK_MIN_REGIONS = int(os.environ.get('OCR_TEXT_CHECK_MIN_REGIONS', 1))
+    
+    # Tiled OCR: images taller than OCR_TILE_MIN_HEIGHT pixels (after preprocessing) are cut into
+    # strips of OCR_TILE_HEIGHT overlapping by OCR_TILE_OVERLAP and recognised in parallel
+    OCR_TILING_ENABLED = os.environ.get('OCR_TILING_ENABLED', 'true').lower() == 'true'
+    OCR_TILE_MIN_HEIGHT = int(os.environ.get('OCR_TILE_MIN_HEIGHT', 4000))
+    OCR_TILE_HEIGHT = int(os.environ.get('OCR_TILE_HEIGHT', 1600))
+    OCR_TILE_OVERLAP = int(os.environ.get('OCR_TILE_OVERLAP', 200))
+    
+    # Perceptual-hash cache of OCR text for re-shared screenshots (opt-in: a near match reuses another
+    # upload's text, and edits smaller than a word can pass the thumbnail check)
+    OCR_CACHE_ENABLED = os.environ.get('OCR_CACHE_ENABLED', 'false').lower() == 'true'
+    OCR_CACHE_SIZE = int(os.environ.get('OCR_CACHE_SIZE', 2000))  # about 12.5 KB per image plus its text
+    OCR_CACHE_HASH = os.environ.get('OCR_CACHE_HASH', 'phash')  # 'phash' or 'dhash'
+    OCR_CACHE_MAX_DISTANCE = int(os.environ.get('OCR_CACHE_MAX_DISTANCE', 24))  # differing bits out of 256
+    OCR_CACHE_VERIFY_THRESHOLD = int(os.environ.get('OCR_CACHE_VERIFY_THRESHOLD', 34))  # grey levels, 64x192 thumbnail
+    
+    # Multi-image batch endpoint (/api/batch-predict-image): images OCR'd in parallel
+    OCR_BATCH_WORKERS = int(os.environ.get('OCR_BATCH_WORKERS', os.cpu_count() or 2))
+    OCR_BATCH_MAX_IMAGES = int(os.environ.get('OCR_BATCH_MAX_IMAGES', 20))
+    
+    # Asynchronous image analysis queue (/api/predict-image?async=true)
+    OCR_WORKERS = int(os.environ.get('OCR_WORKERS', 2))
+    OCR_QUEUE_MAX_DEPTH = int(os.environ.get('OCR_QUEUE_MAX_DEPTH', 32))
+    OCR_JOB_TTL = int(os.environ.get('OCR_JOB_TTL', 600))  # seconds finished results are kept
+    OCR_JOB_MAX_WAIT = int(os.environ.get('OCR_JOB_MAX_WAIT', 30))  # longest long-poll in seconds
+    
+    # Micro-batching (coalesce concurrent /api/predict calls into one model call)
+    MICRO_BATCH_ENABLED = os.environ.get('MICRO_BATCH_ENABLED', 'false').lower() == 'true'
+    MICRO_BATCH_WINDOW_MS = float(os.environ.get('MICRO_BATCH_WINDOW_MS', 2))
+    MICRO_BATCH_MAX_SIZE = int(os.environ.get('MICRO_BATCH_MAX_SIZE', 64))
+    
+    # Shadow scoring: a candidate model (pickled model + vectorizer) also scores a sampled
+    # fraction of /api/predict and /api/batch-predict requests in a background thread, off the
+    # response path, within a CPU budget (fraction of one core); unset paths disable it
+    SHADOW_MODEL_PATH = os.environ.get('SHADOW_MODEL_PATH')
+    SHADOW_VECTORIZER_PATH = os.environ.get('SHADOW_VECTORIZER_PATH')
+    SHADOW_SAMPLE_RATE = float(os.environ.get('SHADOW_SAMPLE_RATE', 0.05))
+    SHADOW_CPU_BUDGET = float(os.environ.get('SHADOW_CPU_BUDGET', 0.1))
+    SHADOW_MAX_ITEMS = int(os.environ.get('SHADOW_MAX_ITEMS', 64))  # texts per sample (bounds one shadow call)
+    SHADOW_QUEUE_SIZE = int(os.environ.get('SHADOW_QUEUE_SIZE', 64))  # samples waiting; more are dropped
+    # Shadow work only runs while no request is being scored; samples waiting longer are dropped
+    SHADOW_MAX_DELAY_MS = float(os.environ.get('SHADOW_MAX_DELAY_MS', 1000))
+    
+    # Prometheus-style /metrics endpoint (request, error, stage-latency and batch-size metrics)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
     LOG_FILE = os.environ.get('LOG_FILE', 'app.log')
@@ -0,0 +1,36 @@
+"""
+Stateless feature-hashing pipeline.
+
+The TF-IDF vocabulary grows with the training corpus and has to be fitted,
+shipped and loaded before the server can score anything. Feature hashing
+maps each token straight to one of a fixed number of columns instead, so
+there is no vocabulary at all: memory is fixed by n_features and the
+vectorizer itself needs no fitting. IDF weighting is optional and learned
+separately on the hashed counts (a fixed-size vector). Frequent words are not
+dropped by max_df as in the TF-IDF pipeline; IDF down-weights them instead.
+
+The pipeline only references sklearn classes, so a pickled one loads without
+this module.
+"""
+
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
+
+# 2**20 columns keeps collisions rare for a news vocabulary of a few hundred thousand terms
+N_FEATURES = 2 ** 20
+
+
+def make_hashing_vectorizer(n_features=N_FEATURES, use_idf=True):
+    """Hashed term counts, optionally IDF-weighted, L2-normalised like the TF-IDF pipeline"""
+    return Pipeline([
+        ('hash', HashingVectorizer(n_features=n_features, stop_words='english',
+                                   alternate_sign=False, norm=None)),
+        ('tfidf', TfidfTransformer(use_idf=use_idf, norm='l2'))
+    ])
+
+
+def describe(vectorizer):
+    """Short name of a fitted text vectorizer or pipeline, for API responses"""
+    if isinstance(vectorizer, Pipeline):
+        return " + ".join(type(step).__name__ for _, step in vectorizer.steps)
+    return type(vectorizer).__name__
@@ -0,0 +1,92 @@
+"""
+Single-read image ingest for the image endpoints.
+
+An upload is read from the request exactly once into an ImageIngest. The
+header (format, size, mode, EXIF presence) is parsed lazily without decoding
+pixels, and the pixel data is decoded at most once, on first use, and then
+shared by OCR, preprocessing and any other consumer of the same request.
+"""
+
+import io
+import threading
+import time
+
+import metrics
+
+# Pillow is imported where pixels or headers are read, so importing the API does not load it
+
+
+class ImageTooLargeError(Exception):
+    """Raised when an upload exceeds the configured maximum size"""
+
+
+def _has_exif(image):
+    """Whether an image carries EXIF data"""
+    return hasattr(image, '_getexif') and image._getexif() is not None
+
+
+class ImageIngest:
+    """One uploaded image: raw bytes plus lazily parsed header and decoded pixels"""
+
+    def __init__(self, data, filename=None, observe=metrics.observe_stage):
+        self.data = data
+        self.filename = filename
+        # observe(stage, seconds) callback for the decode time (None: not reported)
+        self.observe = observe
+        self.size_bytes = len(data)
+        self._header = None
+        self._image = None
+        self._has_exif = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_upload(cls, file_storage, max_size):
+        """Read an uploaded file once, refusing anything larger than max_size bytes"""
+        data = file_storage.read(max_size + 1)
+        if len(data) > max_size:
+            raise ImageTooLargeError(f"File too large. Maximum size: {max_size / (1024*1024)}MB")
+        return cls(data, getattr(file_storage, 'filename', None))
+
+    def header(self):
+        """PIL image opened for its header only (pixels are not decoded)"""
+        with self._lock:
+            if self._header is None:
+                from PIL import Image
+                self._header = Image.open(io.BytesIO(self.data))
+            return self._header
+
+    def rgb_image(self):
+        """Decoded RGB image, decoded on first call and reused afterwards"""
+        with self._lock:
+            if self._image is None:
+                from PIL import Image
+                started = time.perf_counter()
+                image = Image.open(io.BytesIO(self.data))
+                image.load()
+                # Read EXIF while the source image is loaded, so metadata() never decodes again
+                self._has_exif = _has_exif(image)
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+                self._image = image
+                if self.observe is not None:
+                    self.observe("image_decode", time.perf_counter() - started)
+            return self._image
+
+    def metadata(self):
+        """Format, size, mode and EXIF presence from the header, plus file size"""
+        header = self.header()
+        has_exif = self._has_exif
+        if has_exif is None:
+            # PNG can store EXIF after the pixel data; asking PIL for it would
+            # decode the whole image, so only look at chunks already parsed
+            if header.format == 'PNG':
+                has_exif = 'exif' in header.info
+            else:
+                has_exif = _has_exif(header)
+        return {
+            "format": header.format,
+            "size": header.size,  # (width, height)
+            "mode": header.mode,
+            "has_exif": has_exif,
+            "file_size_kb": round(self.size_bytes / 1024, 2)
+        }
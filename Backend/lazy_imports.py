@@ -0,0 +1,37 @@
+"""
+Optional heavy dependencies, imported on first use.
+
+OpenCV takes tens of milliseconds to import and is only needed once an image
+arrives, so modules check availability with module_available() (no import)
+at startup and call load_cv2() where the pixels are processed.
+"""
+
+import importlib.util
+import threading
+
+_cv2 = None
+_cv2_failed = False
+_lock = threading.Lock()
+
+
+def module_available(name):
+    """Whether a module is installed, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def load_cv2():
+    """The cv2 module, imported on the first call; None if it cannot be imported"""
+    global _cv2, _cv2_failed
+    if _cv2 is None and not _cv2_failed:
+        with _lock:
+            if _cv2 is None and not _cv2_failed:
+                try:
+                    import cv2
+                    _cv2 = cv2
+                except ImportError as e:
+                    print(f"Warning: opencv-python could not be imported: {e}")
+                    _cv2_failed = True
+    return _cv2
@@ -0,0 +1,104 @@
+"""
+Native linear scoring engine for the TF-IDF + PassiveAggressiveClassifier model.
+
+At inference time the deployed model is only a sparse dot product of the
+L2-normalised TF-IDF vector with coef_ plus intercept_. This engine extracts
+the analyzer, vocabulary, IDF vector and weights from the pickled artifacts
+once and scores documents directly, skipping sklearn's per-call input
+validation, dtype checks and sparse matrix construction.
+
+The arithmetic is performed in the same order as sklearn/scipy (counts sorted
+by feature index, IDF scaling, sequential L2 norm, sequential dot product) so
+the predicted labels match model.predict exactly.
+"""
+
+import math
+
+import numpy as np
+
+
+class LinearScorer:
+    """Score documents with the weights of a fitted linear model and TF-IDF vectorizer"""
+
+    def __init__(self, analyzer, vocabulary, idf, coef, intercept, classes, sublinear_tf=False, binary=False):
+        self.analyzer = analyzer
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.coef = coef
+        self.intercept = intercept
+        self.classes = classes
+        self.sublinear_tf = sublinear_tf
+        self.binary = binary
+
+    @classmethod
+    def from_artifacts(cls, model, vectorizer):
+        """Extract everything needed for scoring from a fitted model and vectorizer"""
+        coef = np.asarray(model.coef_, dtype=np.float64)
+        if coef.shape[0] != 1 or len(model.classes_) != 2:
+            raise ValueError("Native scoring only supports binary linear classifiers")
+        if getattr(vectorizer, 'norm', None) != 'l2':
+            raise ValueError("Native scoring only supports L2-normalised vectors")
+
+        # Arrays are kept as they are (possibly memory-mapped) and gathered per document
+        if getattr(vectorizer, 'use_idf', False):
+            idf = np.asarray(vectorizer.idf_, dtype=np.float64)
+        else:
+            idf = None
+
+        return cls(
+            analyzer=vectorizer.build_analyzer(),
+            vocabulary=vectorizer.vocabulary_,
+            idf=idf,
+            coef=coef[0],
+            intercept=float(model.intercept_[0]),
+            classes=tuple(model.classes_),
+            sublinear_tf=getattr(vectorizer, 'sublinear_tf', False),
+            binary=getattr(vectorizer, 'binary', False)
+        )
+
+    def decision_score(self, text):
+        """Signed distance of one document from the decision boundary"""
+        vocabulary = self.vocabulary
+        counts = {}
+        for token in self.analyzer(text):
+            index = vocabulary.get(token)
+            if index is not None:
+                counts[index] = counts.get(index, 0) + 1
+
+        if not counts:
+            return 0.0 + self.intercept
+
+        indices = sorted(counts)
+        if self.binary:
+            values = [1.0] * len(indices)
+        else:
+            values = [float(counts[index]) for index in indices]
+        if self.sublinear_tf:
+            values = [math.log(value) + 1.0 for value in values]
+        if self.idf is not None:
+            idf = self.idf[indices].tolist()
+            values = [value * weight for value, weight in zip(values, idf)]
+
+        # L2 normalisation, accumulated in feature order like sklearn
+        norm = 0.0
+        for value in values:
+            norm += value * value
+        if norm != 0.0:
+            norm = math.sqrt(norm)
+            values = [value / norm for value in values]
+
+        # Sparse dot product, accumulated in feature order like scipy's csr matvec
+        coef = self.coef[indices].tolist()
+        score = 0.0
+        for value, weight in zip(values, coef):
+            score += value * weight
+        return score + self.intercept
+
+    def decision_function(self, texts):
+        """Decision scores for a list of documents"""
+        return [self.decision_score(text) for text in texts]
+
+    def predict(self, texts):
+        """Predict labels for a list of documents"""
+        negative, positive = self.classes
+        return [positive if self.decision_score(text) > 0 else negative for text in texts]
@@ -0,0 +1,164 @@
+"""
+Prometheus-style metrics for the API.
+
+Counters and histograms live at module level, like the per-stage timings
+in image_preprocess.py, so any module can record into them. Recording a
+sample costs a dict lookup, a bisect over the bucket bounds and a short
+lock, which keeps it cheap enough to leave on at full load. render()
+writes everything in the Prometheus text exposition format (0.0.4);
+values that already live elsewhere (cache counters, model version) are
+passed in at scrape time as gauge or counter families.
+"""
+
+import threading
+
+from perf_stats import Histogram
+
+# Seconds, from sub-millisecond model calls to multi-second OCR
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Items per batch
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+# Set from config at startup (METRICS_ENABLED); recording is a no-op when False
+enabled = True
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == float('inf'):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter per combination of label values"""
+
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        if not enabled:
+            return
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels=()):
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def render(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines.extend(f"{self.name}{_labels(self.label_names, labels)} {_number(value)}" for labels, value in values)
+        return lines
+
+
+class HistogramFamily:
+    """One perf_stats.Histogram per combination of label values, sharing bucket bounds"""
+
+    def __init__(self, name, help_text, label_names=(), bounds=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self.bounds = tuple(bounds)
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, labels=()):
+        """The histogram for a combination of label values, created on first use"""
+        histogram = self._histograms.get(labels)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(labels, Histogram(self.bounds))
+        return histogram
+
+    def observe(self, labels, value):
+        if enabled:
+            self.histogram(labels).observe(value)
+
+    def render(self):
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, histogram in histograms:
+            cumulative = histogram.cumulative()
+            for bound, count in cumulative:
+                le = 'le="' + _number(float(bound)) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, labels, le)} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {_number(histogram.total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative[-1][1]}")
+        return lines
+
+
+requests_total = Counter(
+    'fakenews_http_requests_total', 'HTTP requests by endpoint, method and status code',
+    ('endpoint', 'method', 'status'))
+errors_total = Counter(
+    'fakenews_http_errors_total', 'HTTP responses with a 4xx or 5xx status code, by endpoint',
+    ('endpoint', 'status'))
+request_seconds = HistogramFamily(
+    'fakenews_http_request_duration_seconds', 'Time to build the response, by endpoint', ('endpoint',))
+stage_seconds = HistogramFamily(
+    'fakenews_stage_duration_seconds',
+    'Time per processing stage (json_parse, vectorize, predict, image_decode, preprocess, text_check, ocr, metadata)',
+    ('stage',))
+batch_size = HistogramFamily(
+    'fakenews_batch_size', 'Items per batch (batch_predict, stream_chunk, batch_image, micro_batch)',
+    ('source',), SIZE_BUCKETS)
+
+FAMILIES = (requests_total, errors_total, request_seconds, stage_seconds, batch_size)
+
+
+def observe_stage(stage, seconds):
+    """Record the duration of one processing stage"""
+    if enabled:
+        stage_seconds.histogram((stage,)).observe(seconds)
+
+
+def observe_batch(source, size):
+    """Record the number of items in one batch"""
+    if enabled:
+        batch_size.histogram((source,)).observe(size)
+
+
+def record_request(endpoint, method, status, seconds):
+    """Count a finished request and its duration"""
+    if not enabled:
+        return
+    requests_total.inc((endpoint, method, str(status)))
+    if status >= 400:
+        errors_total.inc((endpoint, str(status)))
+    request_seconds.histogram((endpoint,)).observe(seconds)
+
+
+def render(collected=()):
+    """Exposition text for every recorded family plus collected (name, type, help, [(labels dict, value)])"""
+    lines = []
+    for family in FAMILIES:
+        lines.extend(family.render())
+    for name, kind, help_text, samples in collected:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            if value is None:
+                continue
+            lines.append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {_number(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,116 @@
+"""
+Micro-batching scheduler for single-article predictions.
+
+Concurrent /api/predict calls are queued and coalesced: the first request to
+arrive opens a window of a few milliseconds, every request arriving within it
+(up to a maximum batch size) is scored together as one sparse matrix, and the
+results are fanned back out to the waiting request threads.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from perf_stats import RollingStats
+
+
+class MicroBatcher:
+    """Collect texts arriving within a short window and score them in one call"""
+    
+    def __init__(self, predict_fn, window_ms=2.0, max_batch_size=64):
+        self.predict_fn = predict_fn
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(1, int(max_batch_size))
+        
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        
+        # Tuning metrics
+        self.batch_sizes = RollingStats()
+        self.queue_wait = RollingStats()
+        self.predict_time = RollingStats()
+        self.batches = 0
+        self.items = 0
+    
+    def _ensure_started(self):
+        """Start the scheduler thread on first use"""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+                self._thread.start()
+    
+    def submit(self, text):
+        """Queue a text for scoring and return a Future resolving to its label"""
+        self._ensure_started()
+        future = Future()
+        self._queue.put((text, future, time.perf_counter()))
+        return future
+    
+    def predict(self, text, timeout=None):
+        """Score a single text through the batcher and block until it is done"""
+        return self.submit(text).result(timeout=timeout)
+    
+    def _collect(self):
+        """Block for the first item, then gather more until the window closes or the batch is full"""
+        batch = [self._queue.get()]
+        deadline = batch[0][2] + self.window
+        
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        # Take whatever is already waiting without extending the window
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        return batch
+    
+    def _run(self):
+        """Scheduler loop: collect a batch, score it, resolve the futures"""
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+            
+            for _, _, enqueued in batch:
+                self.queue_wait.add(started - enqueued)
+            self.batch_sizes.add(len(batch))
+            self.batches += 1
+            self.items += len(batch)
+            
+            try:
+                predictions = self.predict_fn([text for text, _, _ in batch])
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            finally:
+                self.predict_time.add(time.perf_counter() - started)
+            
+            for (_, future, _), prediction in zip(batch, predictions):
+                future.set_result(prediction)
+    
+    def stats(self):
+        """Batch-size and queue-wait metrics for tuning the window"""
+        return {
+            "enabled": True,
+            "window_ms": self.window * 1000.0,
+            "max_batch_size": self.max_batch_size,
+            "batches": self.batches,
+            "items": self.items,
+            "queue_depth": self._queue.qsize(),
+            "batch_size": self.batch_sizes.summary(digits=2),
+            "queue_wait_ms": self.queue_wait.summary(scale=1000.0),
+            "predict_ms": self.predict_time.summary(scale=1000.0)
+        }
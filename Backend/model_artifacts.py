@@ -0,0 +1,178 @@
+"""
+Memory-mapped model artifacts.
+
+Unpickling finalized_model.pkl and tfidf_vectorizer.pkl gives every worker
+process its own copy of the vocabulary dict, IDF vector and coefficients.
+This format stores them as flat files in one directory instead:
+
+    manifest.json      format version, estimator parameters, classes, intercept
+    coef.npy           float64 weights, one per feature
+    idf.npy            float64 inverse document frequencies (when use_idf)
+    vocab_terms.bin    terms, offsets and hash slots of the vocabulary,
+    vocab_offsets.npy  mapped as a CompactVocabulary (see compact_vocabulary.py)
+    vocab_slots.npy
+
+Everything is opened read-only with mmap, so all workers on a host share one
+set of physical pages through the page cache and loading costs a few page
+faults rather than rebuilding Python objects. load_artifacts() returns a
+regular TfidfVectorizer and linear classifier whose arrays are views of the
+mapped files, so the rest of the app uses them unchanged.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+
+import numpy as np
+from sklearn import linear_model
+from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
+
+from compact_vocabulary import CompactVocabulary, build_buffers, hot_indices
+
+FORMAT_VERSION = 1
+
+MANIFEST = 'manifest.json'
+ARRAY_FILES = ('coef.npy', 'idf.npy', 'vocab_offsets.npy', 'vocab_slots.npy')
+TERMS_FILE = 'vocab_terms.bin'
+
+# Vectorizer parameters that cannot be stored (callables) must be left at their defaults
+_CALLABLE_PARAMS = ('preprocessor', 'tokenizer', 'analyzer')
+
+
+def _jsonable_params(params):
+    """Estimator parameters as JSON values"""
+    result = {}
+    for name, value in params.items():
+        if isinstance(value, type):
+            value = np.dtype(value).name
+        elif isinstance(value, tuple):
+            value = list(value)
+        elif isinstance(value, (frozenset, set)):
+            value = sorted(value)
+        result[name] = value
+    return result
+
+
+def export_artifacts(model, vectorizer, directory):
+    """Write a fitted linear model and TF-IDF vectorizer in the memory-mapped format; returns the paths written"""
+    vectorizer_params = vectorizer.get_params()
+    for name in _CALLABLE_PARAMS:
+        if callable(vectorizer_params.get(name)):
+            raise ValueError(f"Cannot export a vectorizer with a custom {name}")
+    vectorizer_params['vocabulary'] = None
+
+    coef = np.asarray(model.coef_, dtype=np.float64)
+    if coef.shape[0] != 1 or len(model.classes_) != 2:
+        raise ValueError("Only binary linear classifiers can be exported")
+
+    terms, offsets, slots = build_buffers(vectorizer.vocabulary_)
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+
+    # Each file is written beside its target and renamed into place: a running server keeps
+    # its maps of the old files (truncating a mapped file in place would crash it), and
+    # the manifest, written last, switches a watching server to the new set
+    def replace_with(path, write, mode='wb'):
+        temporary = path + '.tmp'
+        with open(temporary, mode) as f:
+            write(f)
+        os.replace(temporary, path)
+        paths.append(path)
+
+    def save(name, array):
+        replace_with(os.path.join(directory, name), lambda f: np.save(f, np.ascontiguousarray(array)))
+
+    save('coef.npy', coef[0])
+    idf = getattr(vectorizer, 'idf_', None) if vectorizer.use_idf else None
+    save('idf.npy', np.asarray(idf if idf is not None else [], dtype=np.float64))
+    save('vocab_offsets.npy', offsets)
+    save('vocab_slots.npy', slots)
+
+    replace_with(os.path.join(directory, TERMS_FILE), lambda f: f.write(terms))
+
+    # The manifest carries a digest of the data files, so hashing it identifies the whole set
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "content_sha256": digest.hexdigest(),
+        "model": {
+            "class": type(model).__name__,
+            "params": _jsonable_params(model.get_params()),
+            "classes": [str(label) for label in model.classes_],
+            "intercept": float(model.intercept_[0])
+        },
+        "vectorizer": {
+            "params": _jsonable_params(vectorizer_params),
+            "n_features": len(offsets) - 1
+        }
+    }
+    replace_with(os.path.join(directory, MANIFEST), lambda f: json.dump(manifest, f, indent=2), mode='w')
+    return paths
+
+
+def manifest_path(directory):
+    """Path of the manifest, which identifies an exported artifact set"""
+    return os.path.join(directory, MANIFEST)
+
+
+def _map_file(path):
+    """Read-only memory map of a whole file (empty files map to empty bytes)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def load_artifacts(directory, hot_size=0):
+    """Load an exported model and vectorizer backed by read-only memory maps; returns (model, vectorizer)
+
+    hot_size most frequent terms are also kept in a small per-process dict
+    for faster lookups (see compact_vocabulary.py).
+    """
+    with open(manifest_path(directory)) as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported artifact format version: {manifest.get('format_version')}")
+
+    arrays = {name: np.load(os.path.join(directory, name), mmap_mode='r') for name in ARRAY_FILES}
+    n_features = manifest["vectorizer"]["n_features"]
+    if arrays['coef.npy'].shape != (n_features,) or len(arrays['vocab_offsets.npy']) != n_features + 1:
+        raise ValueError("Artifact arrays do not match the manifest")
+
+    # Vectorizer: parameters from the manifest, vocabulary and IDF from the mapped files
+    params = dict(manifest["vectorizer"]["params"])
+    params['dtype'] = np.dtype(params['dtype']).type
+    params['ngram_range'] = tuple(params['ngram_range'])
+    vectorizer = TfidfVectorizer(**params)
+    vectorizer.vocabulary_ = CompactVocabulary(
+        _map_file(os.path.join(directory, TERMS_FILE)),
+        arrays['vocab_offsets.npy'],
+        arrays['vocab_slots.npy'],
+        hot_indices(arrays['idf.npy'] if params.get('use_idf', True) else None, hot_size)
+    )
+    vectorizer.fixed_vocabulary_ = False
+    vectorizer._tfidf = TfidfTransformer(
+        norm=vectorizer.norm,
+        use_idf=vectorizer.use_idf,
+        smooth_idf=vectorizer.smooth_idf,
+        sublinear_tf=vectorizer.sublinear_tf
+    )
+    if vectorizer.use_idf:
+        vectorizer._tfidf.idf_ = arrays['idf.npy']
+    vectorizer._tfidf.n_features_in_ = n_features
+
+    # Classifier: same estimator class and parameters, weights from the mapped file
+    spec = manifest["model"]
+    model = getattr(linear_model, spec["class"])(**spec["params"])
+    model.coef_ = arrays['coef.npy'].reshape(1, -1)
+    model.intercept_ = np.array([spec["intercept"]])
+    model.classes_ = np.array(spec["classes"], dtype=object)
+    model.n_features_in_ = n_features
+    return model, vectorizer
@@ -0,0 +1,165 @@
+"""
+Versioned model bundles with an atomic hot swap.
+
+A ModelBundle holds everything a request needs to score text (model,
+vectorizer and the optional native scorer) together with the version hash
+of the artifact files it was loaded from. Requests acquire the current
+bundle from the ModelRegistry and use that same bundle until they finish,
+so swapping in a reloaded bundle can never hand a request a model from one
+version and a vectorizer from another. A replaced bundle stays alive while
+requests still hold it and is released when the last of them finishes.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class ModelBundle:
+    """A model, its vectorizer and scorer, and the version of the files they came from"""
+
+    def __init__(self, model, vectorizer, version, scorer=None, load_ms=None, observe=None):
+        self.model = model
+        self.vectorizer = vectorizer
+        self.scorer = scorer
+        self.version = version
+        self.load_ms = load_ms
+        # Optional observe(stage, seconds) callback for the vectorize and predict timings
+        self.observe = observe
+        self.loaded_at = time.time()
+        # Requests currently using this bundle (guarded by the registry lock)
+        self.in_flight = 0
+
+    @property
+    def engine(self):
+        return "native" if self.scorer is not None else "sklearn"
+
+    def score(self, texts):
+        """Classify a list of texts without reporting timings (warm-up and validation)"""
+        if self.scorer is not None:
+            return self.scorer.predict(texts)
+        return self.model.predict(self.vectorizer.transform(texts))
+
+    def predict(self, texts):
+        """Vectorize and classify a list of texts with one transform and one predict call"""
+        if self.observe is None:
+            return self.score(texts)
+
+        # The native scorer vectorizes and scores in one pass, timed as predict
+        started = time.perf_counter()
+        if self.scorer is not None:
+            predictions = self.scorer.predict(texts)
+        else:
+            features = self.vectorizer.transform(texts)
+            vectorized = time.perf_counter()
+            self.observe("vectorize", vectorized - started)
+            predictions = self.model.predict(features)
+            started = vectorized
+        self.observe("predict", time.perf_counter() - started)
+        return predictions
+
+    def release(self):
+        """Drop the artifacts so their memory is freed even if the bundle object is still referenced"""
+        self.model = None
+        self.vectorizer = None
+        self.scorer = None
+
+    def describe(self):
+        return {
+            "version": self.version,
+            "engine": self.engine,
+            "loaded_at": round(self.loaded_at, 3),
+            "load_ms": self.load_ms,
+            "in_flight": self.in_flight
+        }
+
+
+class ModelRegistry:
+    """Holds the current bundle; swaps are atomic and replaced bundles are released once idle"""
+
+    def __init__(self):
+        self._current = None
+        self._retired = []
+        self._lock = threading.Lock()
+        # Requests using any bundle, and an event set while there are none (background work waits on it)
+        self._in_flight = 0
+        self.idle = threading.Event()
+        self.idle.set()
+
+        self.swaps = 0
+        self.released = 0
+        self.failures = 0
+        self.last_error = None
+
+    @property
+    def current(self):
+        """The bundle new requests get (None before the first load)"""
+        return self._current
+
+    def acquire(self):
+        """Current bundle, held until release(); None if nothing is loaded"""
+        with self._lock:
+            bundle = self._current
+            if bundle is not None:
+                bundle.in_flight += 1
+                self._in_flight += 1
+                self.idle.clear()
+        return bundle
+
+    def release(self, bundle):
+        """Finish using a bundle from acquire(); frees it if it was replaced and this was its last user"""
+        if bundle is None:
+            return
+        with self._lock:
+            bundle.in_flight -= 1
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self.idle.set()
+            idle = bundle.in_flight == 0 and bundle in self._retired
+            if idle:
+                self._retired.remove(bundle)
+                self.released += 1
+        if idle:
+            bundle.release()
+
+    @contextmanager
+    def use(self):
+        """Context manager around acquire() / release()"""
+        bundle = self.acquire()
+        try:
+            yield bundle
+        finally:
+            self.release(bundle)
+
+    def swap(self, bundle):
+        """Make bundle current for every new request; returns the bundle it replaced"""
+        with self._lock:
+            previous = self._current
+            self._current = bundle
+            self.swaps += 1
+            idle = previous is not None and previous.in_flight == 0
+            if idle:
+                self.released += 1
+            elif previous is not None:
+                self._retired.append(previous)
+        if idle:
+            previous.release()
+        return previous
+
+    def record_failure(self, error):
+        """Count a reload that was rejected (the current bundle keeps serving)"""
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)
+
+    def stats(self):
+        """Current bundle, replaced bundles still serving requests, swap, release and failure counts"""
+        with self._lock:
+            return {
+                "current": self._current.describe() if self._current is not None else None,
+                "draining": [bundle.describe() for bundle in self._retired],
+                "swaps": self.swaps,
+                "released": self.released,
+                "failed_reloads": self.failures,
+                "last_error": self.last_error
+            }
@@ -0,0 +1,171 @@
+"""
+Near-duplicate article detection with MinHash and locality-sensitive hashing.
+
+Syndicated articles are often reposted with a changed headline, a byline or
+tracking junk appended. Their exact content hash differs, but the sets of
+word shingles they contain overlap almost entirely, so a verdict already
+computed for the original can be reused without running the model.
+
+Each article is reduced to a MinHash signature of its 3-word shingles. The
+signature is split into bands; every band hashes into a fixed-size table
+that points at the slot of the last article with that band value. A lookup
+reads one table cell per band and verifies the few candidates by comparing
+their stored (8-bit truncated) signatures, which estimates Jaccard
+similarity. Everything lives in preallocated NumPy arrays sized by the
+capacity, so memory is bounded and lookups stay well under a millisecond no
+matter how many fingerprints are stored.
+"""
+
+import re
+import threading
+
+import numpy as np
+
+_MASK = (1 << 64) - 1
+_WORD_RE = re.compile(r"\w+")
+_SEED = 20
+
+
+def shingle_hashes(text, shingle_size=3, min_words=20):
+    """Unique 64-bit hashes of the word shingles in text, or None if text is too short"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < min_words:
+        return None
+
+    # Python's string hash is randomised per process, which is fine for an
+    # in-process index and several times faster than a cryptographic hash
+    shingles = {" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+    return np.fromiter((hash(shingle) & _MASK for shingle in shingles), dtype=np.uint64, count=len(shingles))
+
+
+class NearDuplicateIndex:
+    """Reuse verdicts of previously scored articles whose shingle sets nearly match"""
+
+    def __init__(self, capacity=500000, threshold=0.8, num_perm=64, bands=16, min_words=20, model_version=None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.capacity = max(1, int(capacity))
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.min_words = min_words
+        self.model_version = model_version
+
+        # Multiply-shift hash family: h(x) = (a * x + b) mod 2^64, top 32 bits
+        rng = np.random.RandomState(_SEED)
+        self._a = (rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._b = rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64)
+        self._band_mult = (rng.randint(0, 1 << 62, size=self.rows, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+
+        # One table per band, each cell holds the slot of the last article hashed there
+        self._tables = np.full((bands, self.capacity), -1, dtype=np.int32)
+        self._band_index = np.arange(bands)
+        # Ring buffer of 8-bit truncated signatures and verdicts
+        self._signatures = np.zeros((self.capacity, num_perm), dtype=np.uint8)
+        self._values = [None] * self.capacity
+        self._next_slot = 0
+        self.size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ensure_version(self, model_version):
+        """Forget every fingerprint if the model version changed"""
+        if model_version != self.model_version:
+            self.clear()
+            self.model_version = model_version
+
+    def fingerprint(self, text):
+        """MinHash signature of an article, or None if it is too short to fingerprint reliably"""
+        hashes = shingle_hashes(text, min_words=self.min_words)
+        if hashes is None:
+            return None
+        with np.errstate(over='ignore'):
+            permuted = hashes[None, :] * self._a[:, None] + self._b[:, None]
+        return (permuted >> np.uint64(32)).min(axis=1)
+
+    def _cells(self, signature):
+        """Table cell of each band of a signature"""
+        with np.errstate(over='ignore'):
+            band_keys = (signature.reshape(self.bands, self.rows) * self._band_mult).sum(axis=1)
+        return (band_keys % np.uint64(self.capacity)).astype(np.int64)
+
+    def _similarity(self, truncated, candidates):
+        """Estimated Jaccard similarity from 8-bit truncated signatures"""
+        matches = (self._signatures[candidates] == truncated).mean(axis=1)
+        return (matches - 1.0 / 256) / (1.0 - 1.0 / 256)
+
+    def lookup(self, signature):
+        """Verdict of the most similar stored article above the threshold, or None"""
+        if signature is None:
+            return None
+
+        cells = self._cells(signature)
+        truncated = signature.astype(np.uint8)
+        with self._lock:
+            candidates = np.unique(self._tables[self._band_index, cells])
+            candidates = candidates[candidates >= 0]
+            best = None
+            if len(candidates):
+                similarity = self._similarity(truncated, candidates)
+                top = int(np.argmax(similarity))
+                if similarity[top] >= self.threshold:
+                    best = self._values[candidates[top]]
+
+            if best is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return best
+
+    def add(self, signature, verdict):
+        """Remember the verdict of a scored article, overwriting the oldest when full"""
+        if signature is None:
+            return
+
+        cells = self._cells(signature)
+        with self._lock:
+            slot = self._next_slot
+            self._next_slot = (slot + 1) % self.capacity
+            if self._values[slot] is not None:
+                self.evictions += 1
+            else:
+                self.size += 1
+
+            # Stale table cells that still point at a reused slot are filtered
+            # out by the signature comparison in lookup()
+            self._signatures[slot] = signature.astype(np.uint8)
+            self._values[slot] = verdict
+            self._tables[self._band_index, cells] = slot
+
+    def clear(self):
+        """Remove every fingerprint"""
+        with self._lock:
+            self._tables.fill(-1)
+            self._values = [None] * self.capacity
+            self._next_slot = 0
+            self.size = 0
+
+    def memory_bytes(self):
+        """Memory held by the band tables, signatures and verdict slots"""
+        return self._tables.nbytes + self._signatures.nbytes + 8 * self.capacity
+
+    def stats(self):
+        """Index size, memory and hit-rate metrics"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": True,
+            "model_version": self.model_version,
+            "size": self.size,
+            "capacity": self.capacity,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "memory_mb": round(self.memory_bytes() / (1024 * 1024), 2)
+        }
@@ -0,0 +1,187 @@
+"""
+OCR engine layer.
+
+pytesseract.image_to_string writes the image to a temp file and spawns a new
+`tesseract` process for every call, which reloads the language data each
+time. When the tesserocr binding is installed, TesserocrEngine keeps a pool
+of long-lived, already initialised Tesseract instances in-process instead;
+images are dispatched to whichever instance is free. tesserocr releases the
+GIL while recognising, so the pool runs in parallel across request threads
+without the cost of extra processes.
+
+PytesseractEngine wraps the original subprocess-per-call path and is used as
+a fallback when tesserocr is not available.
+"""
+
+import queue
+import threading
+import time
+
+from lazy_imports import module_available
+from perf_stats import RollingStats
+
+# pytesseract is imported when its engine is created, not when the server starts
+PYTESSERACT_AVAILABLE = module_available('pytesseract')
+pytesseract = None
+
+# tesserocr is imported here, on the main thread: its cysignals dependency installs signal
+# handlers on import, which raises ValueError on any other thread (request, worker or the
+# BACKGROUND_LOADING startup thread). Instances can then be created on any thread.
+TESSEROCR_AVAILABLE = module_available('tesserocr')
+tesserocr = None
+if TESSEROCR_AVAILABLE:
+    try:
+        import tesserocr
+    except Exception as e:
+        print(f"Warning: tesserocr could not be imported: {e}")
+        TESSEROCR_AVAILABLE = False
+
+
+class TesseractNotFoundError(Exception):
+    """Raised when no Tesseract installation can be used"""
+
+
+class OCREngine:
+    """Common timing and counters for OCR backends"""
+
+    name = "none"
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = RollingStats()
+        self._lock = threading.Lock()
+
+    def image_to_string(self, image):
+        """Extract text from a PIL image"""
+        started = time.perf_counter()
+        try:
+            return self._recognize(image)
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            self.latency.add(time.perf_counter() - started)
+            with self._lock:
+                self.calls += 1
+
+    def _recognize(self, image):
+        raise NotImplementedError
+
+    def version(self):
+        """Version string of the underlying Tesseract"""
+        raise NotImplementedError
+
+    def stats(self):
+        """Engine name, call counters and latency"""
+        return {
+            "engine": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_ms": self.latency.summary(scale=1000.0)
+        }
+
+
+class PytesseractEngine(OCREngine):
+    """Original path: one tesseract subprocess per image"""
+
+    name = "pytesseract"
+
+    def __init__(self, lang='eng'):
+        global pytesseract
+        import pytesseract
+        super().__init__()
+        self.lang = lang
+
+    def _recognize(self, image):
+        try:
+            return pytesseract.image_to_string(image, lang=self.lang)
+        except pytesseract.TesseractNotFoundError as e:
+            raise TesseractNotFoundError(str(e))
+
+    def version(self):
+        try:
+            return str(pytesseract.get_tesseract_version())
+        except pytesseract.TesseractNotFoundError as e:
+            raise TesseractNotFoundError(str(e))
+
+
+class TesserocrEngine(OCREngine):
+    """Pool of persistent in-process Tesseract instances (tesserocr binding)"""
+
+    name = "tesserocr"
+
+    def __init__(self, pool_size=2, lang='eng'):
+        if tesserocr is None:
+            raise ImportError("tesserocr is not installed or failed to import")
+        super().__init__()
+        self.pool_size = max(1, int(pool_size))
+        self.lang = lang
+        self._pool = queue.Queue()
+        self._created = 0
+        self._create_lock = threading.Lock()
+
+        # Fail fast if Tesseract or its language data cannot be loaded
+        self._pool.put(self._new_instance())
+
+    def _new_instance(self):
+        try:
+            api = tesserocr.PyTessBaseAPI(lang=self.lang)
+        except RuntimeError as e:
+            raise TesseractNotFoundError(f"Failed to initialise Tesseract: {e}")
+        self._created += 1
+        return api
+
+    def _acquire(self):
+        """Take an idle instance, growing the pool lazily up to pool_size"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._create_lock:
+            if self._created < self.pool_size:
+                return self._new_instance()
+        return self._pool.get()
+
+    def _recognize(self, image):
+        api = self._acquire()
+        try:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+        finally:
+            api.Clear()
+            self._pool.put(api)
+
+    def version(self):
+        return tesserocr.tesseract_version().splitlines()[0]
+
+    def stats(self):
+        stats = super().stats()
+        stats["pool_size"] = self.pool_size
+        stats["instances"] = self._created
+        stats["idle"] = self._pool.qsize()
+        return stats
+
+
+def create_ocr_engine(engine='auto', pool_size=2, lang='eng'):
+    """Pick the best available OCR engine, or None if OCR is unavailable"""
+    if engine in ('auto', 'tesserocr') and TESSEROCR_AVAILABLE:
+        # The pool is an optional accelerator: whatever stops it from starting, OCR falls back
+        try:
+            return TesserocrEngine(pool_size=pool_size, lang=lang)
+        except Exception as e:
+            print(f"Warning: tesserocr unavailable, falling back to pytesseract: {type(e).__name__}: {e}")
+    if engine in ('auto', 'tesserocr', 'pytesseract') and PYTESSERACT_AVAILABLE:
+        try:
+            return PytesseractEngine(lang=lang)
+        except ImportError as e:
+            print(f"Warning: pytesseract could not be imported: {e}")
+    return None
+
+
+def engine_available(engine='auto'):
+    """Whether create_ocr_engine() can return an engine, without creating one"""
+    if engine in ('auto', 'tesserocr') and TESSEROCR_AVAILABLE:
+        return True
+    return engine in ('auto', 'tesserocr', 'pytesseract') and PYTESSERACT_AVAILABLE
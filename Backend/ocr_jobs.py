@@ -0,0 +1,163 @@
+"""
+Asynchronous job queue for image analysis.
+
+OCR can take seconds for a large screenshot. In async mode /api/predict-image
+hands the upload to this queue and returns a job id straight away; a bounded
+pool of worker threads runs OCR + prediction and clients poll (or long-poll)
+/api/jobs/<job_id> for the result. When the queue is full new jobs are
+rejected immediately instead of piling up.
+"""
+
+import queue
+import threading
+import time
+import uuid
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue has reached its maximum depth"""
+
+
+class Job:
+    """One queued image analysis with its per-stage timings"""
+
+    def __init__(self, payload):
+        self.id = uuid.uuid4().hex
+        self.payload = payload
+        self.status = "queued"
+        self.result = None
+        self.status_code = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        self.timings = {}
+        self._enqueued = time.perf_counter()
+        self._done = threading.Event()
+
+    def wait(self, timeout):
+        """Block until the job has finished or the timeout expires"""
+        return self._done.wait(timeout)
+
+    def to_dict(self):
+        """JSON-serialisable job status"""
+        job = {
+            "job_id": self.id,
+            "status": self.status,
+            "timings_ms": self.timings
+        }
+        if self.status == "done":
+            job["status_code"] = self.status_code
+            job["result"] = self.result
+        elif self.status == "failed":
+            job["error"] = self.error
+        return job
+
+
+class OCRJobQueue:
+    """Bounded queue of image jobs processed by a fixed pool of worker threads"""
+
+    def __init__(self, process_fn, workers=2, max_depth=32, result_ttl=600):
+        self.process_fn = process_fn
+        self.workers = max(1, int(workers))
+        self.max_depth = max(1, int(max_depth))
+        self.result_ttl = result_ttl
+
+        self._queue = queue.Queue(maxsize=self.max_depth)
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._threads = []
+
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        """Start the worker threads on first use"""
+        with self._lock:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"ocr-worker-{number}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, payload):
+        """Queue a job and return it, or raise QueueFullError"""
+        self._ensure_started()
+        self._purge_expired()
+
+        job = Job(payload)
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.id]
+                self.rejected += 1
+            raise QueueFullError(f"Image queue is full ({self.max_depth} jobs waiting)")
+
+        with self._lock:
+            self.submitted += 1
+        return job
+
+    def get(self, job_id):
+        """Look up a job by id (None once its result has expired)"""
+        self._purge_expired()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self):
+        """Worker loop: take a job, process it, record the outcome"""
+        while True:
+            try:
+                job = self._queue.get(timeout=max(1, self.result_ttl))
+            except queue.Empty:
+                # Idle: drop results nobody came back for
+                self._purge_expired()
+                continue
+            job.status = "running"
+            job.timings["queued"] = round((time.perf_counter() - job._enqueued) * 1000.0, 2)
+            # Release the image bytes as soon as the worker owns them
+            payload = job.payload
+            job.payload = None
+
+            try:
+                job.result, job.status_code = self.process_fn(payload, job.timings)
+                job.status = "done"
+                with self._lock:
+                    self.completed += 1
+            except Exception as e:
+                job.error = str(e)
+                job.status = "failed"
+                with self._lock:
+                    self.failed += 1
+            finally:
+                job.timings["total"] = round((time.perf_counter() - job._enqueued) * 1000.0, 2)
+                job.finished = time.time()
+                job._done.set()
+
+    def _purge_expired(self):
+        """Forget finished jobs whose results are older than the TTL"""
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished is not None and job.finished < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def stats(self):
+        """Queue depth and job counters"""
+        with self._lock:
+            return {
+                "enabled": True,
+                "workers": self.workers,
+                "max_depth": self.max_depth,
+                "queue_depth": self._queue.qsize(),
+                "tracked_jobs": len(self._jobs),
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "failed": self.failed
+            }
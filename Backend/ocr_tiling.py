@@ -0,0 +1,120 @@
+"""
+Tiled OCR for very tall images.
+
+Long scrolling screenshots are the slowest case for OCR: a single Tesseract
+run works through the whole image on one core. Above a configurable height
+the image is cut into horizontal strips that overlap by a margin, the strips
+are recognised in parallel, and the texts are stitched back together. A text
+line cut by a strip boundary is fully contained in one of the two strips
+thanks to the overlap; the lines read twice are found by aligning the tail of
+one strip's text with the head of the next and kept once.
+"""
+
+import re
+import time
+
+from perf_stats import RollingStats
+
+# Wall time of tiled OCR and the summed time of its strips, across all requests
+tiled_wall_time = RollingStats()
+strip_time_total = RollingStats()
+
+
+def strip_boxes(height, width, strip_height, overlap):
+    """Crop boxes (left, top, right, bottom) of overlapping horizontal strips"""
+    strip_height = max(1, int(strip_height))
+    overlap = max(0, min(int(overlap), strip_height - 1))
+    boxes = []
+    top = 0
+    while True:
+        bottom = min(height, top + strip_height)
+        boxes.append((0, top, width, bottom))
+        if bottom >= height:
+            return boxes
+        top = bottom - overlap
+
+
+def _normalise_line(line):
+    """Line reduced to lowercase words, for comparing overlapping reads"""
+    return " ".join(re.findall(r"\w+", line.lower()))
+
+
+def _seam_overlap(tail, head, slack):
+    """(tail index, head index) where the lines read by both strips start, or None
+
+    The overlap is a run of equal lines that ends at the end of the tail and starts at
+    the start of the head, give or take `slack` lines cut by a strip edge (missing or
+    partly read in one of the strips). Short lines repeat in a thread ("Like",
+    "Reply"), so a run anywhere else is never taken for the overlap; the longest run
+    wins, and among equally long ones the one nearest the seam.
+    """
+    best = None
+    for a in range(len(tail)):
+        for b in range(len(head)):
+            if not tail[a] or tail[a] != head[b]:
+                continue
+            size = 1
+            while a + size < len(tail) and b + size < len(head) and tail[a + size] == head[b + size]:
+                size += 1
+            after, before = len(tail) - (a + size), b
+            if after > slack or before > slack:
+                continue
+            key = (size, -(after + before))
+            if best is None or key > best[0]:
+                best = (key, a, b)
+    return best[1:] if best is not None else None
+
+
+def stitch_texts(texts, max_overlap_lines=8, seam_slack=1):
+    """Join strip texts top to bottom, keeping lines read in both of two adjacent strips once"""
+    lines = []
+    for text in texts:
+        new_lines = [line for line in text.splitlines() if line.strip()]
+        if not lines:
+            lines = new_lines
+            continue
+
+        # Align the end of what we have with the start of the next strip; a line
+        # cut by the boundary may be missing or partial in one of the two
+        tail_start = max(0, len(lines) - max_overlap_lines)
+        tail = [_normalise_line(line) for line in lines[tail_start:]]
+        head = [_normalise_line(line) for line in new_lines[:max_overlap_lines]]
+        overlap = _seam_overlap(tail, head, seam_slack)
+        if overlap is not None:
+            lines = lines[:tail_start + overlap[0]] + new_lines[overlap[1]:]
+        else:
+            lines.extend(new_lines)
+    return "\n".join(lines)
+
+
+def ocr_tiled(image, recognize, executor, strip_height=1600, overlap=200):
+    """OCR a tall PIL image strip by strip on an executor; returns (text, timings in ms)"""
+    started = time.perf_counter()
+    boxes = strip_boxes(image.height, image.width, strip_height, overlap)
+
+    def run(box):
+        strip_started = time.perf_counter()
+        text = recognize(image.crop(box))
+        return text, time.perf_counter() - strip_started
+
+    results = list(executor.map(run, boxes))
+    text = stitch_texts([strip_text for strip_text, _ in results])
+
+    wall = time.perf_counter() - started
+    strips = sum(elapsed for _, elapsed in results)
+    tiled_wall_time.add(wall)
+    strip_time_total.add(strips)
+    return text, {
+        "strips": len(boxes),
+        "wall_ms": round(wall * 1000.0, 2),
+        # Close to what a single pass would cost on one core
+        "strip_sum_ms": round(strips * 1000.0, 2)
+    }
+
+
+def stats():
+    """Tiled OCR wall time against the summed time of its strips"""
+    return {
+        "wall_ms": tiled_wall_time.summary(scale=1000.0),
+        "strip_sum_ms": strip_time_total.summary(scale=1000.0)
+    }
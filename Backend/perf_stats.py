@@ -0,0 +1,107 @@
+"""
+Lightweight rolling statistics used by the performance features of the API
+(micro-batching, caches, OCR queues, shadow scoring). Values are kept in a
+bounded window or fixed buckets so memory stays constant no matter how long
+the server runs.
+"""
+
+import bisect
+import threading
+from collections import deque
+
+
+class RollingStats:
+    """Thread-safe rolling window of numeric samples with percentile summaries"""
+    
+    def __init__(self, window=2048):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+    
+    def add(self, value):
+        """Record one sample"""
+        with self._lock:
+            self._samples.append(value)
+            self.count += 1
+            self.total += value
+    
+    def summary(self, scale=1.0, digits=3):
+        """Return count, mean and percentiles of the current window"""
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self.count
+            total = self.total
+        
+        if not samples:
+            return {"count": count, "mean": None, "p50": None, "p95": None, "p99": None, "max": None}
+        
+        def percentile(p):
+            index = min(len(samples) - 1, int(round(p / 100.0 * (len(samples) - 1))))
+            return round(samples[index] * scale, digits)
+        
+        return {
+            "count": count,
+            "mean": round(total / count * scale, digits),
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99),
+            "max": round(samples[-1] * scale, digits)
+        }
+
+
+# Latency bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """Thread-safe counts over fixed bucket upper bounds; constant memory and O(log buckets) per sample"""
+    
+    def __init__(self, bounds=LATENCY_BUCKETS_MS):
+        self.bounds = tuple(sorted(bounds))
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+    
+    def observe(self, value):
+        """Record one sample"""
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += value
+    
+    def cumulative(self):
+        """(upper bound, samples <= bound) pairs, ending with (inf, count)"""
+        with self._lock:
+            counts = list(self._counts)
+        pairs = []
+        running = 0
+        for bound, count in zip(self.bounds + (float('inf'),), counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+    
+    def summary(self, digits=3):
+        """Count, mean and percentiles estimated as the upper bound of the bucket they fall in"""
+        pairs = self.cumulative()
+        count = pairs[-1][1]
+        with self._lock:
+            total = self.total
+        if count == 0:
+            return {"count": 0, "mean": None, "p50": None, "p95": None, "p99": None}
+        
+        def percentile(p):
+            rank = p / 100.0 * count
+            for bound, running in pairs:
+                if running >= rank:
+                    return bound if bound != float('inf') else None
+        
+        return {
+            "count": count,
+            "mean": round(total / count, digits),
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99)
+        }
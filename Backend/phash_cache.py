@@ -0,0 +1,187 @@
+"""
+Perceptual-hash cache of OCR results for re-shared screenshots.
+
+The same viral screenshot is uploaded again and again, usually re-compressed
+or resized along the way, so its bytes never repeat but its appearance does.
+Each decoded image is reduced to a difference hash (dHash) or DCT hash
+(pHash) of its grayscale thumbnail; an upload whose hash is within a small
+Hamming distance of a stored one reuses that image's extracted text instead
+of running Tesseract again. The verdict then comes from the prediction cache
+keyed on the text, so cached OCR output survives model reloads.
+
+A perceptual hash cannot tell one edited word from re-compression noise:
+screenshots with the same layout and one word changed can hash 0 bits
+apart. So a hash match is only a candidate. It is accepted only if a
+64x192 grayscale thumbnail of the upload is close to the stored one
+everywhere: no thumbnail pixel may differ by more than verify_threshold grey
+levels. Re-encoded and resized copies stay within about 30; a changed word
+moves some pixel by 40 or more. Edits smaller than a word (one changed
+letter or digit) can still pass, which is why the cache is opt-in.
+
+Hashes and thumbnails live in preallocated ring buffers, so memory is
+bounded by the capacity and a lookup is a single vectorised XOR + popcount
+over every stored hash.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from perf_stats import RollingStats
+
+HASH_METHODS = ('dhash', 'phash')
+
+# Number of set bits in every byte value
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+# Size of the verification thumbnail (width, height); rows of about one tenth of a text line
+THUMBNAIL_SIZE = (64, 192)
+
+
+def _dct_matrix(size):
+    """Orthonormal DCT-II basis as a size x size matrix"""
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2.0 * size)) * np.sqrt(2.0 / size)
+    matrix[0] /= np.sqrt(2.0)
+    return matrix
+
+
+def image_hash(image, method='phash', hash_size=16):
+    """Perceptual hash of a PIL image as packed bits (hash_size * hash_size bits)"""
+    from PIL import Image
+    gray = image.convert('L')
+    if method == 'dhash':
+        # Sign of the horizontal gradient between neighbouring pixels
+        pixels = np.asarray(gray.resize((hash_size + 1, hash_size), Image.BILINEAR), dtype=np.int16)
+        bits = pixels[:, 1:] > pixels[:, :-1]
+    elif method == 'phash':
+        # Low-frequency DCT coefficients compared with their median
+        size = hash_size * 4
+        pixels = np.asarray(gray.resize((size, size), Image.BILINEAR), dtype=np.float64)
+        basis = _dct_matrix(size)
+        low = (basis @ pixels @ basis.T)[:hash_size, :hash_size]
+        bits = low > np.median(low)
+    else:
+        raise ValueError(f"Unknown hash method '{method}'. Available: {', '.join(HASH_METHODS)}")
+    return np.packbits(bits.ravel())
+
+
+def image_thumbnail(image, size=THUMBNAIL_SIZE):
+    """Grayscale thumbnail (box-filtered, so each pixel averages a block of the image) for verification"""
+    from PIL import Image
+    return np.asarray(image.convert('L').resize(size, Image.BOX), dtype=np.uint8)
+
+
+class PerceptualHashCache:
+    """Map near-identical images to the text already extracted from them"""
+
+    def __init__(self, capacity=2000, max_distance=24, method='phash', hash_size=16, aspect_tolerance=0.05,
+                 verify_threshold=34):
+        if method not in HASH_METHODS:
+            raise ValueError(f"Unknown hash method '{method}'. Available: {', '.join(HASH_METHODS)}")
+
+        self.capacity = max(1, int(capacity))
+        self.max_distance = int(max_distance)
+        self.method = method
+        self.hash_size = hash_size
+        self.aspect_tolerance = aspect_tolerance
+        self.verify_threshold = int(verify_threshold)
+
+        # Ring buffer of packed hashes plus the aspect ratio and variant of each image.
+        # The hash is computed on a square thumbnail, so the aspect ratio keeps a
+        # stretched-out screenshot from matching a short one.
+        self._hashes = np.zeros((self.capacity, (hash_size * hash_size + 7) // 8), dtype=np.uint8)
+        self._aspects = np.zeros(self.capacity, dtype=np.float32)
+        self._thumbnails = np.zeros((self.capacity, THUMBNAIL_SIZE[1], THUMBNAIL_SIZE[0]), dtype=np.uint8)
+        self._variants = [None] * self.capacity
+        self._values = [None] * self.capacity
+        self._next_slot = 0
+        self.size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.evictions = 0
+        self.lookup_time = RollingStats()
+
+    def fingerprint(self, image):
+        """Hash, aspect ratio and verification thumbnail of a decoded image"""
+        width, height = image.size
+        return image_hash(image, self.method, self.hash_size), height / float(max(1, width)), image_thumbnail(image)
+
+    def lookup(self, fingerprint, variant=None):
+        """Text cached for the closest stored image within max_distance whose thumbnail matches, or None"""
+        packed, aspect, thumbnail = fingerprint
+        started = time.perf_counter()
+        with self._lock:
+            value = None
+            if self.size:
+                distances = _POPCOUNT[np.bitwise_xor(self._hashes[:self.size], packed)].sum(axis=1, dtype=np.int32)
+                close = np.abs(self._aspects[:self.size] - aspect) <= self.aspect_tolerance * aspect
+                candidates = np.flatnonzero((distances <= self.max_distance) & close)
+                for slot in candidates[np.argsort(distances[candidates], kind='stable')]:
+                    if self._variants[slot] != variant:
+                        continue
+                    if np.abs(self._thumbnails[slot].astype(np.int16) - thumbnail).max() <= self.verify_threshold:
+                        value = self._values[slot]
+                        break
+                    # Same layout, different content (e.g. an edited word)
+                    self.rejected += 1
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        self.lookup_time.add(time.perf_counter() - started)
+        return value
+
+    def add(self, fingerprint, value, variant=None):
+        """Remember the text extracted from an image, replacing the oldest entry when full"""
+        packed, aspect, thumbnail = fingerprint
+        with self._lock:
+            slot = self._next_slot
+            if self.size == self.capacity:
+                self.evictions += 1
+            else:
+                self.size += 1
+            self._hashes[slot] = packed
+            self._aspects[slot] = aspect
+            self._thumbnails[slot] = thumbnail
+            self._variants[slot] = variant
+            self._values[slot] = value
+            self._next_slot = (slot + 1) % self.capacity
+
+    def clear(self):
+        """Forget every cached image"""
+        with self._lock:
+            self._variants = [None] * self.capacity
+            self._values = [None] * self.capacity
+            self._next_slot = 0
+            self.size = 0
+
+    def memory_bytes(self):
+        """Approximate memory held by the hash and thumbnail arrays and cached texts"""
+        with self._lock:
+            texts = sum(len(value) for value in self._values[:self.size] if value)
+        return self._hashes.nbytes + self._aspects.nbytes + self._thumbnails.nbytes + 8 * 2 * self.capacity + texts
+
+    def stats(self):
+        """Hit rate, size and lookup time"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": True,
+            "method": self.method,
+            "hash_bits": self.hash_size * self.hash_size,
+            "max_distance": self.max_distance,
+            "verify_threshold": self.verify_threshold,
+            "size": self.size,
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "memory_bytes": self.memory_bytes(),
+            "lookup_ms": self.lookup_time.summary(scale=1000.0, digits=4)
+        }
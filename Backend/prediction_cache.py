@@ -0,0 +1,121 @@
+"""
+Content-addressed prediction cache.
+
+Verdicts are keyed on a hash of the normalised article text together with
+the model version, so reposted articles are served without re-featurizing
+and entries produced by an older model can never be returned for a new one.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from perf_stats import RollingStats
+
+
+def normalize_text(text):
+    """Normalise text the way the vectorizer would see it (case and whitespace)"""
+    return " ".join(text.lower().split())
+
+
+def cache_key(text, model_version):
+    """Stable content hash of an article for a given model version"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(model_version).encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(normalize_text(text).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def artifact_version(paths):
+    """Short content hash identifying a set of model artifact files"""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+class PredictionCache:
+    """Bounded in-process LRU cache with per-entry TTL"""
+
+    def __init__(self, max_size=10000, ttl_seconds=3600, model_version=None):
+        self.max_size = max(1, int(max_size))
+        self.ttl = ttl_seconds
+        self.model_version = model_version
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.lookup_time = RollingStats()
+
+    def ensure_version(self, model_version):
+        """Drop every entry if the model version changed"""
+        with self._lock:
+            if model_version != self.model_version:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.model_version = model_version
+
+    def get(self, key):
+        """Return the cached verdict for key, or None"""
+        started = time.perf_counter()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl and time.monotonic() >= entry[1]:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        self.lookup_time.add(time.perf_counter() - started)
+        return entry[0] if entry is not None else None
+
+    def put(self, key, value, model_version=None):
+        """Store a verdict, evicting the least recently used entries if full"""
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            # Verdicts from a bundle swapped out mid-request would never be looked up again
+            if model_version is not None and model_version != self.model_version:
+                return
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Hit/miss/eviction counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "backend": "memory",
+                "model_version": self.model_version,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "lookup_ms": self.lookup_time.summary(scale=1000.0, digits=4)
+            }
@@ -0,0 +1,83 @@
+"""
+Startup readiness tracking.
+
+The server loads its model, vectorizer and OCR engine, then runs a warm-up
+pass (synthetic articles through the text path, a synthetic screenshot
+through the image path) so the first real request does not pay for cold
+caches and lazily created engines. Readiness records the status and time
+of each of these components. The liveness endpoint only says the process
+is up; the readiness endpoint returns 200 once every required component
+has succeeded, so a load balancer can hold traffic until then.
+"""
+
+import threading
+import time
+import traceback
+
+
+class Readiness:
+    """Per-component load and warm-up status; ready once all required components are ok"""
+
+    def __init__(self):
+        self.started = time.time()
+        self._components = {}
+        self._required = set()
+        self._lock = threading.Lock()
+        # Set when the model and vectorizer are in place (requests can be served)
+        self.loaded = threading.Event()
+        # Set when startup finished, successfully or not
+        self.finished = threading.Event()
+        self._ready = False
+        self._finished_at = None
+
+    def run(self, name, fn, required=True):
+        """Run one startup step and record it; fn returns True/None or a details dict, a reason string to skip, False on failure"""
+        with self._lock:
+            self._components[name] = {"status": "running", "required": required}
+            if required:
+                self._required.add(name)
+        started = time.perf_counter()
+        record = {"required": required}
+        try:
+            result = fn()
+            if result is False:
+                record.update(status="failed", error="see the server log")
+            elif result is None or result is True:
+                record["status"] = "ok"
+            elif isinstance(result, str):
+                # A reason the step did not apply (e.g. OCR not installed)
+                record.update(status="skipped", reason=result)
+            else:
+                record.update(status="ok", details=result)
+        except Exception as e:
+            traceback.print_exc()
+            record.update(status="failed", error=str(e))
+        record["ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+        with self._lock:
+            self._components[name] = record
+        return record["status"] == "ok"
+
+    def finish(self):
+        """Mark startup done; ready if every required component succeeded"""
+        with self._lock:
+            self._ready = all(self._components.get(name, {}).get("status") == "ok" for name in self._required)
+            self._finished_at = time.time()
+        self.loaded.set()
+        self.finished.set()
+
+    def is_ready(self):
+        with self._lock:
+            return self._ready
+
+    def snapshot(self):
+        """Readiness payload: overall state, per-component status and timings"""
+        with self._lock:
+            components = {name: dict(record) for name, record in self._components.items()}
+            finished_at = self._finished_at
+            ready = self._ready
+        return {
+            "ready": ready,
+            "state": "ready" if ready else ("failed" if finished_at is not None else "starting"),
+            "startup_ms": round(((finished_at or time.time()) - self.started) * 1000.0, 1),
+            "components": components
+        }
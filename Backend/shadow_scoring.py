@@ -0,0 +1,191 @@
+"""
+Shadow scoring of a candidate model on live traffic.
+
+A sampled fraction of /api/predict and /api/batch-predict requests is handed
+to a background thread, which scores the same texts with a candidate model.
+Responses never wait for it and never see the candidate's verdicts. Only
+texts the serving model actually scored are offered (cache hits are not), so
+for the sampled requests the thread records the serving model's time on
+them, the candidate's time on the same texts, and how often the candidate
+disagrees with the verdicts that were served.
+
+The primary path only pays for a random draw and a non-blocking queue put.
+The shadow thread is held to a CPU budget (a fraction of one core, as a
+token bucket refilled over time and charged with the thread's measured CPU
+time): samples arriving while the budget is spent, or while the queue is
+full, are dropped rather than delayed. A CPU budget alone does not protect
+request latency, since shadow work competes with requests for the GIL and
+the cores. Given an event that is set while no request is being scored, the
+thread only scores in those idle moments, IDLE_CHUNK texts at a time, and
+drops a sample that has not found one within max_delay_ms. It blocks on the
+event rather than polling, so waiting costs requests nothing. Each sample is
+capped at max_items texts.
+"""
+
+import queue
+import random
+import threading
+import time
+
+from perf_stats import Histogram
+
+# Texts scored between two checks that the primary path is idle
+IDLE_CHUNK = 4
+
+
+class ShadowScorer:
+    """Score sampled requests with a candidate bundle off the response path, within a CPU budget"""
+
+    def __init__(self, candidate, sample_rate=0.05, cpu_budget=0.1, max_queue=64, max_items=64,
+                 idle=None, max_delay_ms=1000.0):
+        self.candidate = candidate
+        self.sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+        self.cpu_budget = max(float(cpu_budget), 0.0)
+        self.max_items = max(1, int(max_items))
+        # threading.Event set while the primary path is not scoring (None: shadow work never yields)
+        self.idle = idle
+        self.max_delay = max(float(max_delay_ms), 0.0) / 1000.0
+
+        self._queue = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+        # Token bucket of CPU seconds: refilled at cpu_budget per second, up to one second's worth
+        self._lock = threading.Lock()
+        self._burst = self.cpu_budget
+        self._tokens = self._burst
+        self._refilled = time.perf_counter()
+        self._started = time.perf_counter()
+
+        self.offered = 0
+        self.sampled = 0
+        self.dropped_queue_full = 0
+        self.dropped_over_budget = 0
+        self.dropped_busy = 0
+        self.scored = 0
+        self.items = 0
+        self.disagreements = 0
+        self.transitions = {}
+        self.errors = 0
+        self.last_error = None
+        self.cpu_seconds = 0.0
+        self.latency = {"primary": Histogram(), "candidate": Histogram()}
+
+    def _ensure_started(self):
+        """Start the shadow thread on first use"""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+                self._thread.start()
+
+    def _refill(self):
+        """Add the CPU seconds earned since the last refill; returns the balance"""
+        now = time.perf_counter()
+        with self._lock:
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self.cpu_budget)
+            self._refilled = now
+            return self._tokens
+
+    def _wait_idle(self, deadline):
+        """Wait until the primary path is idle; False if it is still busy at the deadline"""
+        if self.idle is None:
+            return True
+        return self.idle.wait(max(deadline - time.perf_counter(), 0.0))
+
+    def _score(self, texts, deadline):
+        """Candidate verdicts and scoring seconds, chunk by chunk in idle moments; None if it gave up"""
+        predictions = []
+        elapsed = 0.0
+        for start in range(0, len(texts), IDLE_CHUNK):
+            if not self._wait_idle(deadline):
+                return None, elapsed
+            started = time.perf_counter()
+            predictions.extend(self.candidate.predict(texts[start:start + IDLE_CHUNK]))
+            elapsed += time.perf_counter() - started
+        return predictions, elapsed
+
+    def offer(self, texts, predictions, primary_ms):
+        """Maybe queue model-scored texts (texts, served verdicts, model time); never blocks. Returns whether it was queued"""
+        self.offered += 1
+        if not texts or random.random() >= self.sample_rate:
+            return False
+        self.sampled += 1
+        if self._refill() <= 0:
+            self.dropped_over_budget += 1
+            return False
+
+        try:
+            self._queue.put_nowait((texts[:self.max_items], predictions[:self.max_items], primary_ms,
+                                    time.perf_counter() + self.max_delay))
+        except queue.Full:
+            self.dropped_queue_full += 1
+            return False
+        self._ensure_started()
+        return True
+
+    def _run(self):
+        """Shadow loop: score each sample with the candidate and compare with the served verdicts"""
+        while True:
+            texts, primary, primary_ms, deadline = self._queue.get()
+            try:
+                # The budget may have been spent by samples queued before this one
+                if self._refill() <= 0:
+                    self.dropped_over_budget += 1
+                    continue
+                cpu_started = time.thread_time()
+                candidate, seconds = self._score(texts, deadline)
+                cpu = time.thread_time() - cpu_started
+
+                with self._lock:
+                    self._tokens -= cpu
+                    self.cpu_seconds += cpu
+                    if candidate is None:
+                        self.dropped_busy += 1
+                        continue
+                    self.scored += 1
+                    self.items += len(texts)
+                    for served, shadow in zip(primary, candidate):
+                        if str(served) != str(shadow):
+                            self.disagreements += 1
+                            transition = f"{served}->{shadow}"
+                            self.transitions[transition] = self.transitions.get(transition, 0) + 1
+                self.latency["primary"].observe(primary_ms)
+                self.latency["candidate"].observe(seconds * 1000.0)
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+
+    def stats(self):
+        """Sampling, budget, disagreement and per-model latency metrics"""
+        elapsed = time.perf_counter() - self._started
+        with self._lock:
+            transitions = dict(self.transitions)
+            cpu_seconds = self.cpu_seconds
+            items = self.items
+            disagreements = self.disagreements
+        return {
+            "enabled": True,
+            "candidate_version": self.candidate.version,
+            "sample_rate": self.sample_rate,
+            "cpu_budget": self.cpu_budget,
+            "max_items": self.max_items,
+            "offered": self.offered,
+            "sampled": self.sampled,
+            "scored": self.scored,
+            "items": items,
+            "dropped_queue_full": self.dropped_queue_full,
+            "dropped_over_budget": self.dropped_over_budget,
+            "dropped_busy": self.dropped_busy,
+            "max_delay_ms": self.max_delay * 1000.0,
+            "queue_depth": self._queue.qsize(),
+            "disagreements": disagreements,
+            "disagreement_rate": round(disagreements / items, 4) if items else None,
+            "disagreements_by_label": transitions,
+            "cpu_seconds": round(cpu_seconds, 3),
+            "cpu_fraction": round(cpu_seconds / elapsed, 4) if elapsed > 0 else None,
+            "latency_ms": {name: histogram.summary() for name, histogram in self.latency.items()},
+            "errors": self.errors,
+            "last_error": self.last_error
+        }
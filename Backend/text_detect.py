@@ -0,0 +1,108 @@
+"""
+Cheap text-presence check run before OCR.
+
+Many uploads are photos with little or no text, which used to be found out
+only after a full Tesseract pass. This stage looks for text lines on a
+downscaled grayscale copy instead: text has dense, high-contrast edges that
+line up horizontally, so the morphological gradient is binarised, closed
+with a wide kernel to merge characters into lines, and the resulting blobs
+are kept when they are line-shaped and filled like text. Images without any
+such region are rejected in milliseconds; otherwise OCR can be limited to
+the bounding box of the regions found.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from lazy_imports import load_cv2, module_available
+from perf_stats import RollingStats
+
+# OpenCV is imported on the first check (see lazy_imports.py)
+CV2_AVAILABLE = module_available('cv2')
+
+# Detection time and outcome counters across all requests
+detect_time = RollingStats()
+_counts = {"checked": 0, "rejected": 0, "cropped": 0}
+_counts_lock = threading.Lock()
+
+
+def _count(name):
+    with _counts_lock:
+        _counts[name] += 1
+
+
+def find_text_regions(image, work_width=640):
+    """Bounding boxes (left, top, right, bottom) of text-like lines in a PIL image, in its own pixels"""
+    cv2 = load_cv2()
+    if cv2 is None:
+        raise RuntimeError("The text-presence check requires opencv-python")
+    gray = np.asarray(image.convert('L'))
+    height, width = gray.shape
+    scale = 1.0
+    if width > work_width:
+        scale = work_width / float(width)
+        gray = cv2.resize(gray, (work_width, max(1, int(round(height * scale)))), interpolation=cv2.INTER_AREA)
+
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, kernel)
+    threshold, edges = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    # Flat images make Otsu pick a very low threshold and mark sensor noise as edges
+    if threshold < 16:
+        return []
+    lines = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1)))
+    contours, _ = cv2.findContours(lines, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    small_height = gray.shape[0]
+    regions = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if h < 5 or w < 12 or h > small_height / 4.0 or w < 1.5 * h:
+            continue
+        fill = cv2.countNonZero(edges[y:y + h, x:x + w]) / float(w * h)
+        if not 0.3 <= fill <= 0.9:
+            continue
+        regions.append((int(x / scale), int(y / scale),
+                        min(width, int(np.ceil((x + w) / scale))), min(height, int(np.ceil((y + h) / scale)))))
+    return regions
+
+
+def check_text(image, work_width=640, min_regions=1, crop=True, min_crop_regions=3, min_crop_gain=0.2):
+    """Decide whether an image is worth OCR; returns (has_text, crop box or None, timings in ms)"""
+    started = time.perf_counter()
+    regions = find_text_regions(image, work_width)
+    _count("checked")
+
+    box = None
+    has_text = len(regions) >= min_regions
+    if not has_text:
+        _count("rejected")
+    elif crop and len(regions) >= min_crop_regions:
+        # Lines over busy backgrounds can be missed, so crop only around several
+        # lines and keep a margin of one line height on every side
+        padding = max(region[3] - region[1] for region in regions)
+        left = max(0, min(region[0] for region in regions) - padding)
+        top = max(0, min(region[1] for region in regions) - padding)
+        right = min(image.width, max(region[2] for region in regions) + padding)
+        bottom = min(image.height, max(region[3] for region in regions) + padding)
+        # Only crop when it saves a worthwhile share of the pixels
+        if (right - left) * (bottom - top) <= (1 - min_crop_gain) * image.width * image.height:
+            box = (left, top, right, bottom)
+            _count("cropped")
+
+    elapsed = time.perf_counter() - started
+    detect_time.add(elapsed)
+    return has_text, box, {
+        "regions": len(regions),
+        "check_ms": round(elapsed * 1000.0, 2)
+    }
+
+
+def stats():
+    """Check counters and detection time"""
+    with _counts_lock:
+        counts = dict(_counts)
+    counts["available"] = CV2_AVAILABLE
+    counts["check_ms"] = detect_time.summary(scale=1000.0)
+    return counts
@@ -0,0 +1,164 @@
+"""
+Shared verdict store backed by SQLite in WAL mode.
+
+When the API runs under several worker processes (e.g. gunicorn -w 4) each
+worker has its own in-memory PredictionCache. This store keeps verdicts in a
+single SQLite database on the host instead, so a verdict computed by one
+worker is a cache hit for every other worker and survives restarts.
+
+It implements the same get / put / ensure_version / stats interface as
+PredictionCache and is selected with VERDICT_STORE=sqlite.
+"""
+
+import sqlite3
+import threading
+import time
+
+from perf_stats import RollingStats
+
+# Only refresh an entry's access time when it is older than this, so hits
+# don't turn every lookup into a write that contends across workers
+ACCESS_RESOLUTION_SECONDS = 60
+
+# Check the size bound every N inserts and evict down to 90% of it
+EVICTION_CHECK_INTERVAL = 256
+EVICTION_TARGET = 0.9
+
+
+class SQLiteVerdictStore:
+    """Bounded, persistent verdict store shared by all workers on a host"""
+
+    def __init__(self, path='verdicts.sqlite3', max_size=100000, ttl_seconds=86400, model_version=None):
+        self.path = path
+        self.max_size = max(1, int(max_size))
+        self.ttl = ttl_seconds
+        self.model_version = model_version
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._puts_since_check = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.lookup_time = RollingStats()
+
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            " key TEXT PRIMARY KEY,"
+            " verdict TEXT NOT NULL,"
+            " model_version TEXT,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS verdicts_accessed ON verdicts (accessed)")
+        connection.commit()
+
+    def _connection(self):
+        """One connection per thread (sqlite3 connections are not thread-safe)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = connection
+        return connection
+
+    def ensure_version(self, model_version):
+        """Purge verdicts produced by any other model version"""
+        with self._lock:
+            self.model_version = model_version
+        cursor = self._connection().execute(
+            "DELETE FROM verdicts WHERE model_version IS NOT ?", (model_version,))
+        if cursor.rowcount > 0:
+            with self._lock:
+                self.invalidations += 1
+
+    def get(self, key):
+        """Return the stored verdict for key, or None"""
+        started = time.perf_counter()
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT verdict, created, accessed FROM verdicts WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+
+        if row is not None and self.ttl and now - row[1] >= self.ttl:
+            connection.execute("DELETE FROM verdicts WHERE key = ?", (key,))
+            with self._lock:
+                self.expirations += 1
+            row = None
+        elif row is not None and now - row[2] >= ACCESS_RESOLUTION_SECONDS:
+            connection.execute("UPDATE verdicts SET accessed = ? WHERE key = ?", (now, key))
+
+        self.lookup_time.add(time.perf_counter() - started)
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0]
+
+    def put(self, key, value, model_version=None):
+        """Store a verdict and periodically evict least recently used entries"""
+        # Tag the row with the version that produced it: a request still scoring with the
+        # previous bundle after a reload must not store its verdict as the new version
+        if model_version is None:
+            model_version = self.model_version
+        now = time.time()
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO verdicts (key, verdict, model_version, created, accessed)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, value, model_version, now, now)
+        )
+
+        with self._lock:
+            self._puts_since_check += 1
+            if self._puts_since_check < EVICTION_CHECK_INTERVAL:
+                return
+            self._puts_since_check = 0
+        self._evict()
+
+    def _evict(self):
+        """Trim the table back under its size bound, oldest access first"""
+        connection = self._connection()
+        size = connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        if size <= self.max_size:
+            return
+
+        excess = size - int(self.max_size * EVICTION_TARGET)
+        cursor = connection.execute(
+            "DELETE FROM verdicts WHERE key IN"
+            " (SELECT key FROM verdicts ORDER BY accessed LIMIT ?)", (excess,))
+        with self._lock:
+            self.evictions += max(cursor.rowcount, 0)
+
+    def clear(self):
+        """Remove every entry"""
+        self._connection().execute("DELETE FROM verdicts")
+
+    def stats(self):
+        """Hit/miss/eviction counters, size and lookup latency"""
+        size = self._connection().execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "backend": "sqlite",
+                "path": self.path,
+                "model_version": self.model_version,
+                "size": size,
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "lookup_ms": self.lookup_time.summary(scale=1000.0, digits=4)
+            }
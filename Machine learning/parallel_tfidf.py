@@ -0,0 +1,172 @@
+"""
+Parallel map-reduce fitting of the TF-IDF vectorizer
+TfidfVectorizer.fit_transform tokenizes and counts the whole corpus on one
+core. Here the corpus is split into shards across a process pool:
+
+  map     each worker analyzes its shard with the vectorizer's own analyzer
+          (same tokenization, lowercasing and stop words) and returns the
+          shard's terms in first-seen order, their document frequencies and,
+          for fit_transform, the shard's term-count matrix
+  reduce  the shard counts are merged in shard order, max_df / min_df are
+          applied and IDF computed exactly as sklearn does; the count
+          matrices are remapped to the merged vocabulary and stacked
+
+Every document is analyzed once, as in the single-core fit. The vocabulary
+(including its dict order), idf_ and transform output are identical to a
+single-core fit, and the training matrix equals vectorizer.transform() of the
+same documents.
+
+Worker functions live in this module so they can be pickled by the pool;
+callers must run under `if __name__ == '__main__':` on platforms that spawn
+processes (Windows, macOS).
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from numbers import Integral
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfTransformer
+
+# Shards per worker, so a shard of unusually long documents does not leave the other workers idle
+SHARDS_PER_JOB = 4
+
+# Per-process analyzer set by the pool initializer
+_worker_analyzer = None
+
+
+def _init_worker(vectorizer):
+    global _worker_analyzer
+    _worker_analyzer = vectorizer.build_analyzer()
+
+
+def _count_shard(documents):
+    """Map: a shard's terms in first-seen order, their document frequencies and its count matrix"""
+    analyze = _worker_analyzer
+    vocabulary = {}
+    indices = []
+    values = []
+    indptr = [0]
+    for document in documents:
+        counts = {}
+        for term in analyze(document):
+            index = vocabulary.setdefault(term, len(vocabulary))
+            counts[index] = counts.get(index, 0) + 1
+        indices.extend(counts.keys())
+        values.extend(counts.values())
+        indptr.append(len(indices))
+    matrix = sp.csr_matrix((np.array(values, dtype=np.intc), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+                           shape=(len(documents), len(vocabulary)))
+    return list(vocabulary), np.bincount(matrix.indices, minlength=len(vocabulary)), matrix
+
+
+def _shards(documents, n_jobs):
+    """Contiguous slices of the documents, so results concatenate back in input order"""
+    size = max(1, math.ceil(len(documents) / (n_jobs * SHARDS_PER_JOB)))
+    return [documents[start:start + size] for start in range(0, len(documents), size)]
+
+
+def _merge_shards(shards):
+    """All shards' terms in first-seen order, their document frequencies, and each shard's local -> merged term ids"""
+    merged = {}
+    shard_ids = []
+    for terms, _, _ in shards:
+        new_terms = [term for term in terms if term not in merged]
+        merged.update(zip(new_terms, range(len(merged), len(merged) + len(new_terms))))
+        shard_ids.append(np.fromiter(map(merged.__getitem__, terms), dtype=np.int64, count=len(terms)))
+    document_frequency = np.zeros(len(merged), dtype=np.int64)
+    for ids, (_, shard_frequency, _) in zip(shard_ids, shards):
+        document_frequency[ids] += shard_frequency
+    return list(merged), document_frequency, shard_ids
+
+
+def _limit_terms(vectorizer, terms, document_frequency, n_documents):
+    """Reduce: vocabulary, IDF and merged term id -> feature column (-1 if pruned), as CountVectorizer and TfidfTransformer compute them"""
+    max_df, min_df = vectorizer.max_df, vectorizer.min_df
+    max_doc_count = max_df if isinstance(max_df, Integral) else max_df * n_documents
+    min_doc_count = min_df if isinstance(min_df, Integral) else min_df * n_documents
+    if max_doc_count < min_doc_count:
+        raise ValueError("max_df corresponds to < documents than min_df")
+
+    if not terms:
+        raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+    kept = np.flatnonzero((document_frequency >= min_doc_count) & (document_frequency <= max_doc_count))
+    if not len(kept):
+        raise ValueError("After pruning, no terms remain. Try a lower min_df or a higher max_df.")
+
+    # Feature columns follow sorted term order; the dict keeps first-seen order like sklearn's
+    kept_terms = [terms[index] for index in kept.tolist()]
+    order = np.array(sorted(range(len(kept_terms)), key=kept_terms.__getitem__), dtype=np.int64)
+    column = np.full(len(terms), -1, dtype=np.int64)
+    column[kept[order]] = np.arange(len(kept))
+    vocabulary = dict(zip(kept_terms, column[kept].tolist()))
+
+    idf = None
+    if vectorizer.use_idf:
+        # Computed in the vectorizer's dtype, like TfidfTransformer.fit on its count matrix
+        frequency = document_frequency[kept[order]].astype(vectorizer.dtype)
+        frequency += float(vectorizer.smooth_idf)
+        idf = np.full_like(frequency, fill_value=n_documents + int(vectorizer.smooth_idf))
+        idf /= frequency
+        np.log(idf, out=idf)
+        idf += 1.0
+    return vocabulary, idf, column
+
+
+def _check_supported(vectorizer):
+    if vectorizer.vocabulary is not None:
+        raise ValueError("A fixed vocabulary needs no fitting")
+    if vectorizer.max_features is not None:
+        raise ValueError("max_features is not supported by the parallel fit")
+    if vectorizer.dtype not in (np.float64, np.float32):
+        raise ValueError("dtype must be float64 or float32")
+
+
+def _map_reduce(vectorizer, documents, n_jobs):
+    """Fit vectorizer in place; returns each shard's count matrix and its local term -> feature column map"""
+    _check_supported(vectorizer)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(n_jobs, initializer=_init_worker, initargs=(vectorizer,)) as pool:
+        shards = list(pool.map(_count_shard, _shards(documents, n_jobs)))
+
+    terms, document_frequency, shard_ids = _merge_shards(shards)
+    vocabulary, idf, column = _limit_terms(vectorizer, terms, document_frequency, len(documents))
+
+    vectorizer.vocabulary_ = vocabulary
+    vectorizer.fixed_vocabulary_ = False
+    vectorizer._tfidf = TfidfTransformer(
+        norm=vectorizer.norm,
+        use_idf=vectorizer.use_idf,
+        smooth_idf=vectorizer.smooth_idf,
+        sublinear_tf=vectorizer.sublinear_tf
+    )
+    if idf is not None:
+        vectorizer._tfidf.idf_ = idf
+    vectorizer._tfidf.n_features_in_ = len(vocabulary)
+    return [(matrix, column[ids]) for (_, _, matrix), ids in zip(shards, shard_ids)]
+
+
+def parallel_fit(vectorizer, documents, n_jobs=None):
+    """Fit an unfitted TfidfVectorizer on documents using n_jobs processes; returns the vectorizer"""
+    _map_reduce(vectorizer, list(documents), n_jobs)
+    return vectorizer
+
+
+def parallel_fit_transform(vectorizer, documents, n_jobs=None):
+    """parallel_fit, also returning the TF-IDF matrix of the documents; returns (vectorizer, matrix)"""
+    shards = _map_reduce(vectorizer, list(documents), n_jobs)
+    n_features = len(vectorizer.vocabulary_)
+
+    blocks = []
+    for matrix, columns in shards:
+        # 0/1 matrix taking each kept local column to its feature column
+        local = np.flatnonzero(columns >= 0)
+        remap = sp.csr_matrix((np.ones(len(local), dtype=np.intc), (local, columns[local])),
+                              shape=(len(columns), n_features))
+        blocks.append(matrix @ remap)
+    counts = sp.vstack(blocks, format='csr').astype(vectorizer.dtype)
+    counts.sort_indices()
+    if vectorizer.binary:
+        counts.data.fill(1)
+    return vectorizer, vectorizer._tfidf.transform(counts, copy=False)
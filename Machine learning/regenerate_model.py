@@ -10,102 +10,192 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import PassiveAggressiveClassifier
 from sklearn.metrics import accuracy_score, confusion_matrix
 import os
+import sys
+import time
+import tracemalloc
 
-print("=" * 60)
-print("Fake News Detection Model Regeneration")
-print("=" * 60)
-
-# Step 1: Load the dataset
-print("\n[1/6] Loading dataset...")
-try:
-    df = pd.read_csv("news.csv")
-    print(f"✓ Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
-except Exception as e:
-    print(f"✗ Error loading dataset: {e}")
-    exit(1)
-
-# Step 2: Check for null values
-print("\n[2/6] Checking data quality...")
-null_count = df.isnull().sum().sum()
-if null_count > 0:
-    print(f"⚠ Warning: {null_count} null values found")
-    df = df.dropna()
-    print(f"✓ Data cleaned: {df.shape[0]} rows remaining")
-else:
-    print("✓ No null values found")
-
-# Step 3: Prepare features and labels
-print("\n[3/6] Preparing features and labels...")
-labels = df['label']
-texts = df['text']
-print(f"✓ Labels: {labels.value_counts().to_dict()}")
-print(f"✓ Total samples: {len(texts)}")
-
-# Step 4: Split the data
-print("\n[4/6] Splitting data into train/test sets...")
-x_train, x_test, y_train, y_test = train_test_split(
-    texts, labels, test_size=0.2, random_state=20
-)
-print(f"✓ Training samples: {len(x_train)}")
-print(f"✓ Test samples: {len(x_test)}")
-
-# Step 5: Initialize and fit the vectorizer
-print("\n[5/6] Creating and fitting TF-IDF vectorizer...")
-vectorizer = TfidfVectorizer(stop_words='english', max_df=0.7)
-tf_train = vectorizer.fit_transform(x_train)
-tf_test = vectorizer.transform(x_test)
-print(f"✓ Vectorizer fitted: {len(vectorizer.vocabulary_)} features")
-
-# Step 6: Train the model
-print("\n[6/6] Training PassiveAggressiveClassifier...")
-model = PassiveAggressiveClassifier(max_iter=50)
-model.fit(tf_train, y_train)
-print("✓ Model trained successfully")
-
-# Step 7: Evaluate the model
-print("\n[7/7] Evaluating model...")
-y_pred = model.predict(tf_test)
-score = accuracy_score(y_test, y_pred)
-print(f"✓ Accuracy: {round(score * 100, 2)}%")
-
-# Confusion matrix
-cm = confusion_matrix(y_test, y_pred, labels=['FAKE', 'REAL'])
-print(f"\nConfusion Matrix:")
-print(f"  FAKE: {cm[0]}")
-print(f"  REAL: {cm[1]}")
-
-# Step 8: Save the model
-print("\n" + "=" * 60)
-print("Saving model files...")
-print("=" * 60)
-
-try:
-    # Save the model
-    model_filename = 'finalized_model.pkl'
-    with open(model_filename, 'wb') as f:
-        pickle.dump(model, f)
-    file_size = os.path.getsize(model_filename)
-    print(f"✓ Model saved: {model_filename} ({file_size:,} bytes)")
+# Memory-mapped export and the hashing pipeline live with the backend that loads them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend'))
+from model_artifacts import export_artifacts
+from feature_hashing import make_hashing_vectorizer
+from parallel_tfidf import parallel_fit_transform
+
+# Learn IDF weights for the feature-hashing variant (False: hashed term frequencies only)
+HASHING_USE_IDF = True
+
+# Processes used to fit the TF-IDF vectorizer (1: single-core TfidfVectorizer.fit_transform)
+VECTORIZER_JOBS = os.cpu_count() or 1
+# Smaller training sets are fitted on one core; starting the pool would cost more than it saves
+PARALLEL_MIN_DOCUMENTS = 5000
+
+def measure_pipeline(vectorizer, model, docs):
+    """Per-article latency (ms), load time (ms) and memory (MB) of a vectorizer + model pair"""
+    started = time.perf_counter()
+    for doc in docs:
+        model.predict(vectorizer.transform([doc]))
+    latency = (time.perf_counter() - started) * 1000.0 / len(docs)
     
-    # Save the vectorizer
-    vectorizer_filename = 'tfidf_vectorizer.pkl'
-    with open(vectorizer_filename, 'wb') as f:
-        pickle.dump(vectorizer, f)
-    file_size = os.path.getsize(vectorizer_filename)
-    print(f"✓ Vectorizer saved: {vectorizer_filename} ({file_size:,} bytes)")
+    data = pickle.dumps((vectorizer, model))
+    started = time.perf_counter()
+    pickle.loads(data)
+    load_time = (time.perf_counter() - started) * 1000.0
     
+    tracemalloc.start()
+    loaded = pickle.loads(data)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return latency, load_time, memory / 1e6
+
+def save_pickle(obj, filename):
+    """Write a pickle atomically, so a server watching the file never reads it half-written"""
+    temporary = filename + '.tmp'
+    with open(temporary, 'wb') as f:
+        pickle.dump(obj, f)
+    os.replace(temporary, filename)
+
+def main():
+    print("=" * 60)
+    print("Fake News Detection Model Regeneration")
+    print("=" * 60)
+
+    # Step 1: Load the dataset
+    print("\n[1/8] Loading dataset...")
+    try:
+        df = pd.read_csv("news.csv")
+        print(f"✓ Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
+    except Exception as e:
+        print(f"✗ Error loading dataset: {e}")
+        exit(1)
+
+    # Step 2: Check for null values
+    print("\n[2/8] Checking data quality...")
+    null_count = df.isnull().sum().sum()
+    if null_count > 0:
+        print(f"⚠ Warning: {null_count} null values found")
+        df = df.dropna()
+        print(f"✓ Data cleaned: {df.shape[0]} rows remaining")
+    else:
+        print("✓ No null values found")
+
+    # Step 3: Prepare features and labels
+    print("\n[3/8] Preparing features and labels...")
+    labels = df['label']
+    texts = df['text']
+    print(f"✓ Labels: {labels.value_counts().to_dict()}")
+    print(f"✓ Total samples: {len(texts)}")
+
+    # Step 4: Split the data
+    print("\n[4/8] Splitting data into train/test sets...")
+    x_train, x_test, y_train, y_test = train_test_split(
+        texts, labels, test_size=0.2, random_state=20
+    )
+    print(f"✓ Training samples: {len(x_train)}")
+    print(f"✓ Test samples: {len(x_test)}")
+
+    # Step 5: Initialize and fit the vectorizer
+    print("\n[5/8] Creating and fitting TF-IDF vectorizer...")
+    vectorizer = TfidfVectorizer(stop_words='english', max_df=0.7)
+    started = time.perf_counter()
+    jobs = VECTORIZER_JOBS if len(x_train) >= PARALLEL_MIN_DOCUMENTS else 1
+    if jobs > 1:
+        # Map-reduce over a process pool; same vocabulary and IDF as fit_transform
+        vectorizer, tf_train = parallel_fit_transform(vectorizer, x_train, jobs)
+    else:
+        tf_train = vectorizer.fit_transform(x_train)
+    print(f"✓ Fitted with {jobs} process(es) in {time.perf_counter() - started:.1f}s")
+    tf_test = vectorizer.transform(x_test)
+    print(f"✓ Vectorizer fitted: {len(vectorizer.vocabulary_)} features")
+
+    # Step 6: Train the model
+    print("\n[6/8] Training PassiveAggressiveClassifier...")
+    model = PassiveAggressiveClassifier(max_iter=50)
+    model.fit(tf_train, y_train)
+    print("✓ Model trained successfully")
+
+    # Step 7: Evaluate the model
+    print("\n[7/8] Evaluating model...")
+    y_pred = model.predict(tf_test)
+    score = accuracy_score(y_test, y_pred)
+    print(f"✓ Accuracy: {round(score * 100, 2)}%")
+
+    # Confusion matrix
+    cm = confusion_matrix(y_test, y_pred, labels=['FAKE', 'REAL'])
+    print(f"\nConfusion Matrix:")
+    print(f"  FAKE: {cm[0]}")
+    print(f"  REAL: {cm[1]}")
+
+    # Step 8: Train the feature-hashing variant on the same split
+    print("\n[8/8] Training feature-hashing variant...")
+    hashing_vectorizer = make_hashing_vectorizer(use_idf=HASHING_USE_IDF)
+    hash_train = hashing_vectorizer.fit_transform(x_train)
+    hash_test = hashing_vectorizer.transform(x_test)
+    hashing_model = PassiveAggressiveClassifier(max_iter=50)
+    hashing_model.fit(hash_train, y_train)
+    hashing_score = accuracy_score(y_test, hashing_model.predict(hash_test))
+    print(f"✓ Hashing model trained ({hash_train.shape[1]:,} hashed features, IDF: {HASHING_USE_IDF})")
+
+    # Compare the two pipelines
+    sample = list(x_test[:200])
+    print("\n" + "=" * 60)
+    print("Pipeline comparison")
+    print("=" * 60)
+    print(f"  {'pipeline':<10}{'accuracy':>10}{'ms/article':>12}{'load ms':>9}{'memory MB':>11}")
+    for name, pipeline_vectorizer, pipeline_model, pipeline_score in (
+            ("tfidf", vectorizer, model, score),
+            ("hashing", hashing_vectorizer, hashing_model, hashing_score)):
+        latency, load_time, memory = measure_pipeline(pipeline_vectorizer, pipeline_model, sample)
+        print(f"  {name:<10}{pipeline_score * 100:>9.2f}%{latency:>12.3f}{load_time:>9.1f}{memory:>11.2f}")
+    print("Memory is what one server process allocates to load the vectorizer and model.")
+    print("The hashing pipeline's memory is fixed; TF-IDF grows with the vocabulary.")
+
+    # Step 9: Save the model
     print("\n" + "=" * 60)
-    print("✓ Model regeneration complete!")
+    print("Saving model files...")
     print("=" * 60)
-    print("\nNext steps:")
-    print("1. Copy the .pkl files to the Backend directory:")
-    print("   - finalized_model.pkl")
-    print("   - tfidf_vectorizer.pkl")
-    print("\n2. Restart the Flask server")
+
+    try:
+        # Save the model
+        model_filename = 'finalized_model.pkl'
+        save_pickle(model, model_filename)
+        file_size = os.path.getsize(model_filename)
+        print(f"✓ Model saved: {model_filename} ({file_size:,} bytes)")
+    
+        # Save the vectorizer
+        vectorizer_filename = 'tfidf_vectorizer.pkl'
+        save_pickle(vectorizer, vectorizer_filename)
+        file_size = os.path.getsize(vectorizer_filename)
+        print(f"✓ Vectorizer saved: {vectorizer_filename} ({file_size:,} bytes)")
+    
+        # Save the memory-mapped artifact set (MODEL_FORMAT=mmap)
+        artifacts_dir = 'model_artifacts'
+        paths = export_artifacts(model, vectorizer, artifacts_dir)
+        file_size = sum(os.path.getsize(path) for path in paths)
+        print(f"✓ Memory-mapped artifacts saved: {artifacts_dir}/ ({file_size:,} bytes)")
     
-except Exception as e:
-    print(f"\n✗ Error saving files: {e}")
-    import traceback
-    traceback.print_exc()
-    exit(1)
+        # Save the feature-hashing variant (FEATURE_PIPELINE=hashing)
+        for filename, obj in (('hashing_model.pkl', hashing_model), ('hashing_vectorizer.pkl', hashing_vectorizer)):
+            save_pickle(obj, filename)
+            print(f"✓ Hashing variant saved: {filename} ({os.path.getsize(filename):,} bytes)")
+    
+        print("\n" + "=" * 60)
+        print("✓ Model regeneration complete!")
+        print("=" * 60)
+        print("\nNext steps:")
+        print("1. Copy the model files to the Backend directory:")
+        print("   - finalized_model.pkl")
+        print("   - tfidf_vectorizer.pkl")
+        print("   - model_artifacts/ (to serve with MODEL_FORMAT=mmap)")
+        print("   - hashing_model.pkl, hashing_vectorizer.pkl (to serve with FEATURE_PIPELINE=hashing)")
+        print("\n2. Restart the Flask server, or let it swap the new files in without a restart:")
+        print("   POST /api/admin/reload-model, or set MODEL_WATCH_INTERVAL")
+    
+    except Exception as e:
+        print(f"\n✗ Error saving files: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
+
 
+if __name__ == '__main__':
+    main()
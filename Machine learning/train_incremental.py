@@ -0,0 +1,237 @@
+"""
+Out-of-core training of the feature-hashing model
+This script streams news.csv in chunks instead of loading it with pd.read_csv,
+so the training set is no longer limited by RAM:
+
+  1. IDF pass: count document frequencies of the hashed features chunk by chunk
+     (one fixed-size array, see Backend/feature_hashing.py)
+  2. Training pass(es): featurize each chunk and update a
+     PassiveAggressiveClassifier with partial_fit, checkpointing as it goes
+  3. Evaluation pass: score the held-out rows (every TEST_EVERY-th row)
+
+Memory stays flat whatever the dataset size: one chunk of text, its sparse
+features, and the 2^20-column IDF and weight vectors. The result is saved as
+hashing_model.pkl / hashing_vectorizer.pkl and served with
+FEATURE_PIPELINE=hashing, like the hashing variant of regenerate_model.py.
+
+Usage: python train_incremental.py [news.csv] [--chunk-size N] [--epochs N] [--no-idf] [--resume]
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import PassiveAggressiveClassifier
+
+# The hashing pipeline lives with the backend that loads it
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend'))
+from feature_hashing import N_FEATURES, make_hashing_vectorizer
+
+CLASSES = np.array(['FAKE', 'REAL'], dtype=object)
+
+# Every TEST_EVERY-th row is held out for evaluation (20% like regenerate_model.py)
+TEST_EVERY = 5
+
+CHECKPOINT_FILE = 'incremental_checkpoint.pkl'
+# Save a checkpoint every this many chunks
+CHECKPOINT_EVERY = 20
+
+
+def rss_mb():
+    """Resident set size of this process in MB (None where /proc is not available)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def format_rss():
+    rss = rss_mb()
+    return f"{rss:.0f} MB" if rss is not None else "n/a"
+
+
+def format_peak_rss():
+    try:
+        import resource
+    except ImportError:
+        return "n/a"
+    # ru_maxrss is in KiB on Linux
+    return f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 / 1e6:.0f} MB"
+
+
+def read_chunks(path, chunk_size):
+    """Yield (rows read so far, texts, labels, row numbers) per chunk, skipping rows with missing values"""
+    rows_read = 0
+    for chunk in pd.read_csv(path, usecols=['text', 'label'], chunksize=chunk_size):
+        rows_read += len(chunk)
+        # Chunks keep counting the index, so it holds each row's number in the file
+        chunk = chunk.dropna()
+        yield rows_read, chunk['text'].astype(str).to_numpy(), chunk['label'].astype(str).to_numpy(), chunk.index.to_numpy()
+
+
+def split_rows(index):
+    """Boolean mask of held-out rows for the given row numbers"""
+    return index % TEST_EVERY == 0
+
+
+def fit_idf(path, chunk_size, vectorizer):
+    """Learn IDF weights from document frequencies of hashed training rows, one chunk at a time"""
+    hashing = vectorizer.named_steps['hash']
+    document_frequency = np.zeros(hashing.n_features, dtype=np.int64)
+    n_documents = 0
+    for _, texts, _, index in read_chunks(path, chunk_size):
+        train = ~split_rows(index)
+        counts = hashing.transform(texts[train])
+        # HashingVectorizer output has one entry per (document, column), so this counts documents
+        document_frequency += np.bincount(counts.indices, minlength=hashing.n_features)
+        n_documents += int(train.sum())
+    # Same smoothing as TfidfTransformer(smooth_idf=True)
+    return np.log((1 + n_documents) / (1 + document_frequency)) + 1, n_documents
+
+
+def prepare_vectorizer(vectorizer, idf):
+    """Mark the pipeline fitted; the hashing step is stateless and IDF comes from fit_idf()"""
+    hashing = vectorizer.named_steps['hash']
+    tfidf = vectorizer.named_steps['tfidf']
+    tfidf.fit(hashing.transform(['']))
+    if idf is not None:
+        tfidf.idf_ = idf
+    return vectorizer
+
+
+def save_pickle(obj, filename):
+    """Write a pickle atomically, so an interrupted run never leaves a truncated file"""
+    temporary = filename + '.tmp'
+    with open(temporary, 'wb') as f:
+        pickle.dump(obj, f)
+    os.replace(temporary, filename)
+
+
+def load_checkpoint():
+    """(model, vectorizer, state) from CHECKPOINT_FILE, ready to pass back to train()"""
+    with open(CHECKPOINT_FILE, 'rb') as f:
+        checkpoint = pickle.load(f)
+    return checkpoint.pop('model'), checkpoint.pop('vectorizer'), checkpoint
+
+
+def train(path, chunk_size, epochs, vectorizer, model, state):
+    """partial_fit over the training rows, chunk by chunk; state tracks progress for checkpoints"""
+    started = time.perf_counter()
+    trained = 0
+    for epoch in range(state['epoch'], epochs):
+        chunk_number = 0
+        for rows_read, texts, labels, index in read_chunks(path, chunk_size):
+            chunk_number += 1
+            # Chunks already in the checkpoint when resuming
+            if epoch == state['epoch'] and chunk_number <= state['chunks_done']:
+                continue
+            train_rows = ~split_rows(index)
+            if train_rows.any():
+                model.partial_fit(vectorizer.transform(texts[train_rows]), labels[train_rows], classes=CLASSES)
+                trained += int(train_rows.sum())
+
+            state['epoch'], state['chunks_done'] = epoch, chunk_number
+            if chunk_number % CHECKPOINT_EVERY == 0:
+                save_pickle({'model': model, 'vectorizer': vectorizer, **state}, CHECKPOINT_FILE)
+                elapsed = time.perf_counter() - started
+                print(f"  epoch {epoch + 1}, rows {rows_read:,}: "
+                      f"{trained / elapsed:,.0f} docs/sec, RSS {format_rss()} (checkpoint saved)")
+        state['epoch'], state['chunks_done'] = epoch + 1, 0
+    return trained, time.perf_counter() - started
+
+
+def evaluate(path, chunk_size, vectorizer, model):
+    """Accuracy and confusion matrix on the held-out rows"""
+    correct = 0
+    total = 0
+    confusion = np.zeros((2, 2), dtype=np.int64)
+    for _, texts, labels, index in read_chunks(path, chunk_size):
+        test_rows = split_rows(index)
+        if not test_rows.any():
+            continue
+        predicted = model.predict(vectorizer.transform(texts[test_rows]))
+        expected = labels[test_rows]
+        correct += int((predicted == expected).sum())
+        total += len(expected)
+        for row, label in enumerate(CLASSES):
+            for column, guess in enumerate(CLASSES):
+                confusion[row, column] += int(((expected == label) & (predicted == guess)).sum())
+    return correct / total if total else 0.0, confusion
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the feature-hashing model out of core")
+    parser.add_argument('csv', nargs='?', default='news.csv')
+    parser.add_argument('--chunk-size', type=int, default=5000, help="rows per chunk")
+    parser.add_argument('--epochs', type=int, default=1, help="passes over the training rows")
+    parser.add_argument('--no-idf', action='store_true', help="hashed term frequencies only (skips the IDF pass)")
+    parser.add_argument('--resume', action='store_true', help=f"continue from {CHECKPOINT_FILE}")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Fake News Detection Out-of-Core Training")
+    print("=" * 60)
+    if not os.path.exists(args.csv):
+        print(f"✗ Dataset not found: {args.csv}")
+        exit(1)
+    print(f"Dataset: {args.csv} ({os.path.getsize(args.csv) / 1e6:,.1f} MB), "
+          f"chunks of {args.chunk_size:,} rows, RSS {format_rss()}")
+
+    if args.resume and os.path.exists(CHECKPOINT_FILE):
+        model, vectorizer, state = load_checkpoint()
+        if state['chunk_size'] != args.chunk_size:
+            print(f"✗ Checkpoint was written with --chunk-size {state['chunk_size']}")
+            exit(1)
+        print(f"\n[1/3] Resuming from {CHECKPOINT_FILE}: epoch {state['epoch'] + 1}, "
+              f"{state['chunks_done']} chunks done")
+    else:
+        vectorizer = make_hashing_vectorizer(N_FEATURES, use_idf=not args.no_idf)
+        if args.no_idf:
+            print("\n[1/3] Skipping IDF pass (--no-idf)")
+            idf, n_documents = None, None
+        else:
+            print("\n[1/3] Counting document frequencies...")
+            started = time.perf_counter()
+            idf, n_documents = fit_idf(args.csv, args.chunk_size, vectorizer)
+            elapsed = time.perf_counter() - started
+            print(f"✓ IDF learned from {n_documents:,} documents "
+                  f"({n_documents / elapsed:,.0f} docs/sec, RSS {format_rss()})")
+        prepare_vectorizer(vectorizer, idf)
+        model = PassiveAggressiveClassifier()
+        state = {'chunk_size': args.chunk_size, 'epoch': 0, 'chunks_done': 0}
+
+    print(f"\n[2/3] Training PassiveAggressiveClassifier with partial_fit ({args.epochs} epoch(s))...")
+    trained, elapsed = train(args.csv, args.chunk_size, args.epochs, vectorizer, model, state)
+    if trained:
+        print(f"✓ Trained on {trained:,} documents in {elapsed:.1f}s "
+              f"({trained / elapsed:,.0f} docs/sec, RSS {format_rss()})")
+    else:
+        print("✓ Nothing left to train")
+
+    print("\n[3/3] Evaluating on held-out rows...")
+    score, confusion = evaluate(args.csv, args.chunk_size, vectorizer, model)
+    print(f"✓ Accuracy: {round(score * 100, 2)}%")
+    print(f"\nConfusion Matrix:")
+    print(f"  FAKE: {confusion[0]}")
+    print(f"  REAL: {confusion[1]}")
+
+    print("\n" + "=" * 60)
+    print("Saving model files...")
+    print("=" * 60)
+    for filename, obj in (('hashing_model.pkl', model), ('hashing_vectorizer.pkl', vectorizer)):
+        save_pickle(obj, filename)
+        print(f"✓ Saved: {filename} ({os.path.getsize(filename):,} bytes)")
+    if os.path.exists(CHECKPOINT_FILE):
+        os.remove(CHECKPOINT_FILE)
+    print(f"\nPeak RSS: {format_peak_rss()}")
+    print("\nNext steps:")
+    print("1. Copy hashing_model.pkl and hashing_vectorizer.pkl to the Backend directory")
+    print("2. Restart the Flask server with FEATURE_PIPELINE=hashing")
+
+
+if __name__ == '__main__':
+    main()
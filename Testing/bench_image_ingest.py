@@ -0,0 +1,143 @@
+"""
+Benchmark for single-read image ingest.
+
+Compares the previous image request flow (read + decode for OCR, then seek
+back, read again and re-open for metadata, then seek to the end for the file
+size) with ImageIngest, which reads the upload once and shares one decoded
+image. OCR itself is left out so only ingest costs are measured.
+
+Peak memory is measured in a fresh process per flow (peak RSS growth while
+handling one request), since PIL pixel buffers are not visible to tracemalloc.
+Linux/macOS only.
+
+Run from anywhere: python Testing/bench_image_ingest.py
+"""
+
+import io
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+from PIL import Image, ImageDraw
+
+from image_ingest import ImageIngest
+
+WIDTH, HEIGHT = 2160, 7200  # long phone screenshot
+REPEAT = 10
+
+
+def make_upload(fmt):
+    """Encoded screenshot bytes in the given format"""
+    image = Image.new('RGB', (WIDTH, HEIGHT), color='white')
+    draw = ImageDraw.Draw(image)
+    for row in range(0, HEIGHT, 60):
+        draw.text((40, row), "Breaking news: officials confirm the report " * 3, fill='black')
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def legacy_flow(upload):
+    """The previous predict_image() ingest path"""
+    image_file = io.BytesIO(upload)
+
+    # predict_image(): size check
+    image_file.seek(0, os.SEEK_END)
+    image_file.tell()
+    image_file.seek(0)
+
+    # extract_text_from_image()
+    image = Image.open(io.BytesIO(image_file.read()))
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    image.load()
+
+    # analyze_image_metadata()
+    image_file.seek(0)
+    meta_image = Image.open(io.BytesIO(image_file.read()))
+    metadata = {
+        "format": meta_image.format,
+        "size": meta_image.size,
+        "mode": meta_image.mode,
+        "has_exif": hasattr(meta_image, '_getexif') and meta_image._getexif() is not None
+    }
+    image_file.seek(0, os.SEEK_END)
+    metadata["file_size_kb"] = round(image_file.tell() / 1024, 2)
+    image_file.seek(0)
+    return image, metadata
+
+
+def ingest_flow(upload):
+    """The ImageIngest path"""
+    ingest = ImageIngest.from_upload(io.BytesIO(upload), 10 * 1024 * 1024)
+    image = ingest.rgb_image()
+    return image, ingest.metadata()
+
+
+FLOWS = {"legacy": legacy_flow, "ingest": ingest_flow}
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB"""
+    # VmHWM is reset on exec, unlike ru_maxrss which Linux carries over from the parent
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == 'darwin' else peak
+
+
+def measure(flow_name, fmt, upload, results):
+    """Run in a fresh process: peak RSS growth for one request and mean CPU time"""
+    flow = FLOWS[flow_name]
+    baseline = peak_rss_kb()
+
+    flow(upload)
+    peak_mb = (peak_rss_kb() - baseline) / 1024.0
+
+    started = time.process_time()
+    for _ in range(REPEAT):
+        flow(upload)
+    cpu_ms = (time.process_time() - started) / REPEAT * 1000.0
+
+    results[(flow_name, fmt)] = (peak_mb, cpu_ms, len(upload))
+
+
+def main():
+    print("=" * 60)
+    print("Image Ingest Benchmark")
+    print("=" * 60)
+    print(f"Image: {WIDTH}x{HEIGHT} screenshot")
+
+    context = multiprocessing.get_context('spawn')
+    manager = context.Manager()
+    results = manager.dict()
+    for fmt in ('PNG', 'JPEG'):
+        # Encode in the parent so the child's baseline RSS excludes the source image
+        upload = make_upload(fmt)
+        for flow_name in FLOWS:
+            process = context.Process(target=measure, args=(flow_name, fmt, upload, results))
+            process.start()
+            process.join()
+
+    print(f"\n  {'format':<8}{'flow':<10}{'upload KB':>11}{'peak MB':>10}{'CPU ms':>10}")
+    for fmt in ('PNG', 'JPEG'):
+        for flow_name in FLOWS:
+            peak_mb, cpu_ms, size = results[(flow_name, fmt)]
+            print(f"  {fmt:<8}{flow_name:<10}{size / 1024:>11.0f}{peak_mb:>10.1f}{cpu_ms:>10.1f}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark and validation for the native linear scoring engine.
+
+Checks that LinearScorer matches model.predict (and the decision function)
+exactly on a validation set, then compares per-document latency against the
+sklearn path used by the API.
+
+Run from anywhere: python Testing/bench_linear_scorer.py
+"""
+
+import os
+import pickle
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+import numpy as np
+import pandas as pd
+
+from linear_scorer import LinearScorer
+
+SYNTHETIC_DOCS = 5000
+SEED = 20
+
+
+def build_validation_set():
+    """news.csv articles plus synthetic articles recombined from their words"""
+    df = pd.read_csv("news.csv").dropna()
+    texts = [f"{title} {text}" for title, text in zip(df['title'], df['text'])]
+
+    rng = random.Random(SEED)
+    words = " ".join(texts).split()
+    for _ in range(SYNTHETIC_DOCS):
+        length = rng.randint(5, 400)
+        texts.append(" ".join(rng.choice(words) for _ in range(length)))
+    # Edge cases: empty text and text with no known vocabulary
+    texts.extend(["", "zzzz qqqq xyzzy"])
+    return texts
+
+
+def time_per_doc(fn, texts, repeat=3):
+    """Best-of-N wall time per document in microseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(texts)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e6
+
+
+def main():
+    print("=" * 60)
+    print("Native Linear Scorer Benchmark")
+    print("=" * 60)
+
+    with open('finalized_model.pkl', 'rb') as f:
+        model = pickle.load(f)
+    with open('tfidf_vectorizer.pkl', 'rb') as f:
+        vectorizer = pickle.load(f)
+    scorer = LinearScorer.from_artifacts(model, vectorizer)
+
+    texts = build_validation_set()
+    print(f"\nValidation set: {len(texts)} documents")
+
+    # Correctness
+    expected = model.predict(vectorizer.transform(texts))
+    actual = scorer.predict(texts)
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+
+    expected_scores = model.decision_function(vectorizer.transform(texts))
+    actual_scores = np.array(scorer.decision_function(texts))
+    identical_scores = int(np.sum(expected_scores == actual_scores))
+
+    print(f"✓ Label mismatches: {mismatches}")
+    print(f"✓ Bit-identical decision scores: {identical_scores}/{len(texts)}")
+    print(f"  Max |score difference|: {np.max(np.abs(expected_scores - actual_scores)):.3e}")
+
+    # Latency: one document per call, as /api/predict does
+    single_texts = texts[:2000]
+    sklearn_single = time_per_doc(
+        lambda docs: [model.predict(vectorizer.transform([doc])) for doc in docs], single_texts)
+    native_single = time_per_doc(
+        lambda docs: [scorer.predict([doc]) for doc in docs], single_texts)
+
+    # Latency: whole batch per call, as /api/batch-predict does
+    sklearn_batch = time_per_doc(lambda docs: model.predict(vectorizer.transform(docs)), texts)
+    native_batch = time_per_doc(scorer.predict, texts)
+
+    print("\nPer-document latency (µs):")
+    print(f"  {'path':<20}{'sklearn':>12}{'native':>12}{'speedup':>10}")
+    print(f"  {'single-doc calls':<20}{sklearn_single:>12.1f}{native_single:>12.1f}{sklearn_single / native_single:>9.1f}x")
+    print(f"  {'batched call':<20}{sklearn_batch:>12.1f}{native_batch:>12.1f}{sklearn_batch / native_batch:>9.1f}x")
+
+    print("\n" + "=" * 60)
+    if mismatches:
+        print("✗ Native scorer does NOT match model.predict")
+        sys.exit(1)
+    print("✓ Native scorer matches model.predict")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
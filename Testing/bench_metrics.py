@@ -0,0 +1,122 @@
+"""
+Metrics overhead benchmark: the cost of the /metrics instrumentation.
+
+First times the recording calls on their own (a stage observation, a batch
+observation, and the per-request counter and histogram update), then serves
+/api/predict through the Flask test client in a fresh process per run with
+METRICS_ENABLED on and off. The two modes are alternated over several rounds,
+so drift on a busy machine affects both equally, and the median of each is
+compared. Finally reports how long one /metrics scrape takes and how big it is.
+
+Run from anywhere: python Testing/bench_metrics.py [requests] [rounds]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+
+# Runs in the child process
+CHILD = """
+import json, sys, time
+import pandas as pd
+import app
+app.readiness.finished.wait()
+
+count = int(sys.argv[1])
+df = pd.read_csv("news.csv").dropna()
+articles = [{"title": title, "text": text} for title, text in zip(df['title'], df['text'])]
+client = app.app.test_client()
+for article in articles[:50]:
+    client.post('/api/predict', json=article)
+
+latencies = []
+started = time.perf_counter()
+for idx in range(count):
+    request_started = time.perf_counter()
+    response = client.post('/api/predict', json=articles[idx % len(articles)])
+    latencies.append(time.perf_counter() - request_started)
+    assert response.status_code == 200, response.get_data(as_text=True)
+elapsed = time.perf_counter() - started
+
+scrape_ms = body = None
+if app.settings.METRICS_ENABLED:
+    scrape_started = time.perf_counter()
+    body = client.get('/metrics').get_data()
+    scrape_ms = (time.perf_counter() - scrape_started) * 1000.0
+latencies.sort()
+print("RESULT " + json.dumps({
+    "mean_ms": elapsed * 1000.0 / count,
+    "p50_ms": latencies[len(latencies) // 2] * 1000.0,
+    "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000.0,
+    "scrape_ms": scrape_ms,
+    "scrape_bytes": len(body) if body is not None else None
+}))
+"""
+
+
+def time_recording(iterations=200000):
+    """Nanoseconds per call of each recording function"""
+    sys.path.insert(0, BACKEND_DIR)
+    import metrics
+
+    calls = [
+        ("observe_stage", lambda: metrics.observe_stage("vectorize", 0.0012)),
+        ("observe_batch", lambda: metrics.observe_batch("batch_predict", 24)),
+        ("record_request", lambda: metrics.record_request("/api/predict", "POST", 200, 0.0031))
+    ]
+    results = {}
+    for name, call in calls:
+        call()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        results[name] = (time.perf_counter() - started) * 1e9 / iterations
+    return results
+
+
+def run_mode(count, enabled):
+    # Caching off so every request runs the model and records its stage timings
+    env = dict(os.environ, METRICS_ENABLED='true' if enabled else 'false',
+               PREDICTION_CACHE_ENABLED='false', NEAR_DUPLICATE_ENABLED='false')
+    output = subprocess.run([sys.executable, '-c', CHILD, str(count)], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(next(line for line in output.splitlines() if line.startswith("RESULT "))[7:])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print("=" * 60)
+    print("Metrics Overhead Benchmark")
+    print("=" * 60)
+    print("Recording cost (ns per call):")
+    for name, ns in time_recording().items():
+        print(f"  {name:<16}{ns:>8.0f}")
+
+    print(f"\n{count:,} /api/predict requests per run, {rounds} rounds per mode (alternating)\n")
+    print(f"  {'metrics':<10}{'round':>6}{'mean ms':>9}{'p50 ms':>8}{'p99 ms':>8}")
+    results = {True: [], False: []}
+    for round_number in range(1, rounds + 1):
+        for enabled in (False, True):
+            result = run_mode(count, enabled)
+            results[enabled].append(result)
+            print(f"  {'on' if enabled else 'off':<10}{round_number:>6}{result['mean_ms']:>9.3f}"
+                  f"{result['p50_ms']:>8.3f}{result['p99_ms']:>8.3f}")
+
+    off = statistics.median(result["mean_ms"] for result in results[False])
+    on = statistics.median(result["mean_ms"] for result in results[True])
+    print(f"\nMedian mean latency: off {off:.3f} ms, on {on:.3f} ms "
+          f"({(on - off) * 1000.0:+.1f} us, {(on - off) / off:+.1%})")
+    scrape = results[True][-1]
+    print(f"One /metrics scrape: {scrape['scrape_ms']:.2f} ms, {scrape['scrape_bytes']:,} bytes")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
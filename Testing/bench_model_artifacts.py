@@ -0,0 +1,162 @@
+"""
+Benchmark for memory-mapped model artifacts against pickle.
+
+Builds a Kaggle-sized TF-IDF model (synthetic vocabulary, default 300,000
+terms), saves it both as pickles and in the memory-mapped format, then starts
+several worker processes per format that load the artifacts and score a few
+articles, as gunicorn workers would. Reports load time, RSS, private memory
+and the proportional set size (PSS) summed over all workers, which is what
+the host actually pays, next to a baseline of workers that only import the
+libraries. Checks that both formats predict the same labels.
+
+PSS and private memory come from /proc/<pid>/smaps_rollup (Linux only).
+
+Run from anywhere: python Testing/bench_model_artifacts.py [workers] [features]
+"""
+
+import json
+import os
+import pickle
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
+from sklearn.linear_model import PassiveAggressiveClassifier
+
+import model_artifacts
+
+SEED = 20
+ARTICLE_WORDS = 400
+
+# Runs in each worker: load one format, score the articles, report, wait for the parent
+WORKER = r'''
+import json, os, pickle, sys, time
+sys.path.insert(0, {backend!r})
+started = time.perf_counter()
+import model_artifacts
+imported = time.perf_counter()
+if {fmt!r} == 'none':
+    model = vectorizer = None
+elif {fmt!r} == 'mmap':
+    model, vectorizer = model_artifacts.load_artifacts({artifacts!r})
+else:
+    with open({model_path!r}, 'rb') as f:
+        model = pickle.load(f)
+    with open({vectorizer_path!r}, 'rb') as f:
+        vectorizer = pickle.load(f)
+loaded = time.perf_counter()
+with open({articles!r}) as f:
+    articles = json.load(f)
+labels = [str(label) for label in model.predict(vectorizer.transform(articles))] if model is not None else []
+scored = time.perf_counter()
+print(json.dumps({{"load_ms": (loaded - imported) * 1000.0, "first_batch_ms": (scored - loaded) * 1000.0,
+                  "labels": labels}}), flush=True)
+sys.stdin.readline()
+'''
+
+
+def synthetic_model(features):
+    """A fitted vectorizer and classifier with a large synthetic vocabulary"""
+    rng = random.Random(SEED)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    terms = set()
+    while len(terms) < features:
+        terms.add(''.join(rng.choice(letters) for _ in range(rng.randint(3, 14))))
+    terms = sorted(terms)
+
+    vectorizer = TfidfVectorizer(stop_words='english', max_df=0.7)
+    vectorizer.vocabulary_ = {term: index for index, term in enumerate(terms)}
+    vectorizer.fixed_vocabulary_ = False
+    vectorizer._tfidf = TfidfTransformer()
+    vectorizer._tfidf.idf_ = np.random.default_rng(SEED).uniform(1.0, 9.0, features)
+
+    model = PassiveAggressiveClassifier(max_iter=50)
+    model.coef_ = np.random.default_rng(SEED + 1).normal(0.0, 1.0, (1, features))
+    model.intercept_ = np.array([0.0])
+    model.classes_ = np.array(['FAKE', 'REAL'], dtype=object)
+    model.n_features_in_ = features
+
+    articles = [' '.join(rng.choice(terms) for _ in range(ARTICLE_WORDS)) for _ in range(20)]
+    return model, vectorizer, articles
+
+
+def memory(pid):
+    """RSS, private and proportional memory of a process in MB"""
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(':') and parts[1].isdigit():
+                values[parts[0][:-1]] = int(parts[1]) / 1024.0
+    private = values.get('Private_Clean', 0.0) + values.get('Private_Dirty', 0.0)
+    return values.get('Rss', 0.0), private, values.get('Pss', 0.0)
+
+
+def run_workers(fmt, workers, paths):
+    """Start workers for one format, measure them while all are alive; returns (reports, memory)"""
+    code = WORKER.format(backend=BACKEND_DIR, fmt=fmt, **paths)
+    processes = [subprocess.Popen([sys.executable, '-c', code], stdin=subprocess.PIPE,
+                                  stdout=subprocess.PIPE, text=True) for _ in range(workers)]
+    reports = [json.loads(process.stdout.readline()) for process in processes]
+    usage = [memory(process.pid) for process in processes]
+    for process in processes:
+        process.stdin.write('\n')
+        process.stdin.flush()
+        process.wait()
+    return reports, usage
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    features = int(sys.argv[2]) if len(sys.argv) > 2 else 300000
+
+    print("=" * 60)
+    print("Model Artifact Format Benchmark")
+    print("=" * 60)
+
+    model, vectorizer, articles = synthetic_model(features)
+    directory = tempfile.mkdtemp(prefix='artifacts-')
+    paths = {
+        'model_path': os.path.join(directory, 'finalized_model.pkl'),
+        'vectorizer_path': os.path.join(directory, 'tfidf_vectorizer.pkl'),
+        'artifacts': os.path.join(directory, 'model_artifacts'),
+        'articles': os.path.join(directory, 'articles.json')
+    }
+    with open(paths['model_path'], 'wb') as f:
+        pickle.dump(model, f)
+    with open(paths['vectorizer_path'], 'wb') as f:
+        pickle.dump(vectorizer, f)
+    mapped_size = sum(os.path.getsize(path) for path in model_artifacts.export_artifacts(model, vectorizer, paths['artifacts']))
+    with open(paths['articles'], 'w') as f:
+        json.dump(articles, f)
+
+    pickle_size = os.path.getsize(paths['model_path']) + os.path.getsize(paths['vectorizer_path'])
+    print(f"Features: {features:,}, workers: {workers}")
+    print(f"On disk: pickle {pickle_size / 1e6:.1f} MB, mmap {mapped_size / 1e6:.1f} MB")
+
+    results = {}
+    print(f"\n  {'format':<8}{'load ms':>9}{'1st batch ms':>14}{'RSS MB':>9}{'private MB':>12}{'total PSS MB':>14}")
+    for fmt in ('none', 'pickle', 'mmap'):
+        reports, usage = run_workers(fmt, workers, paths)
+        results[fmt] = reports[0]["labels"]
+        load = sum(report["load_ms"] for report in reports) / workers
+        first = sum(report["first_batch_ms"] for report in reports) / workers
+        rss = sum(value[0] for value in usage) / workers
+        private = sum(value[1] for value in usage) / workers
+        pss = sum(value[2] for value in usage)
+        print(f"  {fmt if fmt != 'none' else 'baseline':<8}{load:>9.1f}{first:>14.1f}{rss:>9.1f}{private:>12.1f}{pss:>14.1f}")
+
+    print(f"\n{'✓' if results['pickle'] == results['mmap'] else '✗'} Both formats predict the same labels")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
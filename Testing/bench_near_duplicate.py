@@ -0,0 +1,120 @@
+"""
+Benchmark for the MinHash near-duplicate index.
+
+Measures:
+  - recall on lightly edited reposts (new headline, byline, tracking junk, word edits)
+  - false matches on unrelated articles
+  - lookup latency and memory with a large number of stored fingerprints
+
+Run from anywhere: python Testing/bench_near_duplicate.py [filler_fingerprints]
+"""
+
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+import numpy as np
+import pandas as pd
+
+from near_duplicate import NearDuplicateIndex
+
+BASE_ARTICLES = 2000
+ARTICLE_WORDS = (150, 600)
+SEED = 20
+
+BYLINE = "By Jane Doe, Staff Reporter. Copyright 2024 Example News Network. All rights reserved."
+TRACKING = "Share this story utm_source=twitter utm_medium=social utm_campaign=syndication Subscribe to our newsletter"
+
+
+def make_variants(rng, article, words):
+    """Lightly edited reposts of an article"""
+    tokens = article.split()
+    new_headline = " ".join(rng.choice(words) for _ in range(10)) + " " + " ".join(tokens[10:])
+
+    edited = list(tokens)
+    for _ in range(max(1, len(tokens) // 50)):
+        edited[rng.randrange(len(edited))] = rng.choice(words)
+
+    return {
+        "new headline": new_headline,
+        "byline appended": f"{article} {BYLINE}",
+        "tracking appended": f"{article} {TRACKING}",
+        "2% words edited": " ".join(edited)
+    }
+
+
+def main():
+    filler = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    print("=" * 60)
+    print("Near-Duplicate Index Benchmark")
+    print("=" * 60)
+
+    df = pd.read_csv("news.csv").dropna()
+    words = " ".join(df['text']).split()
+    rng = random.Random(SEED)
+
+    def random_article():
+        return " ".join(rng.choice(words) for _ in range(rng.randint(*ARTICLE_WORDS)))
+
+    index = NearDuplicateIndex(capacity=filler + BASE_ARTICLES)
+
+    # Index the original articles
+    originals = [random_article() for _ in range(BASE_ARTICLES)]
+    start = time.perf_counter()
+    for idx, article in enumerate(originals):
+        index.add(index.fingerprint(article), idx)
+    fingerprint_us = (time.perf_counter() - start) / BASE_ARTICLES * 1e6
+
+    # Fill the index with random signatures to measure lookup at scale
+    print(f"\nFilling index with {filler:,} additional fingerprints...")
+    filler_rng = np.random.RandomState(SEED + 1)
+    for _ in range(filler):
+        index.add(filler_rng.randint(0, 1 << 32, size=index.num_perm, dtype=np.uint64), -1)
+
+    # Recall on edited reposts
+    found = {}
+    total = {}
+    lookup_times = []
+    for idx, article in enumerate(originals):
+        for kind, variant in make_variants(rng, article, words).items():
+            fingerprint = index.fingerprint(variant)
+            start = time.perf_counter()
+            verdict = index.lookup(fingerprint)
+            lookup_times.append(time.perf_counter() - start)
+            total[kind] = total.get(kind, 0) + 1
+            found[kind] = found.get(kind, 0) + (verdict == idx)
+
+    # False matches on unrelated articles
+    false_matches = 0
+    unrelated = 1000
+    for _ in range(unrelated):
+        fingerprint = index.fingerprint(random_article())
+        start = time.perf_counter()
+        if index.lookup(fingerprint) is not None:
+            false_matches += 1
+        lookup_times.append(time.perf_counter() - start)
+
+    lookup_times.sort()
+    p50 = lookup_times[len(lookup_times) // 2] * 1e6
+    p99 = lookup_times[int(len(lookup_times) * 0.99)] * 1e6
+
+    print(f"\nRecall on edited reposts (Jaccard threshold {index.threshold}):")
+    for kind in total:
+        print(f"  {kind:<22}{found[kind] / total[kind] * 100:>7.1f}%")
+    print(f"\nFalse matches on unrelated articles: {false_matches}/{unrelated}")
+
+    stats = index.stats()
+    print(f"\nIndex size: {stats['size']:,} fingerprints, ~{stats['memory_mb']} MB")
+    print(f"Fingerprint time: {fingerprint_us:.0f} µs per article")
+    print(f"Lookup latency: p50 {p50:.1f} µs, p99 {p99:.1f} µs")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
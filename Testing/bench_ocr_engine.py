@@ -0,0 +1,127 @@
+"""
+Benchmark for the OCR engine layer.
+
+Compares the original subprocess-per-image pytesseract path with the pooled,
+persistent tesserocr engine on the same set of generated screenshots, running
+requests concurrently from a thread pool as the API would.
+
+With tesserocr installed, a third row creates a new Tesseract instance for
+every image. That is the language-data reload the subprocess path pays on
+each call, without the process start and temp file, so it is a lower bound
+for the subprocess cost. It can be measured where no `tesseract` executable
+is installed.
+
+Requires Tesseract; the pooled engine also needs `pip install tesserocr`
+(see requirements-optional.txt).
+
+Run from anywhere: python Testing/bench_ocr_engine.py [images] [concurrency]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+from PIL import Image, ImageDraw, ImageFont
+
+from ocr_engine import (PYTESSERACT_AVAILABLE, TESSEROCR_AVAILABLE,
+                        PytesseractEngine, TesserocrEngine, TesseractNotFoundError)
+
+LINES = [
+    "BREAKING: Officials confirm new policy announcement",
+    "Sources say the decision was made late on Monday night",
+    "after weeks of negotiations between the two parties.",
+    "Critics argue the plan will not address the real issues",
+    "while supporters call it a historic step forward."
+]
+
+
+def make_screenshot(number):
+    """A phone-sized screenshot with a few lines of text"""
+    image = Image.new('RGB', (1080, 900), color='white')
+    draw = ImageDraw.Draw(image)
+    try:
+        font = ImageFont.load_default(size=36)
+    except TypeError:
+        font = ImageFont.load_default()
+    for row, line in enumerate(LINES):
+        draw.text((40, 60 + row * 70), f"{line} #{number}" if row == 0 else line, fill='black', font=font)
+    return image
+
+
+class FreshInstanceEngine(TesserocrEngine):
+    """tesserocr with a new instance (and language-data load) per image, like one subprocess per call"""
+
+    def _recognize(self, image):
+        api = self._new_instance()
+        try:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+        finally:
+            api.End()
+
+
+def run(engine, images, concurrency):
+    """Images/sec and latency percentiles for one engine"""
+    latencies = []
+
+    def recognize(image):
+        started = time.perf_counter()
+        engine.image_to_string(image)
+        latencies.append(time.perf_counter() - started)
+
+    # Warm up (first call loads language data)
+    engine.image_to_string(images[0])
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(recognize, images))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "images_per_sec": len(images) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000.0
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 2)
+
+    print("=" * 60)
+    print("OCR Engine Benchmark")
+    print("=" * 60)
+    print(f"Images: {count}, concurrency: {concurrency}")
+
+    images = [make_screenshot(number) for number in range(count)]
+    engines = []
+    if PYTESSERACT_AVAILABLE:
+        engines.append(("pytesseract (subprocess per image)", PytesseractEngine()))
+    if TESSEROCR_AVAILABLE:
+        engines.append((f"tesserocr pool ({concurrency} instances)", TesserocrEngine(pool_size=concurrency)))
+        engines.append(("tesserocr, new instance per image", FreshInstanceEngine(pool_size=1)))
+    if not engines:
+        print("✗ Neither pytesseract nor tesserocr is installed")
+        sys.exit(1)
+    if not TESSEROCR_AVAILABLE:
+        print("⚠ tesserocr not installed - only the subprocess path will be measured")
+
+    print(f"\n  {'engine':<38}{'img/s':>8}{'p50 ms':>10}{'p95 ms':>10}")
+    for label, engine in engines:
+        try:
+            result = run(engine, images, concurrency)
+        except TesseractNotFoundError as e:
+            print(f"  {label:<38}  skipped: {e}")
+            continue
+        print(f"  {label:<38}{result['images_per_sec']:>8.1f}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark for tiled OCR of very tall screenshots.
+
+Renders long scrolling screenshots of a news thread and compares single-pass
+OCR with tiled OCR (overlapping strips recognised in parallel), reporting wall
+time, the summed strip time and word accuracy, and checking that no line is
+lost or duplicated at the strip overlaps. Two layouts are rendered: distinct
+numbered posts, and a comment thread where every post is followed by the same
+"Reply" line, so repeated lines fall inside the overlaps.
+
+Requires Tesseract; the pooled engine also needs `pip install tesserocr`.
+
+Run from anywhere: python Testing/bench_ocr_tiling.py [workers]
+"""
+
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+from PIL import Image, ImageDraw, ImageFont
+
+import ocr_tiling
+from ocr_engine import create_ocr_engine
+
+SENTENCES = [
+    "Government officials announced a new economic plan on Monday",
+    "The proposal includes tax changes for small businesses",
+    "Analysts expect the measure to pass before the end of the year",
+    "Opposition leaders said they would review the details carefully",
+    "Markets reacted calmly to the news during afternoon trading"
+]
+
+FONT_SIZE = 40
+LINE_SPACING = 90
+
+
+def thread_lines(count, replies=False):
+    """Numbered post lines, each followed by a "Reply" line in the comment layout"""
+    lines = []
+    for number in range(count):
+        lines.append(f"Post {number}: {SENTENCES[number % len(SENTENCES)]}")
+        if replies:
+            lines.append("Reply")
+    return lines[:count]
+
+
+def render(height, replies=False, width=1080):
+    """A scrolling screenshot filled with thread lines; returns (image, lines)"""
+    lines = thread_lines((height - 80) // LINE_SPACING, replies)
+    image = Image.new('RGB', (width, height), color='white')
+    draw = ImageDraw.Draw(image)
+    try:
+        font = ImageFont.load_default(size=FONT_SIZE)
+    except TypeError:
+        font = ImageFont.load_default()
+    for row, line in enumerate(lines):
+        draw.text((30, 40 + row * LINE_SPACING), line, fill='black', font=font)
+    return image, lines
+
+
+def post_numbers(text):
+    """Post numbers found in the OCR output, in order"""
+    return [int(number) for number in re.findall(r"Post (\d+)", text)]
+
+
+def line_errors(lines, text):
+    """(duplicated, lost) lines: posts by number, "Reply" lines by count"""
+    numbers = post_numbers(text)
+    expected = set(post_numbers("\n".join(lines)))
+    replies = len(re.findall(r"^\W*Reply\W*$", text, re.MULTILINE)) - lines.count("Reply")
+    return (len(numbers) - len(set(numbers)) + max(replies, 0),
+            len(expected - set(numbers)) + max(-replies, 0))
+
+
+def word_accuracy(lines, extracted):
+    """Fraction of expected words found in the OCR output"""
+    expected = re.findall(r"\w+", " ".join(lines).lower())
+    found = set(re.findall(r"\w+", extracted.lower()))
+    return sum(1 for word in expected if word in found) / len(expected)
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 2)
+
+    print("=" * 60)
+    print("Tiled OCR Benchmark")
+    print("=" * 60)
+
+    engine = create_ocr_engine(pool_size=workers)
+    if engine is None:
+        print("✗ No OCR engine available")
+        sys.exit(1)
+    print(f"Engine: {engine.name}, {workers} workers, strips of 1600 px overlapping by 200 px")
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    print(f"\n  {'layout':<9}{'height':>7}{'single ms':>11}{'tiled ms':>10}{'strips':>8}{'strip sum':>11}"
+          f"{'speedup':>9}{'single acc':>12}{'tiled acc':>11}{'dup/lost':>10}")
+    for replies, height in [(replies, height) for replies in (False, True) for height in (4000, 8000, 16000)]:
+        image, lines = render(height, replies)
+
+        started = time.perf_counter()
+        single_text = engine.image_to_string(image)
+        single_ms = (time.perf_counter() - started) * 1000.0
+
+        tiled_text, timings = ocr_tiling.ocr_tiled(image, engine.image_to_string, executor)
+
+        duplicated, lost = line_errors(lines, tiled_text)
+        print(f"  {'replies' if replies else 'posts':<9}{height:>7}{single_ms:>11.0f}{timings['wall_ms']:>10.0f}{timings['strips']:>8}"
+              f"{timings['strip_sum_ms']:>11.0f}{single_ms / timings['wall_ms']:>8.1f}x"
+              f"{word_accuracy(lines, single_text) * 100:>11.0f}%"
+              f"{word_accuracy(lines, tiled_text) * 100:>10.0f}%{f'{duplicated}/{lost}':>10}")
+
+    executor.shutdown()
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
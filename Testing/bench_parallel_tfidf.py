@@ -0,0 +1,77 @@
+"""
+Benchmark for the parallel map-reduce TF-IDF fit.
+
+Fits the training vectorizer (stop_words='english', max_df=0.7) on a
+synthetic corpus recombined from news.csv words, on one core with
+TfidfVectorizer.fit_transform and with parallel_fit_transform for a range
+of worker counts, checks the vocabulary and IDF match, and reports the
+speedup. Scaling depends on the cores available: the merge of shard counts
+runs in the parent process.
+
+Run from anywhere: python Testing/bench_parallel_tfidf.py [documents] [max jobs]
+"""
+
+import os
+import random
+import sys
+import time
+
+ML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Machine learning')
+sys.path.insert(0, ML_DIR)
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from parallel_tfidf import parallel_fit_transform
+
+PARAMS = {'stop_words': 'english', 'max_df': 0.7}
+SEED = 20
+
+
+def build_corpus(count):
+    """Articles of 200-800 words drawn from news.csv, with rare tokens so the vocabulary grows"""
+    df = pd.read_csv(os.path.join(ML_DIR, "news.csv")).dropna()
+    words = " ".join(df['text']).split()
+    rng = random.Random(SEED)
+    documents = []
+    for _ in range(count):
+        length = rng.randint(200, 800)
+        tokens = [rng.choice(words) for _ in range(length)]
+        tokens.extend(f"term{rng.randint(0, count * 10)}" for _ in range(length // 20))
+        documents.append(" ".join(tokens))
+    return documents
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    print("=" * 60)
+    print("Parallel TF-IDF Fit Benchmark")
+    print("=" * 60)
+    documents = build_corpus(count)
+    print(f"{count:,} documents, {sum(len(d) for d in documents) / 1e6:.0f} MB of text, "
+          f"{os.cpu_count()} CPU(s)")
+
+    started = time.perf_counter()
+    reference = TfidfVectorizer(**PARAMS)
+    reference.fit_transform(documents)
+    baseline = time.perf_counter() - started
+    print(f"\n  {'fit':<16}{'seconds':>9}{'speedup':>9}{'identical':>11}")
+    print(f"  {'single core':<16}{baseline:>9.2f}{1.0:>8.2f}x{'-':>11}")
+
+    jobs = 1
+    while jobs <= max_jobs:
+        started = time.perf_counter()
+        vectorizer, _ = parallel_fit_transform(TfidfVectorizer(**PARAMS), documents, jobs)
+        elapsed = time.perf_counter() - started
+        identical = vectorizer.vocabulary_ == reference.vocabulary_ and np.array_equal(vectorizer.idf_, reference.idf_)
+        print(f"  {f'{jobs} job(s)':<16}{elapsed:>9.2f}{baseline / elapsed:>8.2f}x{'yes' if identical else 'NO':>11}")
+        jobs *= 2
+    print(f"\nVocabulary: {len(reference.vocabulary_):,} terms")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
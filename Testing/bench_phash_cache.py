@@ -0,0 +1,186 @@
+"""
+Benchmark for the perceptual-hash OCR cache.
+
+Generates a set of distinct news screenshots (same layout, different text,
+which is the hardest case for a perceptual hash), stores each original in the
+cache and then looks up re-encoded variants of every screenshot: JPEG at
+several qualities, downscaled copies and a slight crop. For each hash method
+and Hamming-distance threshold it reports how many variants hit their own
+original (recall), how many hit a different screenshot (false hits, which
+would return the wrong text), plus hashing and lookup time.
+
+Each screenshot is also re-rendered with one word of its text replaced, in
+the same layout. Those edited copies, and JPEG re-encodes of them, must never
+hit: the script exits non-zero if any does at the default settings.
+
+Run from anywhere: python Testing/bench_phash_cache.py [screenshots]
+"""
+
+import io
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from phash_cache import _POPCOUNT, HASH_METHODS, PerceptualHashCache
+
+WORDS = ("government officials announced new plan economy tax report breaking sources "
+         "confirm claim viral video president election vaccine study scientists warn "
+         "market crash record police statement leaked document secret deal").split()
+THRESHOLDS = (8, 16, 24, 32, 48)
+
+
+def screenshot_lines(rng):
+    """Headline and body lines of a random screenshot"""
+    headline = " ".join(rng.choice(WORDS) for _ in range(4)).upper()
+    return headline, [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))) for _ in range(rng.randint(8, 20))]
+
+
+def edit_one_word(rng, lines):
+    """The same lines with one word replaced by a different word"""
+    lines = list(lines)
+    row = rng.randrange(len(lines))
+    words = lines[row].split()
+    # Long lines run off the right edge; the first four words are always fully drawn
+    position = rng.randrange(min(len(words), 4))
+    words[position] = rng.choice([word for word in WORDS if word != words[position]])
+    lines[row] = " ".join(words)
+    return lines
+
+
+def make_screenshot(headline, lines):
+    """A phone screenshot with a headline bar and lines of text"""
+    image = Image.new('RGB', (1080, 1920), color='white')
+    draw = ImageDraw.Draw(image)
+    try:
+        font = ImageFont.load_default(size=44)
+    except TypeError:
+        font = ImageFont.load_default()
+    draw.rectangle((0, 0, 1080, 160), fill=(29, 161, 242))
+    draw.text((40, 50), headline, fill='white', font=font)
+    for row, line in enumerate(lines):
+        draw.text((40, 220 + row * 80), line, fill='black', font=font)
+    return image
+
+
+def reencode(image, fmt='JPEG', quality=75, scale=1.0, crop=0.0):
+    """Re-share an image: optional crop and resize, then save and decode again"""
+    if crop:
+        width, height = image.size
+        image = image.crop((int(width * crop), int(height * crop), int(width * (1 - crop)), int(height * (1 - crop))))
+    if scale != 1.0:
+        image = image.resize((int(image.width * scale), int(image.height * scale)), Image.BILINEAR)
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, quality=quality)
+    buffer.seek(0)
+    return Image.open(buffer).convert('RGB')
+
+
+VARIANTS = {
+    "jpeg q85": lambda image: reencode(image, quality=85),
+    "jpeg q50": lambda image: reencode(image, quality=50),
+    "jpeg q25": lambda image: reencode(image, quality=25),
+    "75% + jpeg q70": lambda image: reencode(image, quality=70, scale=0.75),
+    "50% + jpeg q70": lambda image: reencode(image, quality=70, scale=0.5),
+    "1% crop + jpeg q80": lambda image: reencode(image, quality=80, crop=0.01)
+}
+
+# Variants of the edited screenshot; none of them may hit the original
+EDITED_VARIANTS = {
+    "edited": lambda image: image,
+    "edited + jpeg q85": lambda image: reencode(image, quality=85),
+    "edited + jpeg q50": lambda image: reencode(image, quality=50)
+}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(7)
+
+    print("=" * 60)
+    print("Perceptual-hash OCR Cache Benchmark")
+    print("=" * 60)
+    print(f"Screenshots: {count}, variants per screenshot: {len(VARIANTS)}")
+
+    # Hash as we go: keeping every decoded screenshot would take gigabytes
+    probes = {method: PerceptualHashCache(capacity=count, method=method) for method in HASH_METHODS}
+    stored = {method: [] for method in HASH_METHODS}
+    queries = {method: [] for method in HASH_METHODS}
+    edited = {method: [] for method in HASH_METHODS}
+    hash_seconds = {method: 0.0 for method in HASH_METHODS}
+    for index in range(count):
+        headline, lines = screenshot_lines(rng)
+        original = make_screenshot(headline, lines)
+        for method, probe in probes.items():
+            started = time.perf_counter()
+            stored[method].append(probe.fingerprint(original))
+            hash_seconds[method] += time.perf_counter() - started
+        for name, build in VARIANTS.items():
+            variant = build(original)
+            for method, probe in probes.items():
+                queries[method].append((index, name, probe.fingerprint(variant)))
+        changed = make_screenshot(headline, edit_one_word(rng, lines))
+        for name, build in EDITED_VARIANTS.items():
+            variant = build(changed)
+            for method, probe in probes.items():
+                edited[method].append((index, name, probe.fingerprint(variant)))
+
+    edited_false_hits = 0
+    for method in HASH_METHODS:
+        probe = probes[method]
+        hash_ms = hash_seconds[method] / count * 1000.0
+        print(f"\n{method} ({probe.hash_size * probe.hash_size} bits, {hash_ms:.1f} ms per 1080x1920 hash)")
+        # Safety margin: how close do two different screenshots get?
+        hashes = np.array([fingerprint[0] for fingerprint in stored[method]])
+        closest = min(int(_POPCOUNT[np.bitwise_xor(hashes[index + 1:], hashes[index])].sum(axis=1).min())
+                      for index in range(count - 1))
+        print(f"  closest pair of different screenshots: {closest} bits apart")
+        edited_distances = [int(_POPCOUNT[np.bitwise_xor(fingerprint[0], stored[method][index][0])].sum())
+                            for index, name, fingerprint in edited[method] if name == "edited"]
+        print(f"  one-word edits of the same screenshot: {min(edited_distances)}-{max(edited_distances)} bits apart "
+              f"(median {sorted(edited_distances)[len(edited_distances) // 2]})")
+        print(f"  {'max distance':<14}{'recall':>9}{'false hits':>12}{'edited hits':>13}{'lookup p50 ms':>16}")
+        for threshold in THRESHOLDS:
+            cache = PerceptualHashCache(capacity=count, max_distance=threshold, method=method)
+            for index, fingerprint in enumerate(stored[method]):
+                cache.add(fingerprint, str(index))
+            correct = wrong = 0
+            for index, name, fingerprint in queries[method]:
+                found = cache.lookup(fingerprint)
+                if found == str(index):
+                    correct += 1
+                elif found is not None:
+                    wrong += 1
+            # Any hit for an edited screenshot returns the text of the unedited one
+            edited_hits = sum(1 for index, name, fingerprint in edited[method] if cache.lookup(fingerprint) is not None)
+            if threshold == probe.max_distance:
+                edited_false_hits += edited_hits
+            print(f"  {threshold:<14}{correct / len(queries[method]) * 100:>8.1f}%{wrong:>12}{edited_hits:>13}"
+                  f"{cache.stats()['lookup_ms']['p50']:>16.4f}")
+
+        cache = PerceptualHashCache(capacity=count, max_distance=THRESHOLDS[2], method=method)
+        for index, fingerprint in enumerate(stored[method]):
+            cache.add(fingerprint, str(index))
+        print(f"  recall by variant at max distance {THRESHOLDS[2]}:")
+        for variant_name in VARIANTS:
+            matched = sum(1 for index, name, fingerprint in queries[method]
+                          if name == variant_name and cache.lookup(fingerprint) == str(index))
+            print(f"    {variant_name:<22}{matched / count * 100:>6.1f}%")
+
+    full = PerceptualHashCache()
+    print(f"\nMemory for {full.capacity} cached hashes and thumbnails (excluding texts): {full.memory_bytes() / 1e6:.1f} MB")
+    print(f"Edited screenshots served cached text at the default max distance: {edited_false_hits}")
+    print("=" * 60)
+    if edited_false_hits:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark for the OpenCV preprocessing stage before OCR.
+
+Generates a fixture set of screenshots with known text (phone-sized, tall,
+slightly rotated, coloured background, dark mode, small text, JPEG
+re-encoded) and compares OCR time (median of several runs) and word accuracy
+with and without preprocessing. Exits with status 1 if preprocessing loses
+accuracy on any fixture.
+
+Requires Tesseract and opencv-python.
+
+Run from anywhere: python Testing/bench_preprocess.py [stages] [repeats]
+"""
+
+import io
+import os
+import re
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+from PIL import Image, ImageDraw, ImageFont
+
+import image_preprocess
+from ocr_engine import create_ocr_engine
+
+TEXT = [
+    "Government officials announced a new economic plan on Monday",
+    "The proposal includes tax changes for small businesses",
+    "Analysts expect the measure to pass before the end of the year",
+    "Opposition leaders said they would review the details carefully",
+    "Markets reacted calmly to the news during afternoon trading"
+]
+
+
+def render(size, background='white', font_size=48, rotate=0, jpeg=False, color='black'):
+    """Render the fixture text onto an image"""
+    image = Image.new('RGB', size, color=background)
+    draw = ImageDraw.Draw(image)
+    try:
+        font = ImageFont.load_default(size=font_size)
+    except TypeError:
+        font = ImageFont.load_default()
+    for row, line in enumerate(TEXT):
+        draw.text((40, 80 + row * font_size * 2), line, fill=color, font=font)
+    if rotate:
+        image = image.rotate(rotate, expand=False, fillcolor=background)
+    if jpeg:
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=70)
+        buffer.seek(0)
+        image = Image.open(buffer).convert('RGB')
+    return image
+
+
+FIXTURES = {
+    "phone screenshot 1080x2400": lambda: render((1080, 2400), font_size=40),
+    "desktop 2560x1440": lambda: render((2560, 1440), font_size=56),
+    "tall 1440x5000": lambda: render((1440, 5000), font_size=48),
+    "rotated 3 degrees": lambda: render((1600, 1000), font_size=40, rotate=3),
+    "grey background": lambda: render((1600, 1000), background=(200, 200, 190), font_size=40),
+    "dark mode": lambda: render((1080, 2400), background=(21, 32, 43), color=(231, 233, 234), font_size=40),
+    "small text 2560x1440": lambda: render((2560, 1440), font_size=28),
+    "JPEG q70": lambda: render((1600, 1000), font_size=40, jpeg=True)
+}
+
+
+def word_accuracy(extracted):
+    """Fraction of fixture words found in the OCR output"""
+    expected = re.findall(r"\w+", " ".join(TEXT).lower())
+    found = set(re.findall(r"\w+", extracted.lower()))
+    return sum(1 for word in expected if word in found) / len(expected)
+
+
+# Same default and environment variable as the server's OCR_PREPROCESS_TARGET_WIDTH
+TARGET_WIDTH = int(os.environ.get('OCR_PREPROCESS_TARGET_WIDTH', 1600))
+
+
+def timed_ocr(engine, image, stages, repeats):
+    """(text, median ms) of OCR, with the given preprocessing stages counted in the time"""
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        if stages:
+            image_to_read, _ = image_preprocess.preprocess_image(image, stages, target_width=TARGET_WIDTH)
+        else:
+            image_to_read = image
+        text = engine.image_to_string(image_to_read)
+        times.append((time.perf_counter() - started) * 1000.0)
+    return text, statistics.median(times)
+
+
+def main():
+    stages = image_preprocess.parse_stages(sys.argv[1] if len(sys.argv) > 1 else 'all')
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print("=" * 60)
+    print("OCR Preprocessing Benchmark")
+    print("=" * 60)
+    print(f"Stages: {', '.join(stages)} (downscale target {TARGET_WIDTH} px)")
+
+    engine = create_ocr_engine()
+    if engine is None:
+        print("✗ No OCR engine available")
+        sys.exit(1)
+
+    print(f"Times are the median of {repeats} runs, preprocessing included")
+    print(f"\n  {'fixture':<28}{'raw ms':>9}{'prep ms':>9}{'raw acc':>9}{'prep acc':>10}")
+    totals = [0.0, 0.0]
+    worse = []
+    for name, build in FIXTURES.items():
+        image = build()
+        raw_text, raw_ms = timed_ocr(engine, image, (), repeats)
+        prep_text, prep_ms = timed_ocr(engine, image, stages, repeats)
+        raw_accuracy, prep_accuracy = word_accuracy(raw_text), word_accuracy(prep_text)
+        if prep_accuracy < raw_accuracy:
+            worse.append(name)
+
+        totals[0] += raw_ms
+        totals[1] += prep_ms
+        print(f"  {name:<28}{raw_ms:>9.0f}{prep_ms:>9.0f}"
+              f"{raw_accuracy * 100:>8.0f}%{prep_accuracy * 100:>9.0f}%")
+
+    print(f"\nTotal OCR time: {totals[0]:.0f} ms raw, {totals[1]:.0f} ms with preprocessing "
+          f"({(1 - totals[1] / totals[0]) * 100:.0f}% less)")
+    print(f"Accuracy: {'lower on ' + ', '.join(worse) if worse else 'kept or improved on every fixture'}")
+    print("\nPer-stage time (ms):")
+    for stage, summary in image_preprocess.stats()["stage_ms"].items():
+        if summary["count"]:
+            print(f"  {stage:<12} mean {summary['mean']:.2f}  max {summary['max']:.2f}")
+    print("=" * 60)
+    if worse:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
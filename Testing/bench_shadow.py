@@ -0,0 +1,146 @@
+"""
+Shadow scoring benchmark: primary-path latency with and without a shadow candidate.
+
+Trains a candidate (TF-IDF with max_df=0.5 and a PassiveAggressiveClassifier
+with C=0.5) on news.csv, then serves /api/predict through the Flask test
+client from several threads in a fresh process per mode: shadow scoring off,
+on with the CPU budget, and on with an unlimited budget for comparison. The
+modes are alternated over several rounds, so drift on a busy machine affects
+all of them, and the median of each is compared. Reports the primary latency
+percentiles and throughput, the samples scored and dropped (over budget or
+queue full, and busy: no idle moment within SHADOW_MAX_DELAY_MS), the CPU
+the shadow thread used, and the disagreement rate and per-model latency it
+recorded.
+
+Run from anywhere: python Testing/bench_shadow.py [requests] [sample rate] [cpu budget] [rounds]
+"""
+
+import json
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+
+THREADS = 4
+
+# Runs in the child process
+CHILD = """
+import json, sys, threading, time
+import pandas as pd
+import app
+app.readiness.finished.wait()
+
+count = int(sys.argv[1])
+df = pd.read_csv("news.csv").dropna()
+articles = [{"title": title, "text": text} for title, text in zip(df['title'], df['text'])]
+client_latencies = [[] for _ in range(%d)]
+
+def client(slot):
+    c = app.app.test_client()
+    for idx in range(slot, count, len(client_latencies)):
+        started = time.perf_counter()
+        response = c.post('/api/predict', json=articles[idx %% len(articles)])
+        client_latencies[slot].append(time.perf_counter() - started)
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+started = time.perf_counter()
+threads = [threading.Thread(target=client, args=(slot,)) for slot in range(len(client_latencies))]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+elapsed = time.perf_counter() - started
+time.sleep(0.5)
+
+latencies = sorted(value for values in client_latencies for value in values)
+shadow = app.shadow_scorer.stats() if app.shadow_scorer is not None else None
+print("RESULT " + json.dumps({
+    "p50_ms": latencies[len(latencies) // 2] * 1000.0,
+    "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000.0,
+    "throughput": len(latencies) / elapsed,
+    "elapsed_s": elapsed,
+    "shadow": shadow
+}))
+""" % THREADS
+
+
+def train_candidate(directory):
+    """A retrained model that differs from the served one, saved as a pickle pair"""
+    import pandas as pd
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import PassiveAggressiveClassifier
+
+    df = pd.read_csv(os.path.join(BACKEND_DIR, "news.csv")).dropna()
+    vectorizer = TfidfVectorizer(stop_words='english', max_df=0.5)
+    model = PassiveAggressiveClassifier(max_iter=50, C=0.5, random_state=7)
+    model.fit(vectorizer.fit_transform(df['text']), df['label'])
+
+    paths = (os.path.join(directory, 'candidate_model.pkl'), os.path.join(directory, 'candidate_vectorizer.pkl'))
+    for path, obj in zip(paths, (model, vectorizer)):
+        with open(path, 'wb') as f:
+            pickle.dump(obj, f)
+    return paths
+
+
+def run_mode(count, env):
+    env = dict(os.environ, PREDICTION_CACHE_ENABLED='false', NEAR_DUPLICATE_ENABLED='false', **env)
+    output = subprocess.run([sys.executable, '-c', CHILD, str(count)], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(next(line for line in output.splitlines() if line.startswith("RESULT "))[7:])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    sample_rate = sys.argv[2] if len(sys.argv) > 2 else '1.0'
+    cpu_budget = sys.argv[3] if len(sys.argv) > 3 else '0.1'
+    rounds = int(sys.argv[4]) if len(sys.argv) > 4 else 3
+
+    print("=" * 60)
+    print("Shadow Scoring Benchmark")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as directory:
+        model_path, vectorizer_path = train_candidate(directory)
+        shadow = {'SHADOW_MODEL_PATH': model_path, 'SHADOW_VECTORIZER_PATH': vectorizer_path,
+                  'SHADOW_SAMPLE_RATE': sample_rate}
+        modes = [
+            ("off", {}),
+            (f"budget {float(cpu_budget):.0%}", dict(shadow, SHADOW_CPU_BUDGET=cpu_budget)),
+            ("unlimited", dict(shadow, SHADOW_CPU_BUDGET='100', SHADOW_QUEUE_SIZE='100000'))
+        ]
+        print(f"{count:,} /api/predict requests from {THREADS} threads, sample rate {sample_rate}, "
+              f"{rounds} rounds per mode (alternating)\n")
+        print(f"  {'shadow':<14}{'round':>6}{'p50 ms':>8}{'p99 ms':>8}{'req/s':>8}{'scored':>8}"
+              f"{'budget/full':>12}{'busy':>7}{'CPU':>7}")
+        results = {name: [] for name, _ in modes}
+        for round_number in range(1, rounds + 1):
+            for name, env in modes:
+                result = run_mode(count, env)
+                results[name].append(result)
+                stats = result["shadow"] or {}
+                print(f"  {name:<14}{round_number:>6}{result['p50_ms']:>8.2f}{result['p99_ms']:>8.2f}"
+                      f"{result['throughput']:>8.0f}{stats.get('scored', 0):>8}"
+                      f"{stats.get('dropped_over_budget', 0) + stats.get('dropped_queue_full', 0):>12}"
+                      f"{stats.get('dropped_busy', 0):>7}{stats.get('cpu_fraction') or 0:>7.1%}")
+
+    print("\nMedian over rounds:")
+    for name, _ in modes:
+        print(f"  {name:<14}p50 {statistics.median(r['p50_ms'] for r in results[name]):>6.2f} ms  "
+              f"p99 {statistics.median(r['p99_ms'] for r in results[name]):>6.2f} ms  "
+              f"{statistics.median(r['throughput'] for r in results[name]):>5.0f} req/s")
+
+    stats = results[modes[2][0]][-1]["shadow"]
+    print(f"\nDisagreement rate (unlimited run): {stats['disagreement_rate']}  {stats['disagreements_by_label']}")
+    for name in ("primary", "candidate"):
+        latency = stats["latency_ms"][name]
+        print(f"  {name:<10} shadow-measured latency: p50 <= {latency['p50']} ms, p99 <= {latency['p99']} ms, "
+              f"mean {latency['mean']} ms")
+    print("\nCPU = shadow thread CPU time / wall time (one core = 100%)")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Startup-time benchmark: cold import of the API to its first served prediction.
+
+Starts a fresh Python process per run (so nothing is cached in-process),
+imports Backend/app.py, waits for readiness, then serves one /api/predict
+request through the Flask test client. Reports interpreter start, import,
+time to ready and first-prediction times, the heavy modules loaded once the
+import returns, and RSS, for LAZY_STARTUP=true and false and for background
+loading with warm-up (BACKGROUND_LOADING=true: import returns before the
+model is loaded, and ready includes the warm-up pass). The last line is a
+JSON summary that can be kept per release to track startup time.
+
+Run from anywhere: python Testing/bench_startup.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+
+# pandas and sklearn.feature_extraction.text come with unpickling the model and vectorizer in every mode;
+# tesserocr (and PIL.Image with it) is imported with the server whenever it is installed
+HEAVY_MODULES = ('pandas', 'sklearn.feature_extraction.text', 'cv2', 'pytesseract', 'tesserocr', 'PIL.Image')
+
+# Runs in the child process; timings are taken from its own start
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+modules = [name for name in %r if name in sys.modules]
+app.readiness.finished.wait()
+ready = time.perf_counter()
+response = app.app.test_client().post('/api/predict', json={
+    "title": "Scientists Discover New Planet",
+    "text": "Astronomers have announced the discovery of a new planet using advanced telescope technology."
+})
+served = time.perf_counter()
+assert response.status_code == 200, response.get_data(as_text=True)
+rss = None
+try:
+    with open('/proc/self/statm') as f:
+        import os
+        rss = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+except OSError:
+    pass
+print("RESULT " + json.dumps({
+    "import_s": imported - started,
+    "ready_s": ready - started,
+    "first_prediction_s": served - ready,
+    "modules": modules,
+    "rss_mb": rss
+}))
+""" % (HEAVY_MODULES,)
+
+
+# Mode name -> environment
+MODES = {
+    "lazy": {'LAZY_STARTUP': 'true', 'BACKGROUND_LOADING': 'false'},
+    "eager": {'LAZY_STARTUP': 'false', 'BACKGROUND_LOADING': 'false'},
+    "background": {'LAZY_STARTUP': 'true', 'BACKGROUND_LOADING': 'true', 'WARMUP_ENABLED': 'true'}
+}
+
+
+def run_once(mode):
+    env = dict(os.environ, **MODES[mode])
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', CHILD], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    total = time.perf_counter() - started
+    result = json.loads(next(line for line in output.splitlines() if line.startswith("RESULT "))[7:])
+    result["total_s"] = total
+    return result
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print("=" * 60)
+    print("Startup Benchmark (cold import -> first prediction)")
+    print("=" * 60)
+    print(f"{runs} runs per mode, medians in ms\n")
+    print(f"  {'mode':<12}{'import':>9}{'ready':>9}{'first':>9}{'total':>9}{'RSS MB':>9}  heavy modules after import")
+
+    summary = {}
+    for mode in MODES:
+        results = [run_once(mode) for _ in range(runs)]
+        median = {key: statistics.median(r[key] for r in results) * 1000.0
+                  for key in ("import_s", "ready_s", "first_prediction_s", "total_s")}
+        rss = results[-1]["rss_mb"]
+        print(f"  {mode:<12}{median['import_s']:>9.0f}{median['ready_s']:>9.0f}{median['first_prediction_s']:>9.1f}"
+              f"{median['total_s']:>9.0f}{rss if rss is not None else float('nan'):>9.0f}  "
+              f"{', '.join(results[-1]['modules']) or '-'}")
+        summary[mode] = {key[:-2] + "_ms": round(value, 1) for key, value in median.items()}
+        summary[mode]["rss_mb"] = round(rss, 1) if rss is not None else None
+
+    print("\nready = import start to readiness (background: the server answers probes from 'import' on)")
+    print("total = process start to first response (includes interpreter start)")
+    print("=" * 60)
+    print(json.dumps({"startup": summary}))
+
+
+if __name__ == '__main__':
+    main()
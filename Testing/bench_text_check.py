@@ -0,0 +1,155 @@
+"""
+Benchmark for the text-presence check run before OCR.
+
+Generates a fixture set of images with text (screenshots, headlines, small
+and low-contrast text, coloured backgrounds, JPEG re-encoded, text over a
+photo) and without (photo-like scenes, gradients, noise, blank) and reports
+the false-rejection rate (text images the check would reject), how many
+text-free images it catches, the time per check and how much of each image
+the crop removes.
+
+Requires opencv-python. OCR is not needed.
+
+Run from anywhere: python Testing/bench_text_check.py [min_regions]
+"""
+
+import io
+import os
+import random
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+import text_detect
+
+TEXT = [
+    "Government officials announced a new economic plan on Monday",
+    "The proposal includes tax changes for small businesses",
+    "Analysts expect the measure to pass before the end of the year",
+    "Opposition leaders said they would review the details carefully",
+    "Markets reacted calmly to the news during afternoon trading"
+]
+
+
+def font(size):
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def jpeg(image, quality=60):
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality)
+    buffer.seek(0)
+    return Image.open(buffer).convert('RGB')
+
+
+def photo(size, seed):
+    """A photo-like scene: sky gradient, soft shapes, blur and sensor noise"""
+    rng = random.Random(seed)
+    width, height = size
+    image = Image.linear_gradient('L').resize(size).convert('RGB')
+    image = Image.blend(image, Image.new('RGB', size, (rng.randint(60, 200), rng.randint(80, 200), rng.randint(120, 255))), 0.6)
+    draw = ImageDraw.Draw(image)
+    for _ in range(rng.randint(5, 25)):
+        x, y = rng.randint(0, width), rng.randint(0, height)
+        r = rng.randint(width // 20, width // 4)
+        colour = tuple(rng.randint(0, 255) for _ in range(3))
+        if rng.random() < 0.5:
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=colour)
+        else:
+            draw.polygon([(x + rng.randint(-r, r), y + rng.randint(-r, r)) for _ in range(5)], fill=colour)
+    image = image.filter(ImageFilter.GaussianBlur(rng.uniform(0.5, 4)))
+    noise = Image.effect_noise(size, rng.uniform(5, 25)).convert('RGB')
+    return jpeg(Image.blend(image, noise, 0.15), quality=80)
+
+
+def foliage(size, seed):
+    """Dense high-frequency texture (grass, leaves, gravel)"""
+    rng = random.Random(seed)
+    image = Image.new('RGB', size, (40, 90, 30))
+    draw = ImageDraw.Draw(image)
+    for _ in range(size[0] * size[1] // 400):
+        x, y = rng.randint(0, size[0]), rng.randint(0, size[1])
+        shade = rng.randint(20, 160)
+        draw.line((x, y, x + rng.randint(-6, 6), y + rng.randint(4, 20)), fill=(shade // 2, shade, shade // 3), width=2)
+    return jpeg(image, quality=75)
+
+
+def text_image(size, lines, font_size, background='white', fill='black', top=80):
+    image = Image.new('RGB', size, color=background) if not isinstance(background, Image.Image) else background.copy()
+    draw = ImageDraw.Draw(image)
+    for row, line in enumerate(lines):
+        draw.text((40, top + row * font_size * 2), line, fill=fill, font=font(font_size))
+    return image
+
+
+TEXT_FIXTURES = {
+    "phone screenshot": lambda: text_image((1080, 2400), TEXT, 40),
+    "desktop screenshot": lambda: text_image((2560, 1440), TEXT, 56),
+    "tall thread": lambda: text_image((1080, 6000), TEXT * 8, 40),
+    "single headline": lambda: text_image((1200, 400), TEXT[:1], 48, top=170),
+    "two short lines": lambda: text_image((800, 600), ["Breaking news today", "Read more"], 40),
+    "small text": lambda: text_image((1600, 1000), TEXT, 16),
+    "low contrast": lambda: text_image((1600, 1000), TEXT, 40, background=(200, 200, 200), fill=(140, 140, 140)),
+    "dark mode": lambda: text_image((1080, 1920), TEXT, 40, background=(20, 20, 28), fill=(230, 230, 230)),
+    "coloured background": lambda: text_image((1600, 1000), TEXT, 40, background=(250, 220, 120)),
+    "JPEG q40": lambda: jpeg(text_image((1600, 1000), TEXT, 40), quality=40),
+    "text over photo": lambda: text_image((1600, 1000), TEXT, 44, background=photo((1600, 1000), 7), fill='white'),
+    "meme caption": lambda: text_image((1000, 1000), TEXT[:2], 44, background=photo((1000, 1000), 11), fill='white', top=60),
+}
+
+NO_TEXT_FIXTURES = {
+    "blank white": lambda: Image.new('RGB', (1080, 1920), 'white'),
+    "gradient": lambda: Image.linear_gradient('L').resize((1600, 1200)).convert('RGB'),
+    "noise": lambda: Image.effect_noise((1200, 900), 30).convert('RGB'),
+    "foliage": lambda: foliage((1600, 1200), 3),
+}
+for seed in range(12):
+    NO_TEXT_FIXTURES[f"photo {seed}"] = (lambda seed: lambda: photo((1600, 1200), seed))(seed)
+
+
+def main():
+    min_regions = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    print("=" * 60)
+    print("Text-Presence Check Benchmark")
+    print("=" * 60)
+    if not text_detect.CV2_AVAILABLE:
+        print("✗ opencv-python not available")
+        sys.exit(1)
+    print(f"min_regions={min_regions}")
+
+    for label, fixtures, expect_text in (("With text", TEXT_FIXTURES, True),
+                                         ("Without text", NO_TEXT_FIXTURES, False)):
+        print(f"\n{label}:")
+        print(f"  {'fixture':<22}{'verdict':>9}{'regions':>9}{'check ms':>10}{'cropped':>9}")
+        wrong = 0
+        for name, build in fixtures.items():
+            image = build()
+            has_text, box, timings = text_detect.check_text(image, min_regions=min_regions)
+            if has_text != expect_text:
+                wrong += 1
+            removed = 0.0
+            if box is not None:
+                removed = 1 - (box[2] - box[0]) * (box[3] - box[1]) / float(image.width * image.height)
+            verdict = "text" if has_text else "reject"
+            print(f"  {name:<22}{verdict:>9}{timings['regions']:>9}{timings['check_ms']:>10.1f}{removed * 100:>8.0f}%")
+        if expect_text:
+            print(f"  False rejections: {wrong}/{len(fixtures)} ({wrong / len(fixtures) * 100:.0f}%)")
+        else:
+            caught = len(fixtures) - wrong
+            print(f"  Rejected before OCR: {caught}/{len(fixtures)} ({caught / len(fixtures) * 100:.0f}%)")
+
+    summary = text_detect.stats()["check_ms"]
+    print(f"\nCheck time: mean {summary['mean']:.1f} ms, p95 {summary['p95']:.1f} ms")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark for the compact vocabulary against the vectorizer's dict.
+
+Builds a Kaggle-sized synthetic vocabulary (default 300,000 terms) whose
+words occur with Zipf-distributed frequencies, as in real text (IDF follows
+the same ranking), and compares the Python dict held by a fitted
+TfidfVectorizer with CompactVocabulary, with and without a dict of the most
+frequent terms in front, on:
+  - load time: unpickling the vectorizer
+  - memory: bytes allocated while unpickling (tracemalloc, separate run)
+  - lookup throughput: lookups/s with 20% unknown words, the way sklearn's
+    transform looks them up, and full transform() docs/s
+It also checks that transform() output is identical.
+
+Run from anywhere: python Testing/bench_vocabulary.py [terms]
+"""
+
+import os
+import pickle
+import random
+import sys
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
+
+from compact_vocabulary import compact_vectorizer
+
+SEED = 20
+LOOKUPS = 500000
+DOCS = 500
+DOC_WORDS = 400
+HOT_TERMS = 20000
+
+
+def random_terms(rng, count, exclude=()):
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    terms = set()
+    while len(terms) < count:
+        term = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 14)))
+        if term not in exclude:
+            terms.add(term)
+    return sorted(terms)
+
+
+def synthetic_vectorizer(terms):
+    vectorizer = TfidfVectorizer(stop_words='english', max_df=0.7)
+    vectorizer.vocabulary_ = {term: index for index, term in enumerate(terms)}
+    vectorizer.fixed_vocabulary_ = False
+    vectorizer._tfidf = TfidfTransformer()
+    # Zipf: the term of frequency rank r is in about 1/r of the documents
+    ranks = np.arange(1, len(terms) + 1)
+    vectorizer._tfidf.idf_ = 1.0 + np.log(ranks * 10.0)
+    return vectorizer
+
+
+def zipf_tokens(rng, terms, unknown, count):
+    """Tokens drawn with Zipf frequencies over the vocabulary, plus unknown words"""
+    weights = 1.0 / np.arange(1, len(terms) + 1)
+    known = rng.choices(terms, cum_weights=np.cumsum(weights).tolist(), k=count)
+    return [token if rng.random() < 0.8 else rng.choice(unknown) for token in known]
+
+
+def load(data):
+    """Unpickle a vectorizer; returns (vectorizer, ms, bytes allocated)"""
+    started = time.perf_counter()
+    vectorizer = pickle.loads(data)
+    elapsed = (time.perf_counter() - started) * 1000.0
+
+    tracemalloc.start()
+    again = pickle.loads(data)
+    allocated, _ = tracemalloc.get_traced_memory()
+    del again
+    tracemalloc.stop()
+    return vectorizer, elapsed, allocated
+
+
+def lookups_per_second(vocabulary, tokens):
+    """Lookups/s with sklearn's try/except pattern"""
+    started = time.perf_counter()
+    for token in tokens:
+        try:
+            vocabulary[token]
+        except KeyError:
+            continue
+    return len(tokens) / (time.perf_counter() - started)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    rng = random.Random(SEED)
+
+    print("=" * 60)
+    print("Vocabulary Structure Benchmark")
+    print("=" * 60)
+
+    terms = random_terms(rng, count)
+    unknown = random_terms(rng, 20000, exclude=set(terms))
+    rng.shuffle(terms)
+    tokens = zipf_tokens(rng, terms, unknown, LOOKUPS)
+    docs = [' '.join(tokens[i * DOC_WORDS:(i + 1) * DOC_WORDS]) for i in range(DOCS)]
+
+    dict_vectorizer = synthetic_vectorizer(terms)
+    compact = compact_vectorizer(pickle.loads(pickle.dumps(dict_vectorizer)))
+    compact_hot = compact_vectorizer(pickle.loads(pickle.dumps(dict_vectorizer)), hot_size=HOT_TERMS)
+
+    print(f"Terms: {count:,}, lookups: {LOOKUPS:,} (Zipf, 20% unknown), transform: {DOCS} docs x {DOC_WORDS} words")
+    print(f"\n  {'structure':<16}{'pickle MB':>11}{'load ms':>10}{'memory MB':>11}{'lookups/s':>12}{'docs/s':>9}")
+    outputs = {}
+    variants = (("dict", dict_vectorizer), ("compact", compact), (f"compact+{HOT_TERMS // 1000}k hot", compact_hot))
+    for name, vectorizer in variants:
+        data = pickle.dumps(vectorizer)
+        loaded, load_ms, allocated = load(data)
+        vocabulary = loaded.vocabulary_
+        rate = lookups_per_second(vocabulary, tokens)
+
+        started = time.perf_counter()
+        outputs[name] = loaded.transform(docs)
+        docs_rate = DOCS / (time.perf_counter() - started)
+        print(f"  {name:<16}{len(data) / 1e6:>11.1f}{load_ms:>10.1f}{allocated / 1e6:>11.1f}"
+              f"{rate:>12,.0f}{docs_rate:>9,.0f}")
+
+    difference = max(abs(outputs["dict"] - output).max() for output in outputs.values())
+    print(f"\n{'✓' if difference == 0 else '✗'} transform() output identical (max difference {difference})")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
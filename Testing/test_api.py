@@ -1,5 +1,7 @@
 import requests
 import json
+import os
+import time
 
 # API Base URL
 API_URL = "http://localhost:5000"
@@ -19,6 +21,67 @@ def test_health_check():
         print(f"❌ Error: {e}")
         return False
 
+def test_readiness():
+    """Test the liveness and readiness probes"""
+    print("\n" + "="*60)
+    print("🩺 Testing Liveness and Readiness Endpoints")
+    print("="*60)
+    
+    try:
+        response = requests.get(f"{API_URL}/api/health/live")
+        print(f"Liveness Status Code: {response.status_code}")
+        if response.status_code != 200:
+            return False
+        
+        # Readiness is 503 while the model loads and warms up; wait for it
+        for _ in range(60):
+            response = requests.get(f"{API_URL}/api/health/ready")
+            if response.json().get("state") != "starting":
+                break
+            time.sleep(1)
+        result = response.json()
+        print(f"Readiness Status Code: {response.status_code}")
+        print(f"State: {result['state']} after {result['startup_ms']} ms")
+        for name, component in result['components'].items():
+            print(f"  {name}: {component['status']} ({component['ms']} ms)")
+        return response.status_code == 200 and result['ready']
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_model_reload():
+    """Test the hot model reload endpoint (set ADMIN_TOKEN to the server's token)"""
+    print("\n" + "="*60)
+    print("🔄 Testing Hot Model Reload")
+    print("="*60)
+    
+    if not os.environ.get("ADMIN_TOKEN"):
+        # Without a token the endpoint must refuse the call, even from this host
+        response = requests.post(f"{API_URL}/api/admin/reload-model?force=true")
+        print(f"No ADMIN_TOKEN set; Status Code: {response.status_code} (403 expected)")
+        return response.status_code == 403
+    headers = {"X-Admin-Token": os.environ["ADMIN_TOKEN"]}
+    article = {
+        "title": "Scientists Discover New Planet",
+        "text": "Astronomers have announced the discovery of a new planet using advanced telescope technology."
+    }
+    try:
+        before = requests.post(f"{API_URL}/api/predict", json=article).json()
+        response = requests.post(f"{API_URL}/api/admin/reload-model?force=true", headers=headers)
+        result = response.json()
+        print(f"Status Code: {response.status_code}")
+        print(f"Response: {json.dumps(result, indent=2)}")
+        after = requests.post(f"{API_URL}/api/predict", json=article).json()
+        print(f"Served by: {before.get('model_version')} -> {after.get('model_version')}")
+        
+        # Same files, so the same version and verdict after the swap
+        return (response.status_code == 200 and result['reloaded']
+                and after['model_version'] == result['model_version'] == before['model_version']
+                and after['prediction'] == before['prediction'])
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
 def test_model_info():
     """Test the model info endpoint"""
     print("\n" + "="*60)
@@ -34,6 +97,42 @@ def test_model_info():
         print(f"❌ Error: {e}")
         return False
 
+def test_stats():
+    """Test the runtime statistics endpoint"""
+    print("\n" + "="*60)
+    print("⏱️ Testing Stats Endpoint")
+    print("="*60)
+    
+    try:
+        response = requests.get(f"{API_URL}/api/stats")
+        print(f"Status Code: {response.status_code}")
+        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        return response.status_code == 200
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_metrics():
+    """Test the Prometheus-style metrics endpoint"""
+    print("\n" + "="*60)
+    print("📈 Testing Metrics Endpoint")
+    print("="*60)
+    
+    try:
+        response = requests.get(f"{API_URL}/metrics")
+        print(f"Status Code: {response.status_code}")
+        print(f"Content-Type: {response.headers.get('Content-Type')}")
+        families = [line.split()[2] for line in response.text.splitlines() if line.startswith("# TYPE")]
+        print(f"Metric families: {', '.join(families)}")
+        
+        # Earlier tests made predictions, so requests and the per-stage histograms have samples
+        return (response.status_code == 200
+                and 'fakenews_http_requests_total{endpoint="/api/predict"' in response.text
+                and 'fakenews_stage_duration_seconds_bucket{stage="predict",le="+Inf"}' in response.text)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
 def test_single_prediction():
     """Test single article prediction"""
     print("\n" + "="*60)
@@ -97,6 +196,9 @@ def test_batch_prediction():
             {
                 "title": "Stock market update",
                 "text": "The S&P 500 closed higher today as investors reacted positively to economic data releases."
+            },
+            {
+                "title": "Malformed article without text"
             }
         ]
     }
@@ -116,6 +218,11 @@ def test_batch_prediction():
             print("\nResults:")
             for item in result['results']:
                 print(f"  Article {item['index'] + 1}: {item.get('prediction', 'ERROR')}")
+            
+            # The malformed article must fail on its own without failing the batch
+            if 'error' not in result['results'][-1]:
+                print("❌ Malformed article was not reported individually")
+                return False
         else:
             print(f"Response: {response.text}")
             
@@ -125,6 +232,44 @@ def test_batch_prediction():
         print(f"❌ Error: {e}")
         return False
 
+def test_stream_batch_prediction():
+    """Test streaming NDJSON batch prediction"""
+    print("\n" + "="*60)
+    print("🌊 Testing Streaming Batch Prediction")
+    print("="*60)
+    
+    def articles():
+        # Generate the body lazily, as a nightly re-scoring job would
+        for i in range(1000):
+            article = {"title": f"Article {i}", "text": "The S&P 500 closed higher today as investors reacted to data."}
+            yield (json.dumps(article) + "\n").encode("utf-8")
+        yield b"this line is not json\n"
+    
+    try:
+        response = requests.post(
+            f"{API_URL}/api/batch-predict-stream",
+            headers={"Content-Type": "application/x-ndjson"},
+            data=articles(),
+            stream=True
+        )
+        
+        print(f"Status Code: {response.status_code}")
+        if response.status_code != 200:
+            print(f"Response: {response.text}")
+            return False
+        
+        results = [json.loads(line) for line in response.iter_lines() if line]
+        summary = results.pop()
+        errors = [item for item in results if 'error' in item]
+        print(f"Total Articles: {summary['total']}")
+        print(f"Results: {len(results)}, errors: {len(errors)}")
+        
+        return summary['total'] == 1001 and len(results) == 1001 and len(errors) == 1
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
 def test_image_prediction():
     """Test image prediction endpoint"""
     print("\n" + "="*60)
@@ -184,6 +329,85 @@ def test_image_prediction():
         print(f"❌ Error: {e}")
         return True  # Don't fail tests if image processing isn't set up
 
+def test_async_image_prediction():
+    """Test asynchronous image prediction with a long-polled job"""
+    print("\n" + "="*60)
+    print("⏳ Testing Async Image Prediction")
+    print("="*60)
+    
+    try:
+        from PIL import Image, ImageDraw
+        import io
+        
+        img = Image.new('RGB', (400, 200), color='white')
+        draw = ImageDraw.Draw(img)
+        draw.text((50, 80), "Breaking News: Test Article", fill='black')
+        img_bytes = io.BytesIO()
+        img.save(img_bytes, format='PNG')
+        img_bytes.seek(0)
+        
+        response = requests.post(
+            f"{API_URL}/api/predict-image?async=true",
+            files={'image': ('test_image.png', img_bytes, 'image/png')}
+        )
+        print(f"Status Code: {response.status_code}")
+        if response.status_code != 202:
+            print(f"Response: {response.text}")
+            return False
+        
+        job_id = response.json()['job_id']
+        response = requests.get(f"{API_URL}/api/jobs/{job_id}", params={"wait": 10})
+        job = response.json()
+        print(f"Job Status: {job['status']}")
+        print(f"Timings (ms): {job.get('timings_ms')}")
+        return response.status_code == 200 and job['status'] in ('done', 'failed')
+        
+    except ImportError:
+        print("⚠️ PIL not available - skipping async image test")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+def test_batch_image_prediction():
+    """Test multi-image batch prediction with one invalid file"""
+    print("\n" + "="*60)
+    print("🗂️ Testing Batch Image Prediction")
+    print("="*60)
+    
+    try:
+        from PIL import Image, ImageDraw
+        import io
+        
+        files = []
+        for i in range(3):
+            img = Image.new('RGB', (400, 200), color='white')
+            draw = ImageDraw.Draw(img)
+            draw.text((50, 80), f"Breaking News: Test Article {i}", fill='black')
+            img_bytes = io.BytesIO()
+            img.save(img_bytes, format='PNG')
+            img_bytes.seek(0)
+            files.append(('images', (f'test_image_{i}.png', img_bytes, 'image/png')))
+        files.append(('images', ('notes.txt', io.BytesIO(b'not an image'), 'text/plain')))
+        
+        response = requests.post(f"{API_URL}/api/batch-predict-image", files=files)
+        print(f"Status Code: {response.status_code}")
+        if response.status_code != 200:
+            print(f"Response: {response.text}")
+            return False
+        
+        results = response.json()['results']
+        for result in results:
+            print(f"{result['filename']}: {result.get('prediction', result.get('error'))}")
+        return len(results) == 4 and 'error' in results[3]
+        
+    except ImportError:
+        print("⚠️ PIL not available - skipping batch image test")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
 def test_error_handling():
     """Test error handling"""
     print("\n" + "="*60)
@@ -235,11 +459,18 @@ def run_all_tests():
     
     tests = [
         ("Health Check", test_health_check),
+        ("Readiness", test_readiness),
         ("Model Info", test_model_info),
         ("Single Prediction", test_single_prediction),
         ("Batch Prediction", test_batch_prediction),
+        ("Streaming Batch Prediction", test_stream_batch_prediction),
         ("Image Prediction", test_image_prediction),
-        ("Error Handling", test_error_handling)
+        ("Async Image Prediction", test_async_image_prediction),
+        ("Batch Image Prediction", test_batch_image_prediction),
+        ("Error Handling", test_error_handling),
+        ("Model Reload", test_model_reload),
+        ("Stats", test_stats),
+        ("Metrics", test_metrics)
     ]
     
     results = {}
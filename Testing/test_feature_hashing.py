@@ -0,0 +1,112 @@
+"""
+Tests for the feature-hashing pipeline (FEATURE_PIPELINE=hashing).
+
+Fits the pipeline and a PassiveAggressiveClassifier on a small slice of
+news.csv the way regenerate_model.py does, saves both with its atomic
+save_pickle and checks that the loaded pair predicts exactly what the
+trained pair did, that the pickle does not need feature_hashing.py to load,
+and that the native engine declines the pipeline so the server falls back
+to sklearn scoring.
+
+Run from anywhere: python Testing/test_feature_hashing.py (or with pytest)
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+
+TESTING_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(TESTING_DIR, '..', 'Backend')
+ML_DIR = os.path.join(TESTING_DIR, '..', 'Machine learning')
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, ML_DIR)
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import PassiveAggressiveClassifier
+
+from feature_hashing import make_hashing_vectorizer, describe
+from linear_scorer import LinearScorer
+from model_registry import ModelBundle
+from regenerate_model import save_pickle
+
+# The sample news.csv has 20 articles; the last few are held out
+HELD_OUT = 5
+
+
+def small_corpus():
+    df = pd.read_csv(os.path.join(ML_DIR, "news.csv")).dropna()
+    train, test = df.iloc[:-HELD_OUT], df.iloc[-HELD_OUT:]
+    return list(train['text']), list(train['label']), list(test['text'])
+
+
+def train(use_idf=True, n_features=2 ** 16):
+    texts, labels, _ = small_corpus()
+    vectorizer = make_hashing_vectorizer(n_features=n_features, use_idf=use_idf)
+    model = PassiveAggressiveClassifier(max_iter=50, random_state=0)
+    model.fit(vectorizer.fit_transform(texts), labels)
+    return model, vectorizer
+
+
+def save_and_load(model, vectorizer):
+    """Round-trip through regenerate_model.save_pickle, as the server would load the files"""
+    with tempfile.TemporaryDirectory() as directory:
+        loaded = []
+        for name, obj in (('hashing_model.pkl', model), ('hashing_vectorizer.pkl', vectorizer)):
+            path = os.path.join(directory, name)
+            save_pickle(obj, path)
+            assert not os.path.exists(path + '.tmp')
+            with open(path, 'rb') as f:
+                loaded.append(pickle.load(f))
+        return loaded
+
+
+def test_predictions_round_trip():
+    _, _, test_texts = small_corpus()
+    for use_idf in (True, False):
+        model, vectorizer = train(use_idf=use_idf)
+        expected = model.predict(vectorizer.transform(test_texts))
+        loaded_model, loaded_vectorizer = save_and_load(model, vectorizer)
+        assert list(loaded_model.predict(loaded_vectorizer.transform(test_texts))) == list(expected)
+        assert np.array_equal(loaded_model.decision_function(loaded_vectorizer.transform(test_texts)),
+                              model.decision_function(vectorizer.transform(test_texts)))
+
+
+def test_fixed_width_without_vocabulary():
+    """The output width is n_features whatever the input, and there is no vocabulary to ship"""
+    _, vectorizer = train(n_features=2 ** 12)
+    assert vectorizer.transform(["brand new words never seen in training"]).shape == (1, 2 ** 12)
+    assert not hasattr(vectorizer, 'vocabulary_')
+    assert describe(vectorizer) == "HashingVectorizer + TfidfTransformer"
+
+
+def test_pickle_does_not_reference_module():
+    """The pipeline only references sklearn classes, so loading it does not need feature_hashing.py"""
+    _, vectorizer = train()
+    assert b'feature_hashing' not in pickle.dumps(vectorizer)
+
+
+def test_native_engine_falls_back():
+    """LinearScorer declines the pipeline; a bundle without a scorer scores with sklearn"""
+    model, vectorizer = train()
+    _, _, test_texts = small_corpus()
+    try:
+        LinearScorer.from_artifacts(model, vectorizer)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("LinearScorer accepted the hashing pipeline")
+
+    bundle = ModelBundle(model, vectorizer, version="test")
+    assert bundle.engine == "sklearn"
+    assert list(bundle.predict(test_texts)) == list(model.predict(vectorizer.transform(test_texts)))
+
+
+if __name__ == '__main__':
+    tests = [test_predictions_round_trip, test_fixed_width_without_vocabulary,
+             test_pickle_does_not_reference_module, test_native_engine_falls_back]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\nAll {len(tests)} tests passed")
@@ -0,0 +1,78 @@
+"""
+Tests for the native linear scoring engine (Backend/linear_scorer.py).
+
+Loads the shipped finalized_model.pkl and tfidf_vectorizer.pkl and checks
+that LinearScorer reproduces sklearn's decision_function and predict on the
+news.csv articles, on articles recombined from their words, and on texts
+with no known vocabulary.
+
+Run from anywhere: python Testing/test_linear_scorer.py (or with pytest)
+"""
+
+import os
+import pickle
+import random
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+
+import numpy as np
+import pandas as pd
+
+from linear_scorer import LinearScorer
+
+SYNTHETIC_DOCS = 200
+SEED = 20
+
+
+def load_artifacts():
+    artifacts = []
+    for name in ('finalized_model.pkl', 'tfidf_vectorizer.pkl'):
+        with open(os.path.join(BACKEND_DIR, name), 'rb') as f:
+            artifacts.append(pickle.load(f))
+    return artifacts
+
+
+def validation_texts():
+    """news.csv articles, synthetic articles built from their words, and edge cases"""
+    df = pd.read_csv(os.path.join(BACKEND_DIR, "news.csv")).dropna()
+    texts = [f"{title} {text}" for title, text in zip(df['title'], df['text'])]
+
+    rng = random.Random(SEED)
+    words = " ".join(texts).split()
+    for _ in range(SYNTHETIC_DOCS):
+        texts.append(" ".join(rng.choice(words) for _ in range(rng.randint(5, 400))))
+    texts.extend(["", "zzzz qqqq xyzzy", "THE the The"])
+    return texts
+
+
+def test_decision_function_matches_sklearn():
+    model, vectorizer = load_artifacts()
+    scorer = LinearScorer.from_artifacts(model, vectorizer)
+    texts = validation_texts()
+
+    expected = model.decision_function(vectorizer.transform(texts))
+    actual = np.array(scorer.decision_function(texts))
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected, rtol=0, atol=1e-12)
+    # Texts with no known words score exactly the intercept
+    assert scorer.decision_score("zzzz qqqq xyzzy") == float(model.intercept_[0])
+
+
+def test_predict_matches_sklearn():
+    model, vectorizer = load_artifacts()
+    scorer = LinearScorer.from_artifacts(model, vectorizer)
+    texts = validation_texts()
+
+    expected = list(model.predict(vectorizer.transform(texts)))
+    assert scorer.predict(texts) == expected
+    assert set(expected) <= set(model.classes_)
+
+
+if __name__ == '__main__':
+    tests = [test_decision_function_matches_sklearn, test_predict_matches_sklearn]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\nAll {len(tests)} tests passed")
@@ -0,0 +1,135 @@
+"""
+Tests for the versioned model registry (Backend/model_registry.py).
+
+Swaps bundles in a loop while reader threads acquire, score and release
+them, and checks that every request sees one complete bundle: never None
+after the first load, never a model from one version with the vectorizer of
+another, and never a bundle released while it is still in use. Replaced
+bundles must all be released once their last request finishes.
+
+Run from anywhere: python Testing/test_model_registry.py (or with pytest)
+"""
+
+import os
+import sys
+import threading
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from model_registry import ModelBundle, ModelRegistry
+
+READERS = 6
+SWAPS = 300
+
+
+class FakeVectorizer:
+    def __init__(self, version):
+        self.version = version
+
+    def transform(self, texts):
+        return [(self.version, text) for text in texts]
+
+
+class FakeModel:
+    """Labels each row with the version of the vectorizer that produced it; fails on a mismatch"""
+
+    def __init__(self, version):
+        self.version = version
+
+    def predict(self, features):
+        for version, _ in features:
+            if version != self.version:
+                raise AssertionError(f"model {self.version} got features from vectorizer {version}")
+        return [self.version] * len(features)
+
+
+def make_bundle(version):
+    return ModelBundle(FakeModel(version), FakeVectorizer(version), version)
+
+
+def test_swap_is_atomic_under_concurrent_requests():
+    registry = ModelRegistry()
+    registry.swap(make_bundle("v0"))
+    bundles = []
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        try:
+            while not done.is_set():
+                current = registry.current
+                assert current is not None
+                with registry.use() as bundle:
+                    assert bundle is not None
+                    version = bundle.version
+                    for _ in range(3):
+                        # A bundle in use keeps its artifacts even if it was swapped out meanwhile
+                        assert bundle.score(["a", "b"]) == [version, version]
+                        assert bundle.model is not None and bundle.vectorizer is not None
+        except Exception as e:
+            errors.append(e)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    threads = [threading.Thread(target=reader) for _ in range(READERS)]
+    try:
+        for thread in threads:
+            thread.start()
+        for number in range(1, SWAPS + 1):
+            bundle = make_bundle(f"v{number}")
+            bundles.append(registry.swap(bundle))
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(switch_interval)
+
+    assert not errors, errors[0]
+    assert registry.current.version == f"v{SWAPS}"
+    assert registry.idle.is_set()
+
+    # Every replaced bundle was released exactly once, by swap() or by its last request
+    stats = registry.stats()
+    assert stats["draining"] == []
+    assert stats["swaps"] == SWAPS + 1
+    assert stats["released"] == SWAPS
+    assert all(bundle.model is None and bundle.in_flight == 0 for bundle in bundles)
+    assert registry.current.model is not None
+
+
+def test_replaced_bundle_drains_before_release():
+    registry = ModelRegistry()
+    registry.swap(make_bundle("v1"))
+    held = registry.acquire()
+    assert not registry.idle.is_set()
+
+    previous = registry.swap(make_bundle("v2"))
+    assert previous is held
+    # Still in use: kept alive and listed as draining, while new requests get v2
+    assert held.model is not None
+    assert [bundle["version"] for bundle in registry.stats()["draining"]] == ["v1"]
+    with registry.use() as bundle:
+        assert bundle.version == "v2"
+
+    registry.release(held)
+    assert held.model is None
+    assert registry.stats()["draining"] == []
+    assert registry.idle.is_set()
+
+
+def test_acquire_before_first_load():
+    registry = ModelRegistry()
+    assert registry.current is None
+    with registry.use() as bundle:
+        assert bundle is None
+    assert registry.idle.is_set()
+
+
+if __name__ == '__main__':
+    tests = [test_swap_is_atomic_under_concurrent_requests, test_replaced_bundle_drains_before_release,
+             test_acquire_before_first_load]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\nAll {len(tests)} tests passed")
@@ -0,0 +1,118 @@
+"""
+Tests for stitching tiled OCR output (Backend/ocr_tiling.py).
+
+Simulates strip OCR on known lines, without Tesseract: each strip "reads"
+the lines it covers, lines cut by a strip edge come out garbled, and the
+stitched text must hold every line exactly once. Thread screenshots repeat
+short lines ("Reply", "Like"), which must not be mistaken for the overlap.
+
+Run from anywhere: python Testing/test_ocr_tiling.py (or with pytest)
+"""
+
+import os
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from concurrent.futures import ThreadPoolExecutor
+
+import ocr_tiling
+
+LINE_HEIGHT = 10
+
+
+def numbered_lines(count):
+    return [f"Post {number}: officials announced a new plan" for number in range(count)]
+
+
+def thread_lines(posts):
+    """A comment thread: every post is followed by the same short action lines"""
+    lines = []
+    for number in range(posts):
+        lines += [f"user{number} wrote", f"post {number} body text", "Like", "Reply"]
+    return lines
+
+
+class FakeImage:
+    """Stands in for a PIL image of text lines LINE_HEIGHT pixels apart"""
+
+    def __init__(self, lines, cut_lines="garble"):
+        self.lines = lines
+        self.width = 100
+        self.height = len(lines) * LINE_HEIGHT
+        self.cut_lines = cut_lines
+
+    def crop(self, box):
+        return (self, box)
+
+
+def fake_recognize(crop):
+    """The lines inside a strip; lines cut by its top or bottom edge are garbled or dropped"""
+    image, (_, top, _, bottom) = crop
+    read = []
+    for row, line in enumerate(image.lines):
+        line_top, line_bottom = row * LINE_HEIGHT, (row + 1) * LINE_HEIGHT
+        if line_top >= top and line_bottom <= bottom:
+            read.append(line)
+        elif line_top < bottom and line_bottom > top and image.cut_lines == "garble":
+            read.append(line[::3])
+    return "\n".join(read)
+
+
+def ocr_fake(lines, strip_lines, overlap_lines, offset=0, cut_lines="garble"):
+    """Tiled OCR of the fake image, with strip edges offset pixels off the line grid"""
+    image = FakeImage(lines, cut_lines)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        text, timings = ocr_tiling.ocr_tiled(image, fake_recognize, executor,
+                                             strip_height=strip_lines * LINE_HEIGHT + offset,
+                                             overlap=overlap_lines * LINE_HEIGHT + offset)
+    assert timings["strips"] > 1
+    return text.splitlines()
+
+
+def test_strip_boxes_cover_image():
+    boxes = ocr_tiling.strip_boxes(height=4000, width=1080, strip_height=1600, overlap=200)
+    assert boxes[0][1] == 0 and boxes[-1][3] == 4000
+    for previous, box in zip(boxes, boxes[1:]):
+        assert box[1] == previous[3] - 200
+    assert ocr_tiling.strip_boxes(height=500, width=10, strip_height=1600, overlap=200) == [(0, 0, 10, 500)]
+
+
+def test_distinct_lines_kept_once():
+    lines = numbered_lines(60)
+    for strip_lines, overlap_lines in ((12, 2), (12, 3), (20, 4)):
+        for offset in (0, 4):
+            assert ocr_fake(lines, strip_lines, overlap_lines, offset) == lines
+
+
+def test_repeated_lines_are_not_the_overlap():
+    """'Like' and 'Reply' repeat in every strip; only the run at the seam is read twice"""
+    lines = thread_lines(12)
+    for strip_lines in range(9, 16):
+        for overlap_lines in (1, 2, 3):
+            for offset in (0, 4):
+                for cut_lines in ("garble", "drop"):
+                    assert ocr_fake(lines, strip_lines, overlap_lines, offset, cut_lines) == lines, \
+                        (strip_lines, overlap_lines, offset, cut_lines)
+
+
+def test_repeated_line_as_whole_overlap():
+    """Strips sharing only a repeated line keep everything between its earlier copies and the seam"""
+    posts = ["post one body", "Reply", "post two body", "Reply", "post three body", "Reply",
+             "post four body", "Reply", "post five body", "Reply"]
+    stitched = ocr_tiling.stitch_texts(["\n".join(posts[:8]), "\n".join(posts[7:])])
+    assert stitched.splitlines() == posts
+
+
+def test_no_overlap_appends():
+    assert ocr_tiling.stitch_texts(["first line\nsecond line", "third line"]) == "first line\nsecond line\nthird line"
+
+
+if __name__ == '__main__':
+    tests = [test_strip_boxes_cover_image, test_distinct_lines_kept_once, test_repeated_lines_are_not_the_overlap,
+             test_repeated_line_as_whole_overlap, test_no_overlap_appends]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\nAll {len(tests)} tests passed")
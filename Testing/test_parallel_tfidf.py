@@ -0,0 +1,99 @@
+"""
+Equality tests for the parallel map-reduce TF-IDF fit.
+
+A vectorizer fitted by parallel_tfidf.parallel_fit must have the same
+vocabulary (including dict order), the same idf_ and the same transform
+output as TfidfVectorizer.fit on one core, for any number of workers.
+
+Run from anywhere: python Testing/test_parallel_tfidf.py (or with pytest)
+"""
+
+import os
+import random
+import sys
+
+ML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Machine learning')
+sys.path.insert(0, ML_DIR)
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from parallel_tfidf import parallel_fit, parallel_fit_transform
+
+SEED = 20
+
+
+def news_documents():
+    df = pd.read_csv(os.path.join(ML_DIR, "news.csv")).dropna()
+    return list(df['text'])
+
+
+def synthetic_documents(count=3000):
+    """Articles recombined from news.csv words, plus casing, punctuation and empty documents"""
+    rng = random.Random(SEED)
+    words = " ".join(news_documents()).split()
+    documents = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 200))) for _ in range(count)]
+    documents[::97] = ["THE Government, the government... GOVERNMENT!"] * len(documents[::97])
+    documents[::101] = [""] * len(documents[::101])
+    return documents
+
+
+def assert_same_fit(params, documents, jobs=(1, 2, 3)):
+    reference = TfidfVectorizer(**params)
+    reference.fit(documents)
+    expected = reference.transform(documents)
+
+    for n_jobs in jobs:
+        vectorizer = parallel_fit(TfidfVectorizer(**params), documents, n_jobs)
+        assert vectorizer.vocabulary_ == reference.vocabulary_, f"vocabulary differs with {n_jobs} jobs"
+        assert list(vectorizer.vocabulary_) == list(reference.vocabulary_), f"vocabulary order differs with {n_jobs} jobs"
+        if reference.use_idf:
+            assert vectorizer.idf_.dtype == reference.idf_.dtype
+            assert np.array_equal(vectorizer.idf_, reference.idf_), f"idf_ differs with {n_jobs} jobs"
+        assert (vectorizer.transform(documents) != expected).nnz == 0, f"transform differs with {n_jobs} jobs"
+
+
+def test_news_dataset():
+    """The parameters regenerate_model.py trains with"""
+    assert_same_fit({'stop_words': 'english', 'max_df': 0.7}, news_documents())
+
+
+def test_synthetic_corpus():
+    assert_same_fit({'stop_words': 'english', 'max_df': 0.7}, synthetic_documents(), jobs=(1, 2, 4, 7))
+
+
+def test_document_count_limits():
+    """Integer max_df / min_df, bigrams and no stop words"""
+    assert_same_fit({'max_df': 500, 'min_df': 3, 'ngram_range': (1, 2)}, synthetic_documents(1000))
+
+
+def test_without_idf_float32():
+    assert_same_fit({'use_idf': False, 'dtype': np.float32, 'sublinear_tf': True}, synthetic_documents(500))
+    assert_same_fit({'dtype': np.float32, 'smooth_idf': False}, synthetic_documents(500))
+
+
+def test_fit_transform_matrix():
+    """The training matrix matches transform() exactly and fit_transform() to rounding in the row norms"""
+    documents = synthetic_documents()
+    params = {'stop_words': 'english', 'max_df': 0.7}
+    reference = TfidfVectorizer(**params)
+    expected = reference.fit_transform(documents)
+    for n_jobs in (1, 3):
+        _, matrix = parallel_fit_transform(TfidfVectorizer(**params), documents, n_jobs)
+        assert matrix.shape == expected.shape
+        assert (matrix != reference.transform(documents)).nnz == 0
+        assert abs(matrix - expected).max() < 1e-12
+
+    params['binary'] = True
+    _, matrix = parallel_fit_transform(TfidfVectorizer(**params), documents, 2)
+    assert (matrix != TfidfVectorizer(**params).fit(documents).transform(documents)).nnz == 0
+
+
+if __name__ == '__main__':
+    tests = [test_news_dataset, test_synthetic_corpus, test_document_count_limits,
+             test_without_idf_float32, test_fit_transform_matrix]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\nAll {len(tests)} tests passed")
@@ -0,0 +1,128 @@
+"""
+Tests for the in-process prediction cache (Backend/prediction_cache.py).
+
+Checks least-recently-used eviction, TTL expiry against a controlled clock,
+that a verdict computed by a bundle that has since been swapped out is not
+stored under the new model version, and that a version change empties the
+cache.
+
+Run from anywhere: python Testing/test_prediction_cache.py (or with pytest)
+"""
+
+import os
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Backend')
+sys.path.insert(0, BACKEND_DIR)
+
+import prediction_cache
+from prediction_cache import PredictionCache, cache_key
+
+
+class Clock:
+    """Stands in for time.monotonic so expiry does not depend on sleeping"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def with_clock(fn):
+    """Run fn(clock) with prediction_cache reading time from a Clock"""
+    clock = Clock()
+    monotonic = prediction_cache.time.monotonic
+    prediction_cache.time.monotonic = clock
+    try:
+        return fn(clock)
+    finally:
+        prediction_cache.time.monotonic = monotonic
+
+
+def test_least_recently_used_is_evicted():
+    cache = PredictionCache(max_size=3, ttl_seconds=0, model_version="v1")
+    for key in ("a", "b", "c"):
+        cache.put(key, key.upper(), "v1")
+
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") == "A"
+    cache.put("d", "D", "v1")
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["A", "C", "D"]
+
+    # Re-storing an existing key also refreshes it
+    cache.put("a", "A2", "v1")
+    cache.put("e", "E", "v1")
+    assert cache.get("c") is None
+    assert cache.get("a") == "A2"
+
+    stats = cache.stats()
+    assert stats["size"] == 3
+    assert stats["evictions"] == 2
+
+
+def test_entries_expire_after_ttl():
+    def run(clock):
+        cache = PredictionCache(max_size=10, ttl_seconds=60, model_version="v1")
+        cache.put("old", "FAKE", "v1")
+        clock.now += 30
+        cache.put("new", "REAL", "v1")
+
+        clock.now += 29.9
+        assert cache.get("old") == "FAKE"
+        # A hit does not extend the entry's lifetime
+        clock.now += 0.1
+        assert cache.get("old") is None
+        assert cache.get("new") == "REAL"
+
+        clock.now += 30
+        assert cache.get("new") is None
+        stats = cache.stats()
+        assert stats["expirations"] == 2
+        assert stats["size"] == 0
+
+    with_clock(run)
+
+
+def test_zero_ttl_never_expires():
+    def run(clock):
+        cache = PredictionCache(max_size=10, ttl_seconds=0, model_version="v1")
+        cache.put("key", "REAL", "v1")
+        clock.now += 10 ** 9
+        assert cache.get("key") == "REAL"
+
+    with_clock(run)
+
+
+def test_put_drops_verdict_from_other_version():
+    """A request that started on v1 and finishes after the swap to v2 must not store its verdict"""
+    cache = PredictionCache(max_size=10, ttl_seconds=0, model_version="v1")
+    text = "Officials announced a new plan"
+    cache.put(cache_key(text, "v1"), "FAKE", "v1")
+
+    cache.ensure_version("v2")
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["invalidations"] == 1
+
+    cache.put(cache_key(text, "v1"), "FAKE", "v1")
+    cache.put(cache_key(text, "v2"), "FAKE", "v1")
+    assert cache.stats()["size"] == 0
+    assert cache.get(cache_key(text, "v2")) is None
+
+    cache.put(cache_key(text, "v2"), "REAL", "v2")
+    assert cache.get(cache_key(text, "v2")) == "REAL"
+
+
+def test_key_depends_on_version_not_formatting():
+    assert cache_key("Breaking  NEWS\n today", "v1") == cache_key("breaking news today", "v1")
+    assert cache_key("breaking news today", "v1") != cache_key("breaking news today", "v2")
+
+
+if __name__ == '__main__':
+    tests = [test_least_recently_used_is_evicted, test_entries_expire_after_ttl, test_zero_ttl_never_expires,
+             test_put_drops_verdict_from_other_version, test_key_depends_on_version_not_formatting]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\nAll {len(tests)} tests passed")
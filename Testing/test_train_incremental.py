@@ -0,0 +1,129 @@
+"""
+Tests for the out-of-core trainer (Machine learning/train_incremental.py).
+
+Streams the sample news.csv in small chunks, checks the chunked IDF pass
+against TfidfTransformer, and interrupts a partial_fit run part-way to check
+that resuming from its checkpoint gives the same model as one uninterrupted
+run.
+
+Run from anywhere: python Testing/test_train_incremental.py (or with pytest)
+"""
+
+import os
+import sys
+import tempfile
+
+ML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Machine learning')
+sys.path.insert(0, ML_DIR)
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfTransformer
+from sklearn.linear_model import PassiveAggressiveClassifier
+
+import train_incremental as trainer
+from feature_hashing import make_hashing_vectorizer
+
+CSV = os.path.join(ML_DIR, "news.csv")
+# 20 articles in chunks of 3: 7 chunks per epoch
+CHUNK_SIZE = 3
+N_FEATURES = 2 ** 14
+
+
+class Interrupted(Exception):
+    pass
+
+
+def fitted_vectorizer():
+    vectorizer = make_hashing_vectorizer(N_FEATURES)
+    idf, _ = trainer.fit_idf(CSV, CHUNK_SIZE, vectorizer)
+    return trainer.prepare_vectorizer(vectorizer, idf)
+
+
+def fresh_state():
+    return {'chunk_size': CHUNK_SIZE, 'epoch': 0, 'chunks_done': 0}
+
+
+def run_in(directory, fn):
+    """Run fn with directory as the working directory, where the checkpoint is written"""
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        return fn()
+    finally:
+        os.chdir(cwd)
+
+
+def test_idf_matches_tfidf_transformer():
+    """The chunked document-frequency count gives TfidfTransformer's IDF on the training rows"""
+    vectorizer = make_hashing_vectorizer(N_FEATURES)
+    idf, n_documents = trainer.fit_idf(CSV, CHUNK_SIZE, vectorizer)
+
+    texts = []
+    for _, chunk_texts, _, index in trainer.read_chunks(CSV, CHUNK_SIZE):
+        texts.extend(chunk_texts[~trainer.split_rows(index)])
+    expected = TfidfTransformer().fit(vectorizer.named_steps['hash'].transform(texts))
+    assert n_documents == len(texts)
+    assert np.allclose(idf, expected.idf_)
+
+
+def test_resume_matches_single_run():
+    epochs = 2
+    vectorizer = fitted_vectorizer()
+
+    single = PassiveAggressiveClassifier(random_state=0)
+    with tempfile.TemporaryDirectory() as directory:
+        run_in(directory, lambda: trainer.train(CSV, CHUNK_SIZE, epochs, vectorizer, single, fresh_state()))
+
+    # Stop in the middle of the second epoch, after a checkpoint has been written
+    read_chunks = trainer.read_chunks
+    chunks_before_stop = 7 + 4
+    yielded = 0
+
+    def interrupted_chunks(path, chunk_size):
+        nonlocal yielded
+        for chunk in read_chunks(path, chunk_size):
+            if yielded == chunks_before_stop:
+                raise Interrupted()
+            yielded += 1
+            yield chunk
+
+    def interrupted_then_resumed():
+        model = PassiveAggressiveClassifier(random_state=0)
+        trainer.read_chunks = interrupted_chunks
+        try:
+            trainer.train(CSV, CHUNK_SIZE, epochs, vectorizer, model, fresh_state())
+        except Interrupted:
+            pass
+        else:
+            raise AssertionError("training was not interrupted")
+        finally:
+            trainer.read_chunks = read_chunks
+        assert not os.path.exists(trainer.CHECKPOINT_FILE + '.tmp')
+
+        model, loaded_vectorizer, state = trainer.load_checkpoint()
+        assert state == {'chunk_size': CHUNK_SIZE, 'epoch': 1, 'chunks_done': 4}
+        trained, _ = trainer.train(CSV, CHUNK_SIZE, epochs, loaded_vectorizer, model, state)
+        return model, trained
+
+    checkpoint_every = trainer.CHECKPOINT_EVERY
+    trainer.CHECKPOINT_EVERY = 1
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            resumed, trained = run_in(directory, interrupted_then_resumed)
+    finally:
+        trainer.CHECKPOINT_EVERY = checkpoint_every
+
+    # Only the last 3 chunks of the second epoch are trained again
+    assert trained > 0
+    assert np.array_equal(resumed.coef_, single.coef_)
+    assert np.array_equal(resumed.intercept_, single.intercept_)
+    assert np.array_equal(trainer.evaluate(CSV, CHUNK_SIZE, vectorizer, resumed)[1],
+                          trainer.evaluate(CSV, CHUNK_SIZE, vectorizer, single)[1])
+
+
+if __name__ == '__main__':
+    tests = [test_idf_matches_tfidf_transformer, test_resume_matches_single_run]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print(f"\nAll {len(tests)} tests passed")